@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CPU do loop principal com e sem o agendador ocioso
+
+Executa o loop real do GameManager (executar_quadro) sem janela, por alguns
+segundos em cada tela, primeiro sempre a 60 FPS e depois com espera por
+eventos quando nada anima, e reporta o tempo de CPU médio por segundo de
+relógio. Sem eventos de entrada, as telas estáticas ficam ociosas assim que
+as animações terminam; o menu anima sempre e serve de controle.
+
+Uso:
+    python benchmarks/bench_agendador.py
+    python benchmarks/bench_agendador.py --segundos 5 --telas ranking jogo
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.game.manager import GameManager  # noqa: E402
+
+TELAS = ['menu', 'selecao_nivel', 'jogo', 'ranking']
+
+
+def medir(jogo: GameManager, tela: str, esperar_ocioso: bool, segundos: float) -> dict:
+    """Roda o loop na tela por `segundos` e retorna CPU por segundo e quadros por segundo"""
+    jogo.esperar_ocioso = esperar_ocioso
+    jogo.gerenciador_estados.mudar_estado(tela)
+    jogo.relogio.reiniciar()
+
+    quadros = 0
+    inicio = time.perf_counter()
+    inicio_cpu = time.process_time()
+    while time.perf_counter() - inicio < segundos:
+        jogo.executar_quadro()
+        quadros += 1
+    tempo = time.perf_counter() - inicio
+
+    return {
+        'cpu_ms_por_segundo': (time.process_time() - inicio_cpu) / tempo * 1000,
+        'quadros_por_segundo': quadros / tempo,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--telas', nargs='+', choices=TELAS, default=TELAS)
+    parser.add_argument('--segundos', type=float, default=3.0)
+    args = parser.parse_args()
+
+    jogo = GameManager()
+    print(f"{'tela':<15}{'modo':<10}{'quadros/s':>11}{'CPU (ms/s)':>12}")
+    for tela in args.telas:
+        for modo, esperar_ocioso in (('60 FPS', False), ('ocioso', True)):
+            resultado = medir(jogo, tela, esperar_ocioso, args.segundos)
+            print(f"{tela:<15}{modo:<10}{resultado['quadros_por_segundo']:>11.1f}"
+                  f"{resultado['cpu_ms_por_segundo']:>12.1f}")
+
+    print("\nAgendador (todas as telas):")
+    for modo, dados in jogo.obter_estatisticas_agendador().items():
+        print(f"  {modo:<8}{dados['quadros']:>7} quadros  {dados['cpu_ms_por_segundo']:>7.1f} ms de CPU/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark: BlocoNumero desenhado com pygame.draw vs. sprites em cache
+
+Mede quantos blocos por milissegundo cada versão desenha, com os blocos em
+repouso (parte deles selecionada ou destacada) e durante a animação de
+entrada, em que a escala muda a cada quadro. A versão antiga desenha
+sombra, corpo e borda com pygame.draw.rect a cada quadro; a nova copia um
+sprite pré-desenhado por (cor, seleção, escala quantizada, número).
+
+Com --verificar, cada bloco é desenhado pelas duas versões em repouso em
+todas as escalas quantizadas e as imagens são comparadas pixel a pixel; o
+script termina com código 1 se alguma divergir.
+
+Uso:
+    python benchmarks/bench_bloco_numero.py
+    python benchmarks/bench_bloco_numero.py --blocos 64 --quadros 300 --verificar
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ui.componentes import BlocoNumero  # noqa: E402
+from src.ui.sprites import cache_sprites  # noqa: E402
+from src.ui.tweens import agendador_tweens  # noqa: E402
+from src.utils.config import CORES, VISUAL, LARGURA, ALTURA  # noqa: E402
+
+DT = 1 / 60
+
+
+def renderizar_legado(bloco: BlocoNumero, tela: pygame.Surface) -> None:
+    """BlocoNumero.renderizar anterior: três pygame.draw.rect e Rects novos por quadro"""
+    if not bloco.visivel or bloco.escala <= 0:
+        return
+
+    centro = bloco.rect.center
+    largura_escalada = int(bloco.rect.width * bloco.escala)
+    altura_escalada = int(bloco.rect.height * bloco.escala)
+    rect_escalado = pygame.Rect(0, 0, largura_escalada, altura_escalada)
+    rect_escalado.center = centro
+
+    sombra_rect = rect_escalado.copy()
+    sombra_rect.x += VISUAL['SOMBRA_OFFSET']
+    sombra_rect.y += VISUAL['SOMBRA_OFFSET']
+    pygame.draw.rect(tela, (0, 0, 0, 100), sombra_rect, border_radius=VISUAL['RAIO_BORDA'])
+
+    pygame.draw.rect(tela, bloco.cor_atual, rect_escalado, border_radius=VISUAL['RAIO_BORDA'])
+
+    if bloco.selecionado:
+        pygame.draw.rect(tela, CORES['TEXTO'], rect_escalado, 3, border_radius=VISUAL['RAIO_BORDA'])
+
+    rect_texto = bloco.superficie_texto.get_rect(center=centro)
+    tela.blit(bloco.superficie_texto, rect_texto)
+
+
+def criar_blocos(quantidade: int, semente: int) -> list:
+    """Grade de blocos com números e cores como os do jogo"""
+    rng = random.Random(semente)
+    colunas = max(1, (LARGURA - 20) // (VISUAL['BLOCO_LARGURA'] + VISUAL['ESPACO_BLOCO']))
+    blocos = []
+    for indice in range(quantidade):
+        x = 10 + (indice % colunas) * (VISUAL['BLOCO_LARGURA'] + VISUAL['ESPACO_BLOCO'])
+        y = 10 + (indice // colunas) % 6 * (VISUAL['BLOCO_ALTURA'] + VISUAL['ESPACO_BLOCO'])
+        cor = rng.choice([CORES['PRINCIPAL'], CORES['SUCESSO'], CORES['SECUNDARIA']])
+        bloco = BlocoNumero(x, y, rng.randint(1, 99), cor)
+        if indice % 7 == 0:
+            bloco.selecionar()
+        elif indice % 5 == 0:
+            bloco.destacar()
+        blocos.append(bloco)
+    return blocos
+
+
+def cronometrar(blocos: list, tela: pygame.Surface, quadros: int, desenhar, animar: bool) -> float:
+    """Retorna blocos desenhados por milissegundo (só o custo de desenhar é medido)"""
+    tempo = 0.0
+    for quadro in range(quadros):
+        if animar and quadro % 60 == 0:
+            for bloco in blocos:
+                bloco.animar_entrada()
+        agendador_tweens.avancar(DT)
+        for bloco in blocos:
+            bloco.atualizar(DT)
+
+        tela.fill(CORES['FUNDO'])
+        inicio = time.perf_counter()
+        for bloco in blocos:
+            desenhar(bloco, tela)
+        tempo += time.perf_counter() - inicio
+    return len(blocos) * quadros / (tempo * 1000)
+
+
+def verificar(blocos: list, tela: pygame.Surface) -> int:
+    """Compara as duas versões em todas as escalas quantizadas; retorna as divergências"""
+    passos = VISUAL['PASSOS_ESCALA_BLOCO']
+    divergencias = 0
+    for bloco in blocos:
+        for passo in range(1, round(1.1 * passos) + 1):
+            # Escala em repouso: sprite exato (os quadros de crescimento são redimensionados)
+            bloco.escala = bloco.escala_alvo = passo / passos
+            imagens = []
+            for desenhar in (renderizar_legado, BlocoNumero.renderizar):
+                tela.fill(CORES['FUNDO'])
+                desenhar(bloco, tela)
+                imagens.append(pygame.image.tobytes(tela.subsurface(bloco.area_ocupada()), 'RGB'))
+            divergencias += imagens[0] != imagens[1]
+    return divergencias
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--blocos', type=int, default=32)
+    parser.add_argument('--quadros', type=int, default=240)
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--verificar', action='store_true',
+                        help='compara as duas versões pixel a pixel')
+    args = parser.parse_args()
+
+    pygame.init()
+    tela = pygame.display.set_mode((LARGURA, ALTURA))
+
+    print(f"{'cenário':<11}{'antigo (blocos/ms)':>20}{'sprites (blocos/ms)':>21}{'speedup':>9}")
+    for nome, animar in (('repouso', False), ('animando', True)):
+        medidas = []
+        for desenhar in (renderizar_legado, BlocoNumero.renderizar):
+            blocos = criar_blocos(args.blocos, args.semente)
+            medidas.append(cronometrar(blocos, tela, args.quadros, desenhar, animar))
+        print(f"{nome:<11}{medidas[0]:>20.1f}{medidas[1]:>21.1f}{medidas[1] / medidas[0]:>8.1f}x")
+
+    estatisticas = cache_sprites.obter_estatisticas()
+    print(f"\nCache: {estatisticas['entradas']} sprites, {estatisticas['bytes_em_uso'] / 1024:.0f} KiB, "
+          f"{estatisticas['taxa_acerto']}% de acertos")
+
+    if args.verificar:
+        divergencias = verificar(criar_blocos(args.blocos, args.semente), tela)
+        if divergencias:
+            print(f"{divergencias} combinações de bloco e escala diferentes do desenho antigo")
+            sys.exit(1)
+        print("Sprites idênticos ao desenho antigo em todas as escalas")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Demonstração: busca binária em um arquivo ordenado mapeado em memória
+
+Grava n inteiros int64 ordenados em um arquivo temporário, executa buscas com o
+BinarySearchEducativo sobre o arquivo mapeado e mostra quantas páginas cada
+consulta tocou em comparação com log2(n).
+
+Uso:
+    python benchmarks/bench_busca_mapeada.py --tamanho 50000000
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithms.binary_search import BinarySearchEducativo  # noqa: E402
+from src.algorithms.fonte_mapeada import (  # noqa: E402
+    ArquivoOrdenadoMapeado, criar_arquivo_ordenado
+)
+
+
+def buscar(fonte: ArquivoOrdenadoMapeado, valor: int) -> dict:
+    """Executa uma busca completa tomando sempre a decisão correta"""
+    motor = BinarySearchEducativo(fonte, valor)
+    motor.proximo_passo()
+    while motor.proximo_passo():
+        motor.fazer_decisao_direcao(valor < fonte[motor.meio])
+    return motor.obter_estatisticas()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tamanho', type=int, default=10 ** 7)
+    parser.add_argument('--consultas', type=int, default=100)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semente)
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, 'ordenados.bin')
+
+        # Gerar em blocos crescentes para não precisar do array inteiro na RAM
+        def gerar():
+            base = 0
+            restante = args.tamanho
+            while restante > 0:
+                bloco = min(restante, 1 << 20)
+                passos = rng.integers(1, 8, size=bloco, dtype=np.int64)
+                valores = base + np.cumsum(passos)
+                base = int(valores[-1])
+                restante -= bloco
+                yield from valores.tolist()
+
+        inicio = time.perf_counter()
+        criar_arquivo_ordenado(caminho, gerar())
+        print(f"Arquivo com {args.tamanho:,} registros gravado em "
+              f"{time.perf_counter() - inicio:.1f}s "
+              f"({os.path.getsize(caminho) / 2 ** 20:.0f} MiB)")
+
+        fonte = ArquivoOrdenadoMapeado(caminho)
+        maximo = fonte[len(fonte) - 1]
+        chaves = rng.integers(0, maximo + 1, size=args.consultas).tolist()
+
+        paginas = []
+        leituras = []
+        falhas = []
+        inicio = time.perf_counter()
+        for chave in chaves:
+            acesso = buscar(fonte, chave)['acesso_memoria']
+            paginas.append(acesso['paginas_tocadas'])
+            leituras.append(acesso['leituras'])
+            if acesso['falhas_pagina'] is not None:
+                falhas.append(acesso['falhas_pagina'])
+        tempo = time.perf_counter() - inicio
+
+        print(f"log2(n)                 : {math.log2(args.tamanho):.1f}")
+        print(f"leituras por consulta   : {np.mean(leituras):.1f}")
+        print(f"páginas por consulta    : {np.mean(paginas):.1f} "
+              f"({np.mean(paginas) * fonte.tamanho_pagina / 1024:.0f} KiB)")
+        if falhas:
+            print(f"falhas de página/consulta: {np.mean(falhas):.1f}")
+        print(f"páginas tocadas no total: {len(fonte.paginas_totais):,} de "
+              f"{math.ceil(len(fonte) * 8 / fonte.tamanho_pagina):,}")
+        print(f"tempo por consulta      : {tempo / len(chaves) * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
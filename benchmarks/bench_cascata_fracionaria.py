@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cascata fracionária vs. k chamadas independentes de bisect
+
+Para k listas ordenadas de n elementos, mede o tempo por consulta e o número
+de comparações de cada abordagem: O(k + log n) contra O(k log n).
+
+Uso:
+    python benchmarks/bench_cascata_fracionaria.py --listas 10 100 1000 --tamanho 10000
+"""
+
+import argparse
+import math
+import sys
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithms.cascata_fracionaria import CascataFracionaria  # noqa: E402
+from src.utils.distribuicoes import gerar  # noqa: E402
+
+
+def executar(k: int, tamanho: int, consultas: int, semente: int) -> tuple:
+    """Executa o benchmark para k listas de `tamanho` elementos"""
+    rng = np.random.default_rng(semente)
+    listas = [np.sort(gerar('aleatorio', tamanho, rng, maximo=10 * tamanho)).tolist()
+              for _ in range(k)]
+    chaves = rng.integers(0, 10 * tamanho, size=consultas).tolist()
+
+    inicio = time.perf_counter()
+    cascata = CascataFracionaria(listas)
+    tempo_construcao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for chave in chaves:
+        [bisect_left(lista, chave) for lista in listas]
+    tempo_bisect = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for chave in chaves:
+        cascata.buscar(chave)
+    tempo_cascata = time.perf_counter() - inicio
+
+    # Conferir resultados em uma amostra
+    for chave in chaves[:50]:
+        assert cascata.buscar(chave) == [bisect_left(lista, chave) for lista in listas]
+
+    estatisticas = cascata.obter_estatisticas()
+    return (k, tamanho, tempo_construcao,
+            tempo_bisect / consultas * 1e6, tempo_cascata / consultas * 1e6,
+            k * math.ceil(math.log2(tamanho + 1)),
+            estatisticas['comparacoes_por_consulta'],
+            estatisticas['fator_memoria'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--listas', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--tamanho', type=int, default=10000)
+    parser.add_argument('--consultas', type=int, default=2000)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'k':>6}{'n':>9}{'construção(s)':>15}{'bisect µs':>12}{'cascata µs':>12}"
+          f"{'comp. bisect':>14}{'comp. cascata':>15}{'memória':>9}")
+    for k in args.listas:
+        linha = executar(k, args.tamanho, args.consultas, args.semente)
+        print(f"{linha[0]:>6}{linha[1]:>9}{linha[2]:>15.3f}{linha[3]:>12.1f}{linha[4]:>12.1f}"
+              f"{linha[5]:>14}{linha[6]:>15.1f}{linha[7]:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
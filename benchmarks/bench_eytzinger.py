@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: busca binária no layout padrão vs. layout de Eytzinger
+
+Compara, para arrays grandes:
+- consultas individuais: BinarySearchEducativo (layout ordenado) vs. BuscaEytzinger
+- consultas em lote: numpy.searchsorted (layout ordenado) vs. BuscaEytzinger
+
+Uso:
+    python benchmarks/bench_eytzinger.py --tamanhos 1000000 10000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithms.binary_search import BinarySearchEducativo, FaseBinarySearch  # noqa: E402
+from src.algorithms.eytzinger import BuscaEytzinger  # noqa: E402
+from src.utils.distribuicoes import gerar  # noqa: E402
+
+
+def buscar_com_motor_padrao(motor: BinarySearchEducativo, valor: int) -> int:
+    """Executa uma busca completa no BinarySearchEducativo tomando sempre a decisão correta"""
+    motor.valor_busca = valor
+    motor.posicao_encontrada = -1
+    motor.fase_atual = FaseBinarySearch.INICIALIZACAO
+
+    motor.proximo_passo()
+    while motor.proximo_passo():
+        motor.fazer_decisao_direcao(valor < motor.lista_original[motor.meio])
+    return motor.posicao_encontrada
+
+
+def cronometrar(funcao, *args) -> float:
+    """Retorna o tempo de execução de funcao(*args) em segundos"""
+    inicio = time.perf_counter()
+    funcao(*args)
+    return time.perf_counter() - inicio
+
+
+def executar(tamanho: int, consultas_individuais: int, consultas_lote: int,
+             semente: int) -> None:
+    """Executa o benchmark para um tamanho de array"""
+    rng = np.random.default_rng(semente)
+    valores = np.sort(gerar('aleatorio', tamanho, rng))
+    chaves = rng.integers(0, 4 * tamanho, size=consultas_lote, dtype=np.int64)
+    chaves_individuais = chaves[:consultas_individuais].tolist()
+
+    inicio = time.perf_counter()
+    eytzinger = BuscaEytzinger(valores, alinhar_cache=True)
+    tempo_construcao = time.perf_counter() - inicio
+
+    motor_padrao = BinarySearchEducativo(valores.tolist(), 0)
+
+    def individuais_padrao():
+        for chave in chaves_individuais:
+            buscar_com_motor_padrao(motor_padrao, chave)
+
+    def individuais_eytzinger():
+        for chave in chaves_individuais:
+            eytzinger.buscar(chave)
+
+    tempo_ind_padrao = cronometrar(individuais_padrao)
+    tempo_ind_eytzinger = cronometrar(individuais_eytzinger)
+    tempo_lote_padrao = cronometrar(np.searchsorted, valores, chaves)
+    tempo_lote_eytzinger = cronometrar(eytzinger.limite_inferior_lote, chaves)
+
+    # Conferir que os dois layouts concordam
+    assert np.array_equal(np.searchsorted(valores, chaves),
+                          eytzinger.limite_inferior_lote(chaves))
+
+    print(f"\nn = {tamanho:,} (construção do layout: {tempo_construcao:.3f}s)")
+    print(f"{'modo':<12}{'layout':<26}{'consultas':>12}{'µs/consulta':>14}")
+    linhas = [
+        ("individual", "BinarySearchEducativo", consultas_individuais, tempo_ind_padrao),
+        ("individual", "Eytzinger", consultas_individuais, tempo_ind_eytzinger),
+        ("lote", "ordenado (searchsorted)", consultas_lote, tempo_lote_padrao),
+        ("lote", "Eytzinger", consultas_lote, tempo_lote_eytzinger),
+    ]
+    for modo, layout, quantidade, tempo in linhas:
+        print(f"{modo:<12}{layout:<26}{quantidade:>12,}{tempo / quantidade * 1e6:>14.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tamanhos', type=int, nargs='+',
+                        default=[10 ** 6, 10 ** 7])
+    parser.add_argument('--consultas-individuais', type=int, default=2000)
+    parser.add_argument('--consultas-lote', type=int, default=10 ** 6)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    for tamanho in args.tamanhos:
+        executar(tamanho, args.consultas_individuais, args.consultas_lote, args.semente)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: contagem de inversões por merge sort vs. laço duplo O(n²)
+
+A contagem ingênua só é executada até --max-ingenuo elementos; acima disso o
+tempo é extrapolado a partir da maior medição (crescimento quadrático).
+
+Uso:
+    python benchmarks/bench_inversoes.py --tamanhos 1000 10000 100000 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithms.merge_sort import contar_inversoes  # noqa: E402
+from src.utils.distribuicoes import gerar  # noqa: E402
+
+
+def contar_inversoes_ingenuo(valores) -> int:
+    """Conta inversões comparando todos os pares"""
+    total = 0
+    n = len(valores)
+    for i in range(n):
+        atual = valores[i]
+        for j in range(i + 1, n):
+            if atual > valores[j]:
+                total += 1
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tamanhos', type=int, nargs='+',
+                        default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
+    parser.add_argument('--max-ingenuo', type=int, default=5000)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semente)
+    referencia = None  # (n, tempo) da maior execução ingênua
+
+    print(f"{'n':>10}{'inversões':>16}{'merge (s)':>12}{'ingênuo (s)':>14}{'aceleração':>12}")
+    for n in args.tamanhos:
+        valores = gerar('aleatorio', n, rng, maximo=n)
+
+        inicio = time.perf_counter()
+        inversoes = contar_inversoes(valores)
+        tempo_merge = time.perf_counter() - inicio
+
+        if n <= args.max_ingenuo:
+            lista = valores.tolist()
+            inicio = time.perf_counter()
+            assert contar_inversoes_ingenuo(lista) == inversoes
+            tempo_ingenuo = time.perf_counter() - inicio
+            referencia = (n, tempo_ingenuo)
+            texto_ingenuo = f"{tempo_ingenuo:.3f}"
+        elif referencia is not None:
+            tempo_ingenuo = referencia[1] * (n / referencia[0]) ** 2
+            texto_ingenuo = f"~{tempo_ingenuo:.0f}"
+        else:
+            tempo_ingenuo = None
+            texto_ingenuo = "-"
+
+        aceleracao = f"{tempo_ingenuo / tempo_merge:.0f}x" if tempo_ingenuo else "-"
+        print(f"{n:>10}{inversoes:>16}{tempo_merge:>12.3f}{texto_ingenuo:>14}{aceleracao:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: limiar da multiplicação escolar no Karatsuba e operações de dígito vs. O(n²)
+
+Para cada tamanho, varia o limiar abaixo do qual o motor usa a multiplicação
+escolar e mede tempo e operações de dígito. Um limiar igual ao número de
+dígitos equivale à multiplicação escolar pura (linha "escolar"). O ponto de
+cruzamento é o limiar de menor tempo. O produto é conferido com o int do Python.
+
+Uso:
+    python benchmarks/bench_karatsuba.py --digitos 1000 4000 16000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithms.karatsuba import KaratsubaEducativo  # noqa: E402
+
+
+def inteiro_aleatorio(rng: np.random.Generator, digitos: int) -> int:
+    """Inteiro com exatamente `digitos` dígitos decimais"""
+    algarismos = rng.integers(0, 10, size=digitos)
+    algarismos[0] = rng.integers(1, 10)
+    valor = 0
+    for inicio in range(0, digitos, 1000):
+        bloco = algarismos[inicio:inicio + 1000]
+        valor = valor * 10 ** len(bloco) + int(''.join(map(str, bloco)))
+    return valor
+
+
+def multiplicar(a: int, b: int, limiar: int, base: int):
+    """Executa o motor até o fim e retorna (tempo, estatísticas)"""
+    motor = KaratsubaEducativo(a, b, limiar=limiar, base=base)
+    inicio = time.perf_counter()
+    while motor.proximo_passo():
+        pass
+    tempo = time.perf_counter() - inicio
+    assert motor.obter_resultado_final() == a * b
+    return tempo, motor.obter_estatisticas()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--digitos', type=int, nargs='+', default=[1000, 4000, 16000])
+    parser.add_argument('--limiares', type=int, nargs='+',
+                        default=[8, 32, 128, 512, 2048])
+    parser.add_argument('--base', type=int, default=10)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semente)
+
+    for digitos in args.digitos:
+        a = inteiro_aleatorio(rng, digitos)
+        b = inteiro_aleatorio(rng, digitos)
+
+        print(f"\n{digitos} dígitos decimais (base {args.base})")
+        print(f"{'limiar':>8}{'tempo (s)':>11}{'mult. dígito':>16}{'adições':>16}"
+              f"{'economia':>10}{'profundidade':>14}")
+
+        melhor = None
+        for limiar in [l for l in args.limiares if l < digitos] + [digitos]:
+            tempo, estatisticas = multiplicar(a, b, limiar, args.base)
+            rotulo = "escolar" if limiar >= digitos else str(limiar)
+            print(f"{rotulo:>8}{tempo:>11.3f}{estatisticas['multiplicacoes_digito']:>16,}"
+                  f"{estatisticas['adicoes_digito']:>16,}{estatisticas['economia_multiplicacoes']:>9.1f}%"
+                  f"{estatisticas['profundidade_maxima']:>14}")
+            if melhor is None or tempo < melhor[1]:
+                melhor = (rotulo, tempo)
+
+        print(f"cruzamento: limiar {melhor[0]} ({melhor[1]:.3f}s); "
+              f"O(n²) faria {estatisticas['multiplicacoes_escolar']:,} multiplicações")
+
+
+if __name__ == "__main__":
+    main()
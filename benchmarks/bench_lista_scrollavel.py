@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ListaScrollavel antiga vs. virtualizada
+
+Rola uma lista de linhas de texto do topo ao fim e de volta, sem janela, e
+mede o custo por quadro (atualizar + renderizar) para vários tamanhos de
+lista. A implementação antiga percorre todos os elementos a cada quadro e
+aloca uma Surface de recorte mais uma Surface temporária por linha visível;
+a virtualizada encontra as linhas visíveis por busca binária e reaproveita
+as superfícies das linhas, então o custo não deve crescer com o tamanho.
+
+Com --verificar, cada quadro da lista virtualizada é comparado pixel a pixel
+com o desenho direto de cada linha na posição rolada (recortado pela área
+da lista); o script termina com código 1 se algum quadro divergir.
+
+Uso:
+    python benchmarks/bench_lista_scrollavel.py
+    python benchmarks/bench_lista_scrollavel.py --tamanhos 10 100000 --verificar
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ui.componentes import ListaScrollavel, Texto  # noqa: E402
+from src.utils.config import CORES, LARGURA, ALTURA  # noqa: E402
+
+DT = 1 / 60
+ALTURA_LINHA = 40
+AREA_LISTA = pygame.Rect(100, 100, 600, 300)
+
+
+class ListaLegado:
+    """Implementação anterior: varredura linear e Surfaces temporárias por quadro"""
+
+    def __init__(self):
+        self.rect = AREA_LISTA.copy()
+        self.elementos = []
+        self.scroll_y = 0
+        self.altura_conteudo = 0
+
+    def adicionar_elemento(self, elemento) -> None:
+        # A original recalculava o máximo sobre todos os elementos (quadrático ao preencher)
+        self.elementos.append(elemento)
+        self.altura_conteudo = max(self.altura_conteudo, elemento.rect.bottom - self.rect.y)
+
+    def rolar(self, deslocamento: int) -> None:
+        max_scroll = max(0, self.altura_conteudo - self.rect.height)
+        self.scroll_y = max(0, min(self.scroll_y + deslocamento, max_scroll))
+
+    def _elemento_visivel(self, elemento) -> bool:
+        y_elemento = elemento.rect.y - self.scroll_y
+        return (y_elemento + elemento.rect.height >= self.rect.y and
+                y_elemento <= self.rect.bottom)
+
+    def atualizar(self, dt: float) -> None:
+        for elemento in self.elementos:
+            if self._elemento_visivel(elemento):
+                elemento.atualizar(dt)
+
+    def renderizar(self, tela: pygame.Surface) -> None:
+        clip_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        for elemento in self.elementos:
+            if self._elemento_visivel(elemento):
+                x_rel = elemento.rect.x - self.rect.x
+                y_rel = elemento.rect.y - self.rect.y - self.scroll_y
+                elemento_surface = pygame.Surface((elemento.rect.width, elemento.rect.height), pygame.SRCALPHA)
+                elemento.renderizar(elemento_surface)
+                clip_surface.blit(elemento_surface, (x_rel, y_rel))
+        tela.blit(clip_surface, self.rect.topleft)
+
+
+def preencher(lista, quantidade: int) -> None:
+    """Empilha `quantidade` linhas de texto (poucos textos distintos, para o cache de texto)"""
+    for indice in range(quantidade):
+        lista.adicionar_elemento(Texto(AREA_LISTA.x + 10, AREA_LISTA.y + indice * ALTURA_LINHA,
+                                       f"{indice % 100 + 1}. Jogador {indice % 37}"))
+
+
+def referencia(lista: ListaScrollavel, tela: pygame.Surface) -> bytes:
+    """Desenha as linhas diretamente na posição rolada e retorna os pixels"""
+    tela.fill(CORES['FUNDO'])
+    tela.set_clip(lista.rect)
+    for elemento in lista.elementos_visiveis():
+        elemento.rect.move_ip(0, -lista.scroll_y)
+        elemento.renderizar(tela)
+        elemento.rect.move_ip(0, lista.scroll_y)
+    tela.set_clip(None)
+    if lista.altura_conteudo > lista.rect.height:
+        lista._renderizar_scrollbar(tela)
+    return pygame.image.tobytes(tela, 'RGB')
+
+
+def cronometrar(lista, tela: pygame.Surface, quadros: int, velocidade: int,
+                verificar: bool = False) -> tuple:
+    """Retorna (ms por quadro, quadros divergentes), rolando ida e volta"""
+    passos_ida = max(1, quadros // 2)
+    divergencias = 0
+    tempo = 0.0
+    for quadro in range(quadros):
+        lista.rolar(velocidade if quadro < passos_ida else -velocidade)
+
+        inicio = time.perf_counter()
+        tela.fill(CORES['FUNDO'])
+        lista.atualizar(DT)
+        lista.renderizar(tela)
+        tempo += time.perf_counter() - inicio
+
+        if verificar and pygame.image.tobytes(tela, 'RGB') != referencia(lista, tela.copy()):
+            divergencias += 1
+    return tempo / quadros * 1000, divergencias
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=[10, 1000, 10000, 100000])
+    parser.add_argument('--quadros', type=int, default=120)
+    parser.add_argument('--velocidade', type=int, default=7, help='pixels rolados por quadro')
+    parser.add_argument('--verificar', action='store_true',
+                        help='compara cada quadro com o desenho direto das linhas')
+    args = parser.parse_args()
+
+    pygame.init()
+    tela = pygame.display.set_mode((LARGURA, ALTURA))
+
+    print(f"{'linhas':>9}{'antiga (ms)':>13}{'virtual (ms)':>14}{'speedup':>9}"
+          f"{'redesenhos':>12}{'superfícies':>13}")
+    divergentes = []
+    for quantidade in args.tamanhos:
+        legado = ListaLegado()
+        preencher(legado, quantidade)
+        tempo_legado, _ = cronometrar(legado, tela, args.quadros, args.velocidade)
+
+        lista = ListaScrollavel(*AREA_LISTA)
+        preencher(lista, quantidade)
+        tempo_virtual, divergencias = cronometrar(lista, tela, args.quadros, args.velocidade,
+                                                  args.verificar)
+        if divergencias:
+            divergentes.append(f"{quantidade} linhas ({divergencias} quadros)")
+
+        estatisticas = lista.obter_estatisticas()
+        print(f"{quantidade:>9,}{tempo_legado:>13.3f}{tempo_virtual:>14.3f}"
+              f"{tempo_legado / tempo_virtual:>8.1f}x{estatisticas['linhas_desenhadas']:>12}"
+              f"{estatisticas['superficies_criadas']:>13}")
+
+    if args.verificar:
+        if divergentes:
+            print(f"\nQuadros diferentes do desenho direto: {', '.join(divergentes)}")
+            sys.exit(1)
+        print("\nTodos os quadros idênticos ao desenho direto das linhas")
+
+
+if __name__ == '__main__':
+    main()
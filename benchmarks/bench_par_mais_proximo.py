@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: par mais próximo por dividir e conquistar vs. força bruta O(n²)
+
+A força bruta (vetorizada por linhas com NumPy) só é executada até
+--max-forca-bruta pontos; acima disso o tempo é extrapolado a partir da maior
+medição. O número de distâncias calculadas é sempre exato: n(n-1)/2.
+
+Uso:
+    python benchmarks/bench_par_mais_proximo.py --tamanhos 10000 100000 1000000
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithms.par_mais_proximo import ParMaisProximoEducativo  # noqa: E402
+
+
+def par_mais_proximo_forca_bruta(pontos: np.ndarray) -> float:
+    """Menor distância comparando cada ponto com todos os seguintes"""
+    melhor = np.inf
+    for i in range(len(pontos) - 1):
+        diferencas = pontos[i + 1:] - pontos[i]
+        melhor = min(melhor, float(np.min(np.einsum('ij,ij->i', diferencas, diferencas))))
+    return math.sqrt(melhor)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tamanhos', type=int, nargs='+',
+                        default=[10 ** 4, 10 ** 5, 10 ** 6])
+    parser.add_argument('--max-forca-bruta', type=int, default=20000)
+    parser.add_argument('--tamanho-folha', type=int, default=16)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semente)
+    referencia = None  # (n, tempo) da maior execução de força bruta
+
+    print(f"{'n':>9}{'D&C (s)':>10}{'distâncias D&C':>17}{'força bruta (s)':>17}"
+          f"{'distâncias f.b.':>18}{'profundidade':>14}")
+    for n in args.tamanhos:
+        pontos = rng.random((n, 2))
+
+        motor = ParMaisProximoEducativo(pontos, tamanho_folha=args.tamanho_folha)
+        inicio = time.perf_counter()
+        while motor.proximo_passo():
+            pass
+        tempo_dc = time.perf_counter() - inicio
+        estatisticas = motor.obter_estatisticas()
+
+        if n <= args.max_forca_bruta:
+            inicio = time.perf_counter()
+            distancia = par_mais_proximo_forca_bruta(pontos)
+            tempo_fb = time.perf_counter() - inicio
+            assert math.isclose(distancia, motor.obter_resultado_final()['distancia'])
+            referencia = (n, tempo_fb)
+            texto_fb = f"{tempo_fb:.2f}"
+        elif referencia is not None:
+            texto_fb = f"~{referencia[1] * (n / referencia[0]) ** 2:.0f}"
+        else:
+            texto_fb = "-"
+
+        print(f"{n:>9}{tempo_dc:>10.2f}{estatisticas['distancias_calculadas']:>17,}{texto_fb:>17}"
+              f"{estatisticas['distancias_forca_bruta']:>18,}{estatisticas['profundidade_maxima']:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: partículas em dicionários vs. SistemaParticulas (NumPy + atlas)
+
+Compara o custo por quadro (atualizar + renderizar) do menu antigo, com uma
+lista de dicionários e uma Surface SRCALPHA nova por partícula a cada
+quadro, com o SistemaParticulas, que atualiza arrays NumPy e desenha tudo
+com um único Surface.blits a partir de um atlas pré-desenhado.
+
+Uso:
+    python benchmarks/bench_particulas.py
+    python benchmarks/bench_particulas.py --quantidades 1000 10000 --quadros 120
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ui.particulas import SistemaParticulas  # noqa: E402
+from src.utils.config import CORES, LARGURA, ALTURA  # noqa: E402
+
+DT = 1 / 60
+
+
+class ParticulasLegado:
+    """Implementação anterior do menu: dicionários e uma Surface por partícula por quadro"""
+
+    def __init__(self, quantidade: int, semente: int):
+        rng = random.Random(semente)
+        self.particulas = [{
+            'x': rng.randint(0, LARGURA),
+            'y': rng.randint(0, ALTURA),
+            'velocidade': rng.uniform(30, 120),
+            'tamanho': rng.randint(2, 5),
+            'cor': CORES['PRINCIPAL'],
+        } for _ in range(quantidade)]
+
+    def atualizar(self, dt: float) -> None:
+        for particula in self.particulas:
+            particula['y'] += particula['velocidade'] * dt
+            if particula['y'] > ALTURA:
+                particula['y'] = -particula['tamanho']
+
+    def renderizar(self, tela: pygame.Surface, tempo: float) -> None:
+        for particula in self.particulas:
+            alpha = int(128 + 127 * math.sin(tempo * 2 + particula['x'] * 0.01))
+            tamanho = particula['tamanho']
+            superficie = pygame.Surface((tamanho * 2, tamanho * 2), pygame.SRCALPHA)
+            pygame.draw.circle(superficie, (*particula['cor'], alpha), (tamanho, tamanho), tamanho)
+            tela.blit(superficie, (int(particula['x']), int(particula['y'])))
+
+
+def cronometrar(sistema, tela: pygame.Surface, quadros: int) -> float:
+    """Retorna o tempo médio por quadro em ms"""
+    tempo = 0.0
+    inicio = time.perf_counter()
+    for _ in range(quadros):
+        tela.fill(CORES['FUNDO'])
+        sistema.atualizar(DT)
+        tempo += DT
+        sistema.renderizar(tela, tempo)
+    return (time.perf_counter() - inicio) / quadros * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--quantidades', nargs='+', type=int, default=[50, 1000, 5000, 20000])
+    parser.add_argument('--quadros', type=int, default=60)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    pygame.init()
+    tela = pygame.display.set_mode((LARGURA, ALTURA))
+
+    orcamento = 1000 / 60
+    print(f"{'partículas':>11}{'legado (ms)':>13}{'NumPy (ms)':>12}{'speedup':>9}  60 FPS")
+    for quantidade in args.quantidades:
+        legado = cronometrar(ParticulasLegado(quantidade, args.semente), tela, args.quadros)
+        sistema = SistemaParticulas(quantidade, LARGURA, ALTURA, CORES['PRINCIPAL'], semente=args.semente)
+        vetorizado = cronometrar(sistema, tela, args.quadros)
+        print(f"{quantidade:>11,}{legado:>13.3f}{vetorizado:>12.3f}{legado / vetorizado:>8.1f}x"
+              f"  {'sim' if vetorizado < orcamento else 'não'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: renderização da tela inteira vs. renderização por regiões sujas
+
+Joga uma partida roteirizada sem janela (driver de vídeo "dummy") duas vezes,
+uma em cada modo, e mede o tempo por quadro e a fração da tela redesenhada.
+Com --verificar, cada quadro do modo de regiões sujas é comparado pixel a
+pixel com um redesenho completo do mesmo estado, o que acusa componentes que
+mudam sem invalidar a própria área.
+
+Uso:
+    python benchmarks/bench_regioes_sujas.py
+    python benchmarks/bench_regioes_sujas.py --nivel EXPERT --verificar
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.game.manager import GameManager  # noqa: E402
+from src.utils.config import CORES, NIVEIS  # noqa: E402
+
+
+def quadro_completo(jogo: GameManager) -> bytes:
+    """Redesenha o estado atual inteiro fora da tela e retorna seus pixels"""
+    estado = jogo.gerenciador_estados.estado_atual
+    superficie = pygame.Surface(jogo.tela.get_size())
+    superficie.fill(CORES['FUNDO'])
+
+    tela = estado.tela
+    estado.tela = superficie
+    try:
+        estado.renderizar()
+    finally:
+        estado.tela = tela
+    return pygame.image.tobytes(superficie, 'RGB')
+
+
+def jogar(jogo: GameManager, nivel: str, quadros_por_jogada: int, semente: int,
+          verificar: bool) -> dict:
+    """Joga uma partida inteira, uma jogada a cada `quadros_por_jogada` quadros"""
+    jogo.nivel_selecionado = nivel
+    jogo.gerenciador_estados.mudar_estado('jogo')
+    estado = jogo.gerenciador_estados.estado_atual
+    estado.iniciar_novo_jogo(nivel, semente)
+    botoes = [estado.botao_pausa, estado.botao_reiniciar]
+
+    quadros = 0
+    divergencias = 0
+    tempo_total = 0.0
+    while not estado.jogo_concluido:
+        if quadros % quadros_por_jogada == 0:
+            # Passar o mouse sobre um dos botões e jogar
+            botao = botoes[(quadros // quadros_por_jogada) % len(botoes)]
+            pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=botao.rect.center,
+                                                 rel=(0, 0), buttons=(0, 0, 0)))
+            if estado.aguardando_resposta:
+                estado.processar_escolha(min(estado.lista1[estado.i], estado.lista2[estado.j]))
+            else:
+                estado.preparar_proxima_fusao()
+
+        inicio = time.perf_counter()
+        jogo.processar_eventos()
+        jogo.atualizar(1 / 60)
+        jogo.renderizar()
+        tempo_total += time.perf_counter() - inicio
+        quadros += 1
+
+        if verificar and pygame.image.tobytes(jogo.tela, 'RGB') != quadro_completo(jogo):
+            divergencias += 1
+
+    return {
+        'quadros': quadros,
+        'ms_por_quadro': tempo_total / quadros * 1000,
+        'divergencias': divergencias,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--nivel', choices=list(NIVEIS), default='DIFICIL')
+    parser.add_argument('--quadros-por-jogada', type=int, default=20)
+    parser.add_argument('--verificar', action='store_true',
+                        help='comparar cada quadro com um redesenho completo')
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    jogo = GameManager()
+    print(f"{'modo':<16}{'quadros':>9}{'ms/quadro':>11}{'tela redesenhada':>18}{'divergências':>14}")
+    for modo, ativo in (('tela inteira', False), ('regiões sujas', True)):
+        jogo.regioes_sujas.ativo = ativo
+        jogo.regioes_sujas.invalidar_tudo()
+        quadros_antes = jogo.regioes_sujas.quadros
+        pixels_antes = jogo.regioes_sujas.pixels_redesenhados
+
+        resultado = jogar(jogo, args.nivel, args.quadros_por_jogada, args.semente,
+                          args.verificar and ativo)
+
+        if ativo:
+            pixels_tela = jogo.tela.get_width() * jogo.tela.get_height()
+            quadros = jogo.regioes_sujas.quadros - quadros_antes
+            fracao = (jogo.regioes_sujas.pixels_redesenhados - pixels_antes) / (quadros * pixels_tela)
+        else:
+            fracao = 1.0
+        divergencias = resultado['divergencias'] if args.verificar and ativo else '-'
+        print(f"{modo:<16}{resultado['quadros']:>9}{resultado['ms_por_quadro']:>11.3f}"
+              f"{fracao:>17.1%}{divergencias:>14}")
+
+    if args.verificar and resultado['divergencias']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
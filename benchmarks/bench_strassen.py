@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Strassen sobre blocos NumPy vs. multiplicação clássica (numpy.matmul)
+
+Para cada dimensão e tamanho de folha, compara as multiplicações escalares do
+Strassen com as n³ do algoritmo clássico e o tempo de parede com uma única
+chamada a numpy.matmul. O Strassen ganha na contagem de multiplicações assim que
+há um nível de recursão, mas paga as 18 somas de blocos por nível e perde a
+eficiência de cache do BLAS, o que costuma deixá-lo mais lento no relógio.
+
+Uso:
+    python benchmarks/bench_strassen.py --dimensoes 256 512 1024 2048
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithms.strassen import StrassenEducativo  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--dimensoes', type=int, nargs='+', default=[256, 512, 1024, 2048])
+    parser.add_argument('--folhas', type=int, nargs='+', default=[32, 64, 128, 256])
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semente)
+
+    print(f"{'n':>6}{'folha':>7}{'níveis':>8}{'mult. Strassen':>17}{'mult. clássico':>17}"
+          f"{'economia':>10}{'adições':>16}{'Strassen (s)':>14}{'matmul (s)':>12}")
+    for n in args.dimensoes:
+        A = rng.random((n, n))
+        B = rng.random((n, n))
+
+        inicio = time.perf_counter()
+        esperado = A @ B
+        tempo_matmul = time.perf_counter() - inicio
+
+        for folha in args.folhas:
+            motor = StrassenEducativo(A, B, tamanho_folha=folha)
+            inicio = time.perf_counter()
+            while motor.proximo_passo():
+                pass
+            tempo_strassen = time.perf_counter() - inicio
+            assert np.allclose(motor.obter_resultado_final(), esperado)
+
+            estatisticas = motor.obter_estatisticas()
+            print(f"{n:>6}{folha:>7}{estatisticas['profundidade_maxima']:>8}"
+                  f"{estatisticas['multiplicacoes_escalares']:>17,}"
+                  f"{estatisticas['multiplicacoes_classico']:>17,}"
+                  f"{estatisticas['economia_multiplicacoes']:>9.1f}%"
+                  f"{estatisticas['adicoes_escalares']:>16,}"
+                  f"{tempo_strassen:>14.3f}{tempo_matmul:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
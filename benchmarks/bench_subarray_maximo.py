@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: subarray máximo por dividir e conquistar O(n log n) vs. Kadane O(n)
+
+Os dois modos do motor são executados passo a passo sobre os mesmos dados e
+devem encontrar a mesma soma. A razão entre as operações (somas + comparações)
+cresce como log n, mostrando que aqui dividir e conquistar não é a melhor opção.
+
+Uso:
+    python benchmarks/bench_subarray_maximo.py --tamanhos 1000 10000 100000 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithms.subarray_maximo import SubarrayMaximoEducativo, ModoSubarray  # noqa: E402
+from src.utils.distribuicoes import gerar  # noqa: E402
+
+
+def executar(valores: np.ndarray, modo: ModoSubarray):
+    """Executa o motor até o fim e retorna (tempo, soma, operações)"""
+    motor = SubarrayMaximoEducativo(valores, modo)
+    inicio = time.perf_counter()
+    while motor.proximo_passo():
+        pass
+    tempo = time.perf_counter() - inicio
+    return tempo, motor.obter_resultado_final()['soma'], motor.obter_estatisticas()['operacoes_totais']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tamanhos', type=int, nargs='+',
+                        default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semente)
+
+    print(f"{'n':>9}{'soma':>9}{'operações D&C':>16}{'operações Kadane':>19}{'razão':>8}"
+          f"{'log2 n':>8}{'D&C (s)':>10}{'Kadane (s)':>12}")
+    for n in args.tamanhos:
+        valores = gerar('aleatorio', n, rng, minimo=-100, maximo=101)
+
+        tempo_dc, soma_dc, operacoes_dc = executar(valores, ModoSubarray.DIVIDIR_CONQUISTAR)
+        tempo_kadane, soma_kadane, operacoes_kadane = executar(valores, ModoSubarray.KADANE)
+        assert soma_dc == soma_kadane
+
+        print(f"{n:>9}{soma_dc:>9}{operacoes_dc:>16,}{operacoes_kadane:>19,}"
+              f"{operacoes_dc / operacoes_kadane:>8.1f}{np.log2(n):>8.1f}"
+              f"{tempo_dc:>10.2f}{tempo_kadane:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dicionários de animação por componente vs. agendador de tweens
+
+Mede o custo de um passo de animação para muitos componentes com uma
+fração deles animando. A versão antiga percorre o dicionário de animações
+de cada componente a cada passo, animando ou não, e calcula o easing com
+potências; o agendador guarda só os tweens ativos em registros com
+__slots__, avança todos numa passada e lê o easing de uma tabela.
+
+Uso:
+    python benchmarks/bench_tweens.py
+    python benchmarks/bench_tweens.py --componentes 5000 --fracoes 0 0.1 1
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ui.tweens import AgendadorTweens  # noqa: E402
+
+DT = 1 / 60
+DURACAO_MS = 1e9  # Longa o bastante para nenhuma animação terminar durante a medição
+
+
+class ComponenteLegado:
+    """Sistema anterior do ComponenteUI: dicionário de animações por instância"""
+
+    def __init__(self):
+        self.animacoes = {}
+        self.escala = 1.0
+
+    def adicionar_animacao(self, duracao: float, valor_inicial: float, valor_final: float) -> None:
+        self.animacoes['scale'] = {
+            'duracao': duracao,
+            'tempo_atual': 0,
+            'valor_inicial': valor_inicial,
+            'valor_final': valor_final,
+            'callback': None,
+            'ativa': True
+        }
+
+    def invalidar(self) -> None:
+        pass
+
+    def atualizar_animacoes(self, dt: float) -> None:
+        animando = any(anim['ativa'] for anim in self.animacoes.values())
+        if animando:
+            self.invalidar()
+
+        for _, anim in list(self.animacoes.items()):
+            if not anim['ativa']:
+                continue
+            anim['tempo_atual'] += dt * 1000
+            progresso = min(anim['tempo_atual'] / anim['duracao'], 1.0)
+            progresso_suave = 1 - (1 - progresso) ** 3
+            self.escala = anim['valor_inicial'] + (anim['valor_final'] - anim['valor_inicial']) * progresso_suave
+            if progresso >= 1.0:
+                anim['ativa'] = False
+
+        if animando:
+            self.invalidar()
+
+
+class ComponenteLeve:
+    """Alvo mínimo para o agendador (mesmo invalidar vazio da versão antiga)"""
+
+    def __init__(self):
+        self.escala = 1.0
+
+    def invalidar(self) -> None:
+        pass
+
+
+def medir_legado(quantidade: int, ativos: int, passos: int) -> float:
+    """Microssegundos por passo"""
+    componentes = [ComponenteLegado() for _ in range(quantidade)]
+    for componente in componentes[:ativos]:
+        componente.adicionar_animacao(DURACAO_MS, 1.0, 1.05)
+    # Componentes que já animaram uma vez guardam a animação concluída no dicionário
+    for componente in componentes[ativos:]:
+        componente.adicionar_animacao(1, 1.0, 1.0)
+        componente.atualizar_animacoes(DT)
+
+    inicio = time.perf_counter()
+    for _ in range(passos):
+        for componente in componentes:
+            componente.atualizar_animacoes(DT)
+    return (time.perf_counter() - inicio) / passos * 1e6
+
+
+def medir_agendador(quantidade: int, ativos: int, passos: int) -> float:
+    """Microssegundos por passo"""
+    agendador = AgendadorTweens()
+    componentes = [ComponenteLeve() for _ in range(quantidade)]
+    for componente in componentes[:ativos]:
+        agendador.animar(componente, 'escala', DURACAO_MS, 1.0, 1.05)
+
+    inicio = time.perf_counter()
+    for _ in range(passos):
+        agendador.avancar(DT)
+    return (time.perf_counter() - inicio) / passos * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--componentes', type=int, default=1000)
+    parser.add_argument('--fracoes', nargs='+', type=float, default=[0.0, 0.01, 0.1, 1.0],
+                        help='frações dos componentes animando')
+    parser.add_argument('--passos', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.componentes:,} componentes")
+    print(f"{'animando':>9}{'dicionários (µs)':>18}{'agendador (µs)':>16}{'speedup':>9}")
+    for fracao in args.fracoes:
+        ativos = round(args.componentes * fracao)
+        legado = medir_legado(args.componentes, ativos, args.passos)
+        agendador = medir_agendador(args.componentes, ativos, args.passos)
+        speedup = f"{legado / agendador:>8.1f}x" if agendador > 0 else f"{'-':>9}"
+        print(f"{ativos:>9,}{legado:>18.1f}{agendador:>16.1f}{speedup}")
+
+
+if __name__ == '__main__':
+    main()
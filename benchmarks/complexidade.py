@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Ajuste empírico de complexidade dos motores, com alarme de regressão
+
+Varre n (potências de 2) com os motores da suíte (benchmarks/suite.py) e ajusta
+cada contador de custo aos modelos candidatos log n, n, n log n, n^log2(3), n²,
+n^log2(7) e n³. O ajuste é feito em escala logarítmica: para cada modelo f, a
+constante é c = média geométrica de custo / f(n), e o resíduo é o desvio
+padrão de log2(custo / (c f(n))) -- zero quando o custo é exatamente c f(n).
+O modelo de menor resíduo é o melhor ajuste.
+
+Cada entrada de EXPECTATIVAS fixa o modelo esperado para um contador de um
+motor em uma distribuição (por exemplo, comparações do QuickSort em entrada
+aleatória: n log n). Se o melhor ajuste for outro, o script lista a falha e
+termina com código 1, o que pega regressões quadráticas acidentais.
+
+Uso:
+    python benchmarks/complexidade.py
+    python benchmarks/complexidade.py --motores MERGE_SORT QUICK_SORT
+    python benchmarks/complexidade.py --entrada resultados.json
+"""
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# suite.py está no mesmo diretório (e já ajusta o path para src)
+from suite import MOTORES, medir
+
+
+MODELOS = {
+    'log n': lambda n: np.log2(n),
+    'n': lambda n: n,
+    'n log n': lambda n: n * np.log2(n),
+    'n^1.585': lambda n: n ** math.log2(3),
+    'n²': lambda n: n ** 2,
+    'n^2.807': lambda n: n ** math.log2(7),
+    'n³': lambda n: n ** 3,
+}
+
+# (motor, distribuição, contador) -> modelo esperado e maior n da varredura.
+# O maior n fica abaixo do limite da suíte quando o motor é lento em Python.
+EXPECTATIVAS = {
+    ('MERGE_SORT', 'aleatorio', 'comparacoes'): {'modelo': 'n log n', 'tamanho_maximo': 2 ** 13},
+    ('MERGE_SORT', 'ordenado', 'comparacoes'): {'modelo': 'n log n', 'tamanho_maximo': 2 ** 13},
+    ('QUICK_SORT', 'aleatorio', 'comparacoes'): {'modelo': 'n log n', 'tamanho_maximo': 2 ** 9},
+    # Pivot = último elemento: entrada ordenada e o matador são o pior caso
+    ('QUICK_SORT', 'ordenado', 'comparacoes'): {'modelo': 'n²', 'tamanho_maximo': 2 ** 9},
+    ('QUICK_SORT', 'matador_quicksort', 'comparacoes'): {'modelo': 'n²', 'tamanho_maximo': 2 ** 9},
+    ('QUICK_SELECT', 'aleatorio', 'comparacoes'): {'modelo': 'n', 'tamanho_maximo': 2 ** 10},
+    # Chaves repetidas: o bloco dos iguais ao pivot sai inteiro de cada partição
+    ('QUICK_SELECT', 'poucos_unicos', 'comparacoes'): {'modelo': 'n', 'tamanho_maximo': 2 ** 10},
+    # Mediana das medianas: O(n) no pior caso, também com chaves repetidas
+    ('QUICK_SELECT_MOM', 'poucos_unicos', 'comparacoes'): {'modelo': 'n', 'tamanho_maximo': 2 ** 11},
+    ('QUICK_SELECT_MOM', 'ordenado', 'comparacoes'): {'modelo': 'n', 'tamanho_maximo': 2 ** 11},
+    ('BINARY_SEARCH', 'aleatorio', 'comparacoes'): {'modelo': 'log n', 'tamanho_maximo': 2 ** 16},
+    ('BUSCA_PARAMETRICA', 'aleatorio', 'comparacoes'): {'modelo': 'log n', 'tamanho_maximo': 2 ** 16},
+    ('PAR_MAIS_PROXIMO', 'aleatorio', 'leituras'): {'modelo': 'n log n', 'tamanho_maximo': 2 ** 15},
+    ('KARATSUBA', 'aleatorio', 'leituras'): {'modelo': 'n^1.585', 'tamanho_maximo': 2 ** 13},
+    ('STRASSEN', 'aleatorio', 'leituras'): {'modelo': 'n^2.807', 'tamanho_maximo': 2 ** 10},
+    ('SUBARRAY_MAXIMO', 'aleatorio', 'comparacoes'): {'modelo': 'n log n', 'tamanho_maximo': 2 ** 15},
+    ('SUBARRAY_KADANE', 'aleatorio', 'comparacoes'): {'modelo': 'n', 'tamanho_maximo': 2 ** 16},
+}
+
+# Pontos mínimos para que o ajuste signifique alguma coisa
+PONTOS_MINIMOS = 4
+
+
+def ajustar(tamanhos, custos) -> list:
+    """
+    Ajusta custo ≈ c·f(n) para cada modelo.
+
+    Returns:
+        Lista de (modelo, constante, resíduo), do melhor para o pior ajuste
+    """
+    n = np.asarray(tamanhos, dtype=np.float64)
+    y = np.asarray(custos, dtype=np.float64)
+
+    ajustes = []
+    for nome, modelo in MODELOS.items():
+        razoes = np.log2(y / modelo(n))
+        constante = float(2 ** razoes.mean())
+        residuo = float(razoes.std())
+        ajustes.append((nome, constante, residuo))
+    return sorted(ajustes, key=lambda ajuste: ajuste[2])
+
+
+def coletar(motores: list, tamanho_maximo: int, semente: int) -> dict:
+    """Executa a varredura em n para as expectativas dos motores pedidos"""
+    pontos = {}
+    for (motor, distribuicao, contador), expectativa in EXPECTATIVAS.items():
+        if motor not in motores:
+            continue
+        limite = min(expectativa['tamanho_maximo'], tamanho_maximo)
+        tamanhos = [2 ** k for k in range(4, limite.bit_length())]
+        registros = [medir(motor, distribuicao, n, semente, 1, False) for n in tamanhos]
+        pontos[(motor, distribuicao, contador)] = [(r['n'], r[contador]) for r in registros]
+        print(f"{motor:<18}{distribuicao:<19}{contador:<13}n <= {tamanhos[-1]:,}",
+              file=sys.stderr)
+    return pontos
+
+
+def carregar(caminho: Path, motores: list) -> dict:
+    """Extrai os pontos das expectativas de um JSON gerado por suite.py --saida"""
+    registros = json.loads(caminho.read_text(encoding='utf-8'))['registros']
+    pontos = {}
+    for (motor, distribuicao, contador) in EXPECTATIVAS:
+        if motor not in motores:
+            continue
+        pontos[(motor, distribuicao, contador)] = sorted(
+            (r['n'], r[contador]) for r in registros
+            if r['motor'] == motor and r['distribuicao'] == distribuicao
+            and not r.get('ignorado'))
+    return pontos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--motores', nargs='+', choices=list(MOTORES), default=list(MOTORES))
+    parser.add_argument('--tamanho-maximo', type=int, default=2 ** 16,
+                        help='maior n da varredura (limitado também por cada expectativa)')
+    parser.add_argument('--entrada', type=Path,
+                        help='usar os registros de suite.py --saida em vez de executar')
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    if args.entrada:
+        pontos = carregar(args.entrada, args.motores)
+    else:
+        pontos = coletar(args.motores, args.tamanho_maximo, args.semente)
+
+    print(f"{'motor':<18}{'distribuicao':<19}{'contador':<13}{'esperado':>10}"
+          f"{'ajuste':>10}{'constante':>12}{'resíduo':>9}{'2º ajuste':>11}{'resíduo':>9}  status")
+    falhas = []
+    for (motor, distribuicao, contador), serie in pontos.items():
+        esperado = EXPECTATIVAS[(motor, distribuicao, contador)]['modelo']
+        serie = [(n, custo) for n, custo in serie if n > 1 and custo > 0]
+        rotulo = f"{motor:<18}{distribuicao:<19}{contador:<13}{esperado:>10}"
+        if len(serie) < PONTOS_MINIMOS:
+            print(f"{rotulo}  poucos pontos ({len(serie)})")
+            continue
+
+        tamanhos, custos = zip(*serie)
+        (melhor, constante, residuo), (segundo, _, residuo_segundo) = ajustar(tamanhos, custos)[:2]
+        ok = melhor == esperado
+        print(f"{rotulo}{melhor:>10}{constante:>12.3f}{residuo:>9.3f}"
+              f"{segundo:>11}{residuo_segundo:>9.3f}  {'ok' if ok else 'FALHA'}")
+        if not ok:
+            falhas.append(f"{motor} ({distribuicao}, {contador}): esperado {esperado}, "
+                          f"ajuste {melhor} (c = {constante:.3f}) para n <= {max(tamanhos):,}")
+
+    if falhas:
+        print(f"\n{len(falhas)} motor(es) fora da complexidade esperada:")
+        for linha in falhas:
+            print(f"  {linha}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
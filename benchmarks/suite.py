@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Suíte de benchmarks: todos os motores, sem interface, por tamanho e distribuição
+
+Executa cada motor do registro (src/algorithms/registro.py) até o fim, tomando
+sempre a decisão correta, para n em {10, 10², ..., 10⁶} e para as distribuições
+de src/utils/distribuicoes.py (aleatorio, ordenado, reverso, poucos_unicos, zipf,
+dente_de_serra, tubos_orgao, quase_ordenado e matador_quicksort).
+Para cada execução registra tempo de parede, os custos do motor (comparações,
+trocas, leituras, escritas, passos, pico auxiliar) e o pico de memória medido
+com tracemalloc em uma segunda execução, para não distorcer o tempo.
+
+Cada motor tem um tamanho máximo (motores com custo quadrático no estado
+atual param antes); células acima do limite aparecem como "-". Os contadores
+são determinísticos para a mesma semente, então a tabela de texto e o JSON
+podem ser comparados entre commits; --comparar faz essa comparação e termina
+com código 1 se algum contador mudou ou algum tempo piorou além da tolerância.
+
+Uso:
+    python benchmarks/suite.py --saida resultados.json
+    python benchmarks/suite.py --motores MERGE_SORT QUICK_SORT --tamanhos 10 100 1000
+    python benchmarks/suite.py --comparar resultados.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.algorithms.registro import criar_motor  # noqa: E402
+from src.algorithms.merge_sort import FaseMergeSort  # noqa: E402
+from src.algorithms.quick_select import EstrategiaPivot  # noqa: E402
+from src.algorithms.binary_search import FaseBinarySearch  # noqa: E402
+from src.algorithms.karatsuba import para_inteiro  # noqa: E402
+from src.algorithms.subarray_maximo import ModoSubarray  # noqa: E402
+from src.utils.distribuicoes import DISTRIBUICOES, gerar  # noqa: E402
+
+
+# Contadores de custo registrados (chaves de ContadorCustos.como_dict)
+CONTADORES = ('comparacoes', 'trocas', 'leituras', 'escritas', 'passos', 'pico_auxiliar')
+
+# Consultas feitas por execução nos motores de busca
+CONSULTAS_BUSCA = 100
+
+
+# ---------------------------------------------------------------------------
+# Execução sem interface de cada motor
+#
+# Cada função recebe a entrada já gerada, roda o motor até o fim e retorna
+# (motor, resultado_correto). A conferência usa uma referência barata.
+# ---------------------------------------------------------------------------
+
+def executar_merge_sort(dados: np.ndarray, rng: np.random.Generator):
+    lista = dados.tolist()
+    motor = criar_motor('MERGE_SORT', lista)
+
+    # Na fase FUSAO o motor avança por fazer_escolha, não por proximo_passo
+    while True:
+        if motor.fase_atual == FaseMergeSort.FUSAO:
+            par = motor.obter_proxima_comparacao()
+            motor.fazer_escolha(par is None or par[0] <= par[1])
+        elif not motor.proximo_passo():
+            break
+
+    return motor, motor.obter_resultado_final() == sorted(lista)
+
+
+def executar_quick_sort(dados: np.ndarray, rng: np.random.Generator):
+    lista = dados.tolist()
+    motor = criar_motor('QUICK_SORT', lista)
+    while motor.proximo_passo():
+        pass
+    return motor, motor.obter_resultado_final() == sorted(lista)
+
+
+def _executar_quick_select(dados: np.ndarray, estrategia: EstrategiaPivot):
+    lista = dados.tolist()
+    k = len(lista) // 2
+    motor = criar_motor('QUICK_SELECT', lista, k, estrategia=estrategia, semente=0)
+    while motor.proximo_passo():
+        pass
+    return motor, motor.elemento_k == sorted(lista)[k]
+
+
+def executar_quick_select(dados: np.ndarray, rng: np.random.Generator):
+    return _executar_quick_select(dados, EstrategiaPivot.ALEATORIO)
+
+
+def executar_quick_select_medianas(dados: np.ndarray, rng: np.random.Generator):
+    return _executar_quick_select(dados, EstrategiaPivot.MEDIANA_DAS_MEDIANAS)
+
+
+def executar_binary_search(dados: np.ndarray, rng: np.random.Generator):
+    ordenados = np.sort(dados)
+    chaves = rng.choice(ordenados, size=CONSULTAS_BUSCA).tolist()
+
+    # Um único motor para todas as consultas: a construção copia a lista
+    motor = criar_motor('BINARY_SEARCH', ordenados.tolist(), chaves[0])
+    correto = True
+    for chave in chaves:
+        motor.valor_busca = chave
+        motor.posicao_encontrada = -1
+        motor.fase_atual = FaseBinarySearch.INICIALIZACAO
+
+        motor.proximo_passo()
+        while motor.proximo_passo():
+            motor.fazer_decisao_direcao(chave < motor.lista_original[motor.meio])
+        correto = correto and motor.lista_original[motor.posicao_encontrada] == chave
+    return motor, correto
+
+
+def executar_busca_parametrica(dados: np.ndarray, rng: np.random.Generator):
+    ordenados = np.sort(dados)
+    valores = ordenados.tolist()
+    chaves = rng.choice(ordenados, size=CONSULTAS_BUSCA).tolist()
+
+    # Limite inferior como predicado monótono sobre os índices
+    custos = None
+    correto = True
+    for chave in chaves:
+        motor = criar_motor('BUSCA_PARAMETRICA',
+                            lambda i, chave=chave: valores[i] >= chave, 0, len(valores) - 1)
+        if custos is not None:
+            motor.custos = custos  # Acumular os custos de todas as consultas
+        custos = motor.custos
+
+        motor.proximo_passo()
+        while motor.proximo_passo():
+            motor.fazer_decisao_direcao(motor.resultado_meio)
+        correto = correto and motor.resposta == int(np.searchsorted(ordenados, chave))
+    return motor, correto
+
+
+def executar_busca_parametrica_real(dados: np.ndarray, rng: np.random.Generator):
+    # Limites reais de magnitude grande (até 1e17), onde o espaçamento dos floats passa de 1:
+    # a busca precisa parar pela tolerância relativa ou por falta de ponto médio representável
+    dados = np.abs(dados)
+    escala = 1e17 / (float(dados.max()) + 1)
+    chaves = (rng.choice(dados, size=CONSULTAS_BUSCA) * escala).tolist() + [1e16]
+
+    custos = None
+    correto = True
+    for chave in chaves:
+        motor = criar_motor('BUSCA_PARAMETRICA', lambda x, chave=chave: x >= chave, 0.0, 1e17)
+        if custos is not None:
+            motor.custos = custos
+        custos = motor.custos
+
+        motor.proximo_passo()
+        passos = 0
+        while motor.proximo_passo():
+            motor.fazer_decisao_direcao(motor.resultado_meio)
+            passos += 1
+            if passos > 4 * motor.obter_estatisticas()['complexidade_teorica'] + 64:
+                return motor, False  # Não converge
+        limiar = max(motor.tolerancia * max(1.0, abs(chave)), 2 * np.spacing(chave))
+        correto = correto and motor.resposta is not None and 0 <= motor.resposta - chave <= limiar
+    return motor, correto
+
+
+def executar_par_mais_proximo(dados: np.ndarray, rng: np.random.Generator):
+    pontos = np.column_stack([dados.astype(np.float64), rng.random(len(dados)) * len(dados)])
+    motor = criar_motor('PAR_MAIS_PROXIMO', pontos)
+    while motor.proximo_passo():
+        pass
+    return motor, motor.obter_resultado_final() is not None
+
+
+def executar_karatsuba(dados: np.ndarray, rng: np.random.Generator):
+    # n dígitos decimais por fator; o dígito mais significativo não pode ser zero
+    digitos = rng.integers(0, 10, size=(2, len(dados)), dtype=np.int64)
+    digitos[:, -1] = rng.integers(1, 10, size=2)
+    a, b = (para_inteiro(linha) for linha in digitos)
+    motor = criar_motor('KARATSUBA', a, b)
+    while motor.proximo_passo():
+        pass
+    return motor, motor.obter_resultado_final() == a * b
+
+
+def executar_strassen(dados: np.ndarray, rng: np.random.Generator):
+    # n é a dimensão das matrizes quadradas
+    n = len(dados)
+    A = rng.integers(-8, 8, size=(n, n), dtype=np.int64)
+    B = rng.integers(-8, 8, size=(n, n), dtype=np.int64)
+    motor = criar_motor('STRASSEN', A, B)
+    while motor.proximo_passo():
+        pass
+    return motor, bool(np.array_equal(motor.obter_resultado_final(), A @ B))
+
+
+def _executar_subarray(dados: np.ndarray, modo: ModoSubarray):
+    # Centralizar em zero para que haja somas negativas
+    valores = dados - int(dados.mean())
+    motor = criar_motor('SUBARRAY_MAXIMO', valores, modo)
+    while motor.proximo_passo():
+        pass
+    acumulado = np.concatenate([[0], np.cumsum(valores)])
+    referencia = int(np.max(acumulado[1:] - np.minimum.accumulate(acumulado[:-1])))
+    return motor, motor.obter_resultado_final()['soma'] == referencia
+
+
+def executar_subarray_dc(dados: np.ndarray, rng: np.random.Generator):
+    return _executar_subarray(dados, ModoSubarray.DIVIDIR_CONQUISTAR)
+
+
+def executar_subarray_kadane(dados: np.ndarray, rng: np.random.Generator):
+    return _executar_subarray(dados, ModoSubarray.KADANE)
+
+
+# Nome na tabela -> função de execução, maior n executado e distribuições
+# (None = todas). Motores cujo custo não depende da ordem da entrada rodam
+# apenas com a distribuição aleatória. O QuickSort copia a lista inteira no
+# histórico a cada troca, o que o limita a n pequeno.
+MOTORES = {
+    'MERGE_SORT': {'executar': executar_merge_sort, 'tamanho_maximo': 10 ** 4},
+    'QUICK_SORT': {'executar': executar_quick_sort, 'tamanho_maximo': 10 ** 2},
+    'QUICK_SELECT': {'executar': executar_quick_select, 'tamanho_maximo': 10 ** 3},
+    'QUICK_SELECT_MOM': {'executar': executar_quick_select_medianas, 'tamanho_maximo': 10 ** 3},
+    'BINARY_SEARCH': {'executar': executar_binary_search, 'tamanho_maximo': 10 ** 6},
+    'BUSCA_PARAMETRICA': {'executar': executar_busca_parametrica, 'tamanho_maximo': 10 ** 6},
+    'BUSCA_PARAM_REAL': {'executar': executar_busca_parametrica_real, 'tamanho_maximo': 10 ** 6,
+                         'distribuicoes': ('aleatorio',)},
+    'PAR_MAIS_PROXIMO': {'executar': executar_par_mais_proximo, 'tamanho_maximo': 10 ** 5},
+    'KARATSUBA': {'executar': executar_karatsuba, 'tamanho_maximo': 10 ** 4,
+                  'distribuicoes': ('aleatorio',)},
+    'STRASSEN': {'executar': executar_strassen, 'tamanho_maximo': 10 ** 3,
+                 'distribuicoes': ('aleatorio',)},
+    'SUBARRAY_MAXIMO': {'executar': executar_subarray_dc, 'tamanho_maximo': 10 ** 5},
+    'SUBARRAY_KADANE': {'executar': executar_subarray_kadane, 'tamanho_maximo': 10 ** 6},
+}
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def medir(nome: str, distribuicao: str, n: int, semente: int,
+          repeticoes: int, medir_memoria: bool) -> dict:
+    """Executa um motor sobre uma entrada e retorna o registro da medição"""
+    executar = MOTORES[nome]['executar']
+
+    def nova_execucao():
+        # Mesma semente em todas as repetições: mesma entrada, mesmos custos
+        rng = np.random.default_rng(semente)
+        return gerar(distribuicao, n, rng), rng
+
+    melhor_tempo = float('inf')
+    for _ in range(repeticoes):
+        dados, rng = nova_execucao()
+        inicio = time.perf_counter()
+        motor, correto = executar(dados, rng)
+        melhor_tempo = min(melhor_tempo, time.perf_counter() - inicio)
+
+    custos = motor.obter_custos()
+    registro = {
+        'motor': nome,
+        'distribuicao': distribuicao,
+        'n': n,
+        'tempo_s': melhor_tempo,
+        'correto': bool(correto),
+    }
+    registro.update({chave: custos[chave] for chave in CONTADORES})
+
+    registro['memoria_pico_kib'] = None
+    if medir_memoria:
+        dados, rng = nova_execucao()
+        tracemalloc.start()
+        executar(dados, rng)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        registro['memoria_pico_kib'] = round(pico / 1024, 1)
+
+    return registro
+
+
+def formatar_tabela(registros: list) -> str:
+    """Tabela de largura fixa, uma linha por medição, estável para diff"""
+    colunas = (f"{'motor':<18}{'distribuicao':<19}{'n':>9}{'tempo (s)':>11}"
+               f"{'comparacoes':>14}{'trocas':>12}{'leituras':>14}{'escritas':>14}"
+               f"{'passos':>12}{'pico aux':>11}{'mem (KiB)':>12}  ok")
+    linhas = [colunas, '-' * len(colunas)]
+    for r in registros:
+        if r.get('ignorado'):
+            linhas.append(f"{r['motor']:<18}{r['distribuicao']:<19}{r['n']:>9}{'-':>11}")
+            continue
+        memoria = '-' if r['memoria_pico_kib'] is None else f"{r['memoria_pico_kib']:,.1f}"
+        linhas.append(
+            f"{r['motor']:<18}{r['distribuicao']:<19}{r['n']:>9}{r['tempo_s']:>11.4f}"
+            f"{r['comparacoes']:>14,}{r['trocas']:>12,}{r['leituras']:>14,}{r['escritas']:>14,}"
+            f"{r['passos']:>12,}{r['pico_auxiliar']:>11,}{memoria:>12}"
+            f"  {'sim' if r['correto'] else 'NAO'}")
+    return '\n'.join(linhas)
+
+
+def comparar(registros: list, base: list, tolerancia_tempo: float,
+             tempo_minimo: float) -> list:
+    """
+    Compara com uma execução anterior e retorna as regressões encontradas.
+
+    Contadores são exatos (mesma semente), então qualquer diferença é uma
+    mudança de comportamento. Tempos só contam acima de `tolerancia_tempo`
+    vezes o anterior e quando passam de `tempo_minimo` segundos, abaixo do
+    qual o ruído da medição domina.
+    """
+    anteriores = {(r['motor'], r['distribuicao'], r['n']): r
+                  for r in base if not r.get('ignorado')}
+    regressoes = []
+    for r in registros:
+        anterior = anteriores.get((r['motor'], r['distribuicao'], r['n']))
+        if anterior is None or r.get('ignorado'):
+            continue
+        rotulo = f"{r['motor']} {r['distribuicao']} n={r['n']}"
+        for chave in CONTADORES:
+            if r[chave] != anterior[chave]:
+                regressoes.append(f"{rotulo}: {chave} {anterior[chave]:,} -> {r[chave]:,}")
+        if (r['tempo_s'] >= tempo_minimo and anterior['tempo_s'] > 0 and
+                r['tempo_s'] / anterior['tempo_s'] > tolerancia_tempo):
+            regressoes.append(f"{rotulo}: tempo {anterior['tempo_s']:.4f}s -> "
+                              f"{r['tempo_s']:.4f}s ({r['tempo_s'] / anterior['tempo_s']:.2f}x)")
+        if anterior['correto'] and not r['correto']:
+            regressoes.append(f"{rotulo}: resultado incorreto")
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--motores', nargs='+', choices=list(MOTORES), default=list(MOTORES))
+    parser.add_argument('--distribuicoes', nargs='+', choices=list(DISTRIBUICOES),
+                        default=list(DISTRIBUICOES))
+    parser.add_argument('--tamanhos', type=int, nargs='+',
+                        default=[10 ** k for k in range(1, 7)])
+    parser.add_argument('--ignorar-limites', action='store_true',
+                        help='executar todos os tamanhos, mesmo acima do máximo de cada motor')
+    parser.add_argument('--repeticoes', type=int, default=1,
+                        help='execuções por célula; o tempo registrado é o menor')
+    parser.add_argument('--sem-memoria', action='store_true',
+                        help='não medir o pico de memória (dispensa a segunda execução)')
+    parser.add_argument('--saida', type=Path, help='arquivo JSON com os resultados')
+    parser.add_argument('--comparar', type=Path, help='JSON de uma execução anterior')
+    parser.add_argument('--tolerancia-tempo', type=float, default=1.5)
+    parser.add_argument('--tempo-minimo', type=float, default=0.05,
+                        help='tempos abaixo disso (s) não são comparados')
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    registros = []
+    for nome in args.motores:
+        especificacao = MOTORES[nome]
+        permitidas = especificacao.get('distribuicoes') or tuple(DISTRIBUICOES)
+        for distribuicao in args.distribuicoes:
+            if distribuicao not in permitidas:
+                continue
+            for n in sorted(args.tamanhos):
+                if n > especificacao['tamanho_maximo'] and not args.ignorar_limites:
+                    registros.append({'motor': nome, 'distribuicao': distribuicao,
+                                      'n': n, 'ignorado': True})
+                    continue
+                registro = medir(nome, distribuicao, n, args.semente,
+                                 max(1, args.repeticoes), not args.sem_memoria)
+                registros.append(registro)
+                print(f"{nome:<18}{distribuicao:<19}{n:>9}  {registro['tempo_s']:.4f}s",
+                      file=sys.stderr)
+
+    print(formatar_tabela(registros))
+
+    if args.saida:
+        resultado = {
+            'semente': args.semente,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'registros': registros,
+        }
+        args.saida.write_text(json.dumps(resultado, indent=2, ensure_ascii=False) + '\n',
+                              encoding='utf-8')
+        print(f"\nResultados gravados em {args.saida}")
+
+    if args.comparar:
+        base = json.loads(args.comparar.read_text(encoding='utf-8'))
+        regressoes = comparar(registros, base['registros'], args.tolerancia_tempo,
+                              args.tempo_minimo)
+        if regressoes:
+            print(f"\n{len(regressoes)} regressão(ões) em relação a {args.comparar}:")
+            for linha in regressoes:
+                print(f"  {linha}")
+            sys.exit(1)
+        print(f"\nSem regressões em relação a {args.comparar}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Verificação: o tempo das animações não depende da taxa de quadros
+
+Executa o loop real do GameManager no menu, sem janela e com um relógio
+falso, em várias taxas de renderização (inclusive uma irregular). Depois de
+cada passo da simulação registra o tempo de animação, as posições das
+partículas e a escala do botão sob o mouse. Com o passo fixo, as amostras
+do mesmo passo precisam ser idênticas em todas as taxas; o script termina
+com código 1 se alguma divergir.
+
+Para comparação, a coluna "dt variável" mostra quanto tempo de animação o
+loop antigo (dt do quadro limitado a 1/30 s) teria simulado no mesmo
+intervalo.
+
+Em seguida verifica o modo ocioso (espera por eventos): inicia uma partida
+pela tela de seleção de nível, com quadros de 1 ms, e confere que a lógica
+roda depois de cada evento -- os blocos em comparação ficam com a cor de
+destaque, antes e depois de um clique na resposta certa, com ou sem a
+espera ociosa.
+
+Uso:
+    python benchmarks/verificar_passo_fixo.py
+    python benchmarks/verificar_passo_fixo.py --segundos 5 --taxas 15 60 240
+"""
+
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+# Adicionar a raiz do projeto ao path para importações
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.game.manager import GameManager  # noqa: E402
+from src.game.relogio import RelogioPassoFixo  # noqa: E402
+from src.utils.config import AGENDADOR, CORES  # noqa: E402
+
+# Quadros rápidos no teste do modo ocioso: o quadro que trata um evento dura poucos ms
+INTERVALO_OCIOSO = 0.001
+
+
+class RelogioFalso:
+    """Fonte de tempo controlada pelo script"""
+
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+class JogoAmostrado(GameManager):
+    """GameManager que registra o estado do menu depois de cada passo de lógica"""
+
+    def __init__(self):
+        self.amostras = []
+        super().__init__()
+
+    def atualizar(self, dt: float):
+        super().atualizar(dt)
+        menu = self.gerenciador_estados.estado_atual
+        self.amostras.append((
+            menu.tempo_animacao,
+            tuple(menu.particulas.y.tolist()),
+            menu.botoes[0].escala,
+        ))
+
+
+def simular(intervalos, segundos: float, semente: int) -> dict:
+    """Roda o menu pelo tempo pedido com os intervalos entre quadros dados"""
+    random.seed(semente)  # Partículas do menu
+    relogio_falso = RelogioFalso()
+
+    jogo = JogoAmostrado()
+    jogo.relogio = RelogioPassoFixo(fonte_tempo=relogio_falso)
+    jogo.fps_maximo = 0  # O relógio falso dita o ritmo: clock.tick não deve dormir
+    jogo.esperar_ocioso = False
+
+    # Mouse sobre o primeiro botão: inicia a animação de hover
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=jogo.gerenciador_estados
+                                         .estado_atual.botoes[0].rect.center,
+                                         rel=(0, 0), buttons=(0, 0, 0)))
+
+    quadros = 0
+    tempo_dt_variavel = 0.0
+    alfa_maximo = 0.0
+    while relogio_falso.agora < segundos:
+        intervalo = next(intervalos)
+        relogio_falso.agora += intervalo
+        tempo_dt_variavel += min(intervalo, 1.0 / 30.0)
+        jogo.executar_quadro()
+        alfa_maximo = max(alfa_maximo, jogo.relogio.alfa)
+        quadros += 1
+
+    return {
+        'quadros': quadros,
+        'passos': jogo.relogio.passos_executados,
+        'amostras': jogo.amostras,
+        'tempo_dt_variavel': tempo_dt_variavel,
+        'alfa_maximo': alfa_maximo,
+    }
+
+
+class JogoContado(GameManager):
+    """GameManager que conta os passos de lógica executados"""
+
+    def __init__(self):
+        self.passos_logica = 0
+        super().__init__()
+
+    def atualizar(self, dt: float):
+        super().atualizar(dt)
+        self.passos_logica += 1
+
+
+def verificar_ocioso(esperar_ocioso: bool, quadros: int, semente: int) -> dict:
+    """Inicia uma partida e responde uma comparação; retorna se os blocos ficaram destacados"""
+    random.seed(semente)  # Lista da partida
+    relogio_falso = RelogioFalso()
+
+    jogo = JogoContado()
+    jogo.relogio = RelogioPassoFixo(fonte_tempo=relogio_falso)
+    jogo.fps_maximo = 0
+    jogo.esperar_ocioso = esperar_ocioso
+
+    def rodar():
+        for _ in range(quadros):
+            relogio_falso.agora += INTERVALO_OCIOSO
+            jogo.executar_quadro()
+
+    def blocos_destacados() -> bool:
+        blocos = jogo.gerenciador_estados.estado_atual.blocos_numeros
+        return bool(blocos) and all(bloco.cor_atual == CORES['SUCESSO'] for bloco in blocos)
+
+    # Nível fácil pela tecla 1, como o jogador faria
+    jogo.gerenciador_estados.mudar_estado('selecao_nivel')
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_1, mod=0,
+                                         unicode='1', scancode=0))
+    rodar()
+    destacados_inicio = blocos_destacados()
+
+    # Clique no menor número: os blocos da comparação seguinte são novos
+    estado = jogo.gerenciador_estados.estado_atual
+    menor = min(estado.blocos_numeros, key=lambda bloco: bloco.numero)
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=menor.rect.center, button=1))
+    rodar()
+
+    return {
+        'passos': jogo.passos_logica,
+        'destacados_inicio': destacados_inicio,
+        'destacados_clique': blocos_destacados(),
+    }
+
+
+def intervalos_fixos(fps: float):
+    while True:
+        yield 1.0 / fps
+
+
+def intervalos_irregulares(semente: int):
+    """Quadros entre 4 ms e 50 ms, como um jogo com travadas ocasionais"""
+    rng = random.Random(semente)
+    while True:
+        yield rng.uniform(0.004, 0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--taxas', nargs='+', type=float, default=[20, 30, 60, 144, 240],
+                        help='taxas de renderização (quadros por segundo)')
+    parser.add_argument('--segundos', type=float, default=2.0)
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--quadros-ocioso', type=int, default=20,
+                        help='quadros de 1 ms após cada evento no teste do modo ocioso')
+    args = parser.parse_args()
+
+    cenarios = [(f"{taxa:g} FPS", intervalos_fixos(taxa)) for taxa in args.taxas]
+    cenarios.append(("irregular", intervalos_irregulares(args.semente)))
+    resultados = [(nome, simular(intervalos, args.segundos, args.semente)) for nome, intervalos in cenarios]
+
+    # Compara até o passo que todas as execuções alcançaram
+    passos_comuns = min(len(resultado['amostras']) for _, resultado in resultados)
+    referencia = resultados[0][1]['amostras'][:passos_comuns]
+
+    print(f"{'renderização':<14}{'quadros':>9}{'passos':>8}{'tempo animado':>15}"
+          f"{'dt variável':>13}{'alfa máx':>10}  amostras")
+    divergentes = []
+    for nome, resultado in resultados:
+        amostras = resultado['amostras'][:passos_comuns]
+        identico = amostras == referencia
+        if not identico:
+            divergentes.append(nome)
+        print(f"{nome:<14}{resultado['quadros']:>9}{resultado['passos']:>8}"
+              f"{amostras[-1][0]:>14.3f}s{resultado['tempo_dt_variavel']:>12.3f}s"
+              f"{resultado['alfa_maximo']:>10.3f}  {'idênticas' if identico else 'DIVERGEM'}")
+
+    print(f"\n{passos_comuns} passos comparados (tempo de animação, partículas e hover do botão)")
+
+    # Sem eventos, a espera ociosa só acorda no timeout: 1 ms para o teste não demorar
+    AGENDADOR['TIMEOUT_OCIOSO_MS'] = 1
+    print(f"\n{'modo':<14}{'quadros':>9}{'passos':>8}  blocos destacados (início / após clique)")
+    sem_logica = []
+    for nome, esperar_ocioso in (("ocioso", True), ("contínuo", False)):
+        resultado = verificar_ocioso(esperar_ocioso, args.quadros_ocioso, args.semente)
+        ok = resultado['destacados_inicio'] and resultado['destacados_clique']
+        if not ok:
+            sem_logica.append(nome)
+        print(f"{nome:<14}{2 * args.quadros_ocioso:>9}{resultado['passos']:>8}  "
+              f"{'sim' if resultado['destacados_inicio'] else 'NÃO'} / "
+              f"{'sim' if resultado['destacados_clique'] else 'NÃO'}")
+
+    if divergentes:
+        print(f"Animação dependente da taxa de quadros: {', '.join(divergentes)}")
+    if sem_logica:
+        print(f"Eventos sem passo de lógica: {', '.join(sem_logica)}")
+    if divergentes or sem_logica:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,71 @@
 """
 Módulo de algoritmos para o jogo Merge_Mind
 Implementa algoritmos de dividir e conquistar de forma educativa
+
+Os motores são carregados sob demanda: importar este pacote não importa
+NumPy nem os módulos dos algoritmos, apenas o registro.
 """
 
-from .merge_sort import MergeSortEducativo
-from .quick_sort import QuickSortEducativo  
-from .binary_search import BinarySearchEducativo
+import importlib
+
+from .base import MotorBase, ContadorCustos
+from .registro import RegistroAlgoritmos, registro, criar_motor
+
+# Nome exportado -> módulo que o define (importado no primeiro acesso)
+_EXPORTACOES_PREGUICOSAS = {
+    'MergeSortEducativo': 'merge_sort',
+    'contar_inversoes': 'merge_sort',
+    'QuickSortEducativo': 'quick_sort',
+    'BinarySearchEducativo': 'binary_search',
+    'BuscaEytzinger': 'eytzinger',
+    'ArquivoOrdenadoMapeado': 'fonte_mapeada',
+    'criar_arquivo_ordenado': 'fonte_mapeada',
+    'BuscaParametrica': 'busca_parametrica',
+    'CascataFracionaria': 'cascata_fracionaria',
+    'QuickSelectEducativo': 'quick_select',
+    'EstrategiaPivot': 'quick_select',
+    'ParMaisProximoEducativo': 'par_mais_proximo',
+    'KaratsubaEducativo': 'karatsuba',
+    'StrassenEducativo': 'strassen',
+    'SubarrayMaximoEducativo': 'subarray_maximo',
+    'ModoSubarray': 'subarray_maximo',
+}
+
+
+def __getattr__(nome: str):
+    modulo = _EXPORTACOES_PREGUICOSAS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+    valor = getattr(importlib.import_module(f'.{modulo}', __name__), nome)
+    globals()[nome] = valor  # Próximos acessos não passam por aqui
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTACOES_PREGUICOSAS))
+
 
 __all__ = [
+    'MotorBase',
+    'ContadorCustos',
+    'RegistroAlgoritmos',
+    'registro',
+    'criar_motor',
     'MergeSortEducativo',
-    'QuickSortEducativo', 
-    'BinarySearchEducativo'
+    'contar_inversoes',
+    'QuickSortEducativo',
+    'BinarySearchEducativo',
+    'BuscaEytzinger',
+    'ArquivoOrdenadoMapeado',
+    'criar_arquivo_ordenado',
+    'BuscaParametrica',
+    'CascataFracionaria',
+    'QuickSelectEducativo',
+    'EstrategiaPivot',
+    'ParMaisProximoEducativo',
+    'KaratsubaEducativo',
+    'StrassenEducativo',
+    'SubarrayMaximoEducativo',
+    'ModoSubarray'
 ]
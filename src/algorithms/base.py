@@ -0,0 +1,118 @@
+"""
+Base comum dos motores educativos
+Modelo de custos único para comparar algoritmos entre si
+"""
+
+from typing import Callable, Optional
+
+
+class ContadorCustos:
+    """
+    Contabilidade de custos de um algoritmo.
+
+    Conta comparações, trocas, leituras e escritas de elementos, passos
+    executados e o pico de elementos auxiliares em uso (buffers de fusão,
+    pilhas de recursão, caches). Uma troca também conta duas leituras e duas
+    escritas. Os contadores são inteiros simples em __slots__, baratos o
+    bastante para serem atualizados a cada operação.
+    """
+
+    __slots__ = ('comparacoes', 'trocas', 'leituras', 'escritas', 'passos',
+                 'auxiliar_atual', 'pico_auxiliar')
+
+    def __init__(self):
+        self.zerar()
+
+    def zerar(self) -> None:
+        """Zera todos os contadores"""
+        self.comparacoes = 0
+        self.trocas = 0
+        self.leituras = 0
+        self.escritas = 0
+        self.passos = 0
+        self.auxiliar_atual = 0
+        self.pico_auxiliar = 0
+
+    def comparar(self, quantidade: int = 1) -> None:
+        """Registra comparações entre elementos"""
+        self.comparacoes += quantidade
+
+    def trocar(self, quantidade: int = 1) -> None:
+        """Registra trocas (cada uma lê e escreve duas posições)"""
+        self.trocas += quantidade
+        self.leituras += 2 * quantidade
+        self.escritas += 2 * quantidade
+
+    def ler(self, quantidade: int = 1) -> None:
+        """Registra leituras de elementos"""
+        self.leituras += quantidade
+
+    def escrever(self, quantidade: int = 1) -> None:
+        """Registra escritas de elementos"""
+        self.escritas += quantidade
+
+    def passo(self) -> None:
+        """Registra um passo executado"""
+        self.passos += 1
+
+    def alocar(self, quantidade: int) -> None:
+        """Registra elementos auxiliares alocados"""
+        self.auxiliar_atual += quantidade
+        if self.auxiliar_atual > self.pico_auxiliar:
+            self.pico_auxiliar = self.auxiliar_atual
+
+    def liberar(self, quantidade: int) -> None:
+        """Registra elementos auxiliares liberados"""
+        self.auxiliar_atual = max(0, self.auxiliar_atual - quantidade)
+
+    def observar_auxiliar(self, quantidade: int) -> None:
+        """Define o uso auxiliar atual (ex.: tamanho de uma pilha)"""
+        self.auxiliar_atual = quantidade
+        if quantidade > self.pico_auxiliar:
+            self.pico_auxiliar = quantidade
+
+    def como_dict(self) -> dict:
+        """Retorna os contadores como dicionário"""
+        return {
+            'comparacoes': self.comparacoes,
+            'trocas': self.trocas,
+            'leituras': self.leituras,
+            'escritas': self.escritas,
+            'passos': self.passos,
+            'auxiliar_atual': self.auxiliar_atual,
+            'pico_auxiliar': self.pico_auxiliar
+        }
+
+
+class MotorBase:
+    """
+    Base dos motores educativos (Merge Sort, Quick Sort, Binary Search, ...).
+
+    Guarda o callback de visualização e o ContadorCustos em `custos`. Os nomes
+    antigos `comparacoes_realizadas` e `trocas_realizadas` continuam
+    disponíveis como propriedades sobre o contador.
+    """
+
+    def __init__(self, callback_visual: Optional[Callable] = None):
+        self.callback_visual = callback_visual
+        self.custos = ContadorCustos()
+
+    @property
+    def comparacoes_realizadas(self) -> int:
+        return self.custos.comparacoes
+
+    @comparacoes_realizadas.setter
+    def comparacoes_realizadas(self, valor: int) -> None:
+        self.custos.comparacoes = valor
+
+    @property
+    def trocas_realizadas(self) -> int:
+        return self.custos.trocas
+
+    @trocas_realizadas.setter
+    def trocas_realizadas(self, valor: int) -> None:
+        self.custos.trocas = valor
+
+    def obter_custos(self) -> dict:
+        """Retorna os custos acumulados no modelo comum"""
+        return self.custos.como_dict()
@@ -4,8 +4,10 @@ Com visualização e interação para fins didáticos
 """
 
 import copy
-from typing import List, Tuple, Optional, Callable
+from typing import List, Tuple, Optional, Callable, Union
 from enum import Enum
+from .base import MotorBase
+from .fonte_mapeada import ArquivoOrdenadoMapeado
 
 
 class FaseBinarySearch(Enum):
@@ -16,17 +18,23 @@ class FaseBinarySearch(Enum):
     NAO_ENCONTRADO = "nao_encontrado"
 
 
-class BinarySearchEducativo:
+class BinarySearchEducativo(MotorBase):
     """
     Implementação educativa do Binary Search com suporte a visualização
     e interação do usuário durante o processo de busca
     """
     
-    def __init__(self, lista_ordenada: List[int], valor_busca: int, 
-                 callback_visual: Optional[Callable] = None):
-        self.lista_original = copy.deepcopy(lista_ordenada)
+    def __init__(self, lista_ordenada: Union[List[int], ArquivoOrdenadoMapeado],
+                 valor_busca: int, callback_visual: Optional[Callable] = None):
+        super().__init__(callback_visual)
+        # Arquivos mapeados não são copiados: só as páginas lidas vão para a memória
+        self.fonte_mapeada = isinstance(lista_ordenada, ArquivoOrdenadoMapeado)
+        if self.fonte_mapeada:
+            self.lista_original = lista_ordenada
+            self.lista_original.iniciar_consulta()
+        else:
+            self.lista_original = copy.deepcopy(lista_ordenada)
         self.valor_busca = valor_busca
-        self.callback_visual = callback_visual
         
         # Estado atual da busca
         self.fase_atual = FaseBinarySearch.INICIALIZACAO
@@ -59,7 +67,8 @@ class BinarySearchEducativo:
         
         if self.callback_visual:
             self.callback_visual('inicializar_busca', {
-                'lista': copy.deepcopy(self.lista_original),
+                'lista': (self.lista_original if self.fonte_mapeada
+                          else copy.deepcopy(self.lista_original)),
                 'valor_busca': self.valor_busca,
                 'inicio': self.inicio,
                 'fim': self.fim
@@ -67,6 +76,8 @@ class BinarySearchEducativo:
     
     def proximo_passo(self) -> bool:
         """Executa o próximo passo do algoritmo"""
+        self.custos.passo()
+        
         if self.fase_atual == FaseBinarySearch.INICIALIZACAO:
             self.inicializar()
             return True
@@ -91,6 +102,7 @@ class BinarySearchEducativo:
         self.meio = (self.inicio + self.fim) // 2
         self.iteracoes += 1
         valor_meio = self.lista_original[self.meio]
+        self.custos.ler()
         
         # Registrar intervalo atual
         self.historico_intervalos.append({
@@ -140,6 +152,7 @@ class BinarySearchEducativo:
         if self.fase_atual != FaseBinarySearch.BUSCA:
             return False, "Não é possível fazer decisão neste momento"
         
+        self.custos.passo()
         valor_meio = self.lista_original[self.meio]
         
         # Determinar direção correta
@@ -210,7 +223,7 @@ class BinarySearchEducativo:
         import math
         complexidade_teorica = math.ceil(math.log2(len(self.lista_original))) if self.lista_original else 0
         
-        return {
+        estatisticas = {
             'fase_atual': self.fase_atual.value,
             'iteracoes': self.iteracoes,
             'comparacoes_realizadas': self.comparacoes_realizadas,
@@ -218,10 +231,17 @@ class BinarySearchEducativo:
             'precisao': round(precisao, 2),
             'complexidade_teorica': complexidade_teorica,
             'eficiencia': round((complexidade_teorica / max(self.iteracoes, 1)) * 100, 2),
+            'custos': self.obter_custos(),
             'valor_encontrado': self.posicao_encontrada != -1,
             'posicao_encontrada': self.posicao_encontrada if self.posicao_encontrada != -1 else None,
             'esta_completo': self.fase_atual in [FaseBinarySearch.ENCONTRADO, FaseBinarySearch.NAO_ENCONTRADO]
         }
+        
+        # Páginas e bytes tocados pela consulta (apenas para arquivos mapeados)
+        if self.fonte_mapeada:
+            estatisticas['acesso_memoria'] = self.lista_original.obter_estatisticas_acesso()
+        
+        return estatisticas
     
     def obter_resultado_final(self) -> Optional[dict]:
         """Retorna o resultado final se a busca estiver completa"""
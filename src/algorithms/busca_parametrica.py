@@ -0,0 +1,317 @@
+"""
+Implementação educativa da "busca binária na resposta" (busca paramétrica)
+Bissecta um predicado monótono em vez de um array, com cache dos resultados
+"""
+
+import copy
+import math
+from typing import Callable, Dict, Optional, Tuple, Union
+from enum import Enum
+
+from .base import MotorBase
+
+
+Numero = Union[int, float]
+
+
+class FaseBuscaParametrica(Enum):
+    """Fases da busca paramétrica"""
+    INICIALIZACAO = "inicializacao"
+    BUSCA = "busca"
+    ENCONTRADO = "encontrado"
+    NAO_ENCONTRADO = "nao_encontrado"
+
+
+class BuscaParametrica(MotorBase):
+    """
+    Busca o menor valor x em [inicio, fim] para o qual predicado(x) é verdadeiro.
+
+    O predicado deve ser monótono (falso ... falso, verdadeiro ... verdadeiro),
+    como "a capacidade x é suficiente?" ou "x * x >= 2?". Com limites inteiros a
+    busca é exata; com limites reais ela para quando o intervalo fica menor que
+    `tolerancia` (relativa à magnitude dos limites, quando ela passa de 1) ou
+    quando não há mais ponto flutuante entre eles. Cada avaliação é memorizada,
+    e o cache sobrevive a `reiniciar`, de modo que predicados caros nunca são
+    avaliados duas vezes no mesmo ponto.
+    """
+
+    def __init__(self, predicado: Callable[[Numero], bool], inicio: Numero, fim: Numero,
+                 tolerancia: Optional[float] = None,
+                 callback_visual: Optional[Callable] = None,
+                 cache: Optional[Dict[Numero, bool]] = None):
+        super().__init__(callback_visual)
+        self.predicado = predicado
+        self.inicio_original = inicio
+        self.fim_original = fim
+
+        # Limites inteiros sem tolerância => busca discreta exata
+        self.modo_inteiro = (tolerancia is None and
+                             isinstance(inicio, int) and isinstance(fim, int))
+        self.tolerancia = tolerancia if tolerancia is not None else 1e-6
+
+        # Estado atual da busca
+        self.fase_atual = FaseBuscaParametrica.INICIALIZACAO
+        self.inicio = inicio
+        self.fim = fim
+        self.meio = inicio
+        self.resultado_meio = False
+        self.resposta: Optional[Numero] = None
+
+        # Cache de avaliações do predicado
+        self._cache: Dict[Numero, bool] = cache if cache is not None else {}
+
+        # Estatísticas
+        self.iteracoes = 0
+        self.decisoes_corretas = 0
+        self.avaliacoes_solicitadas = 0
+        self.chamadas_predicado = 0
+        self.acertos_cache = 0
+
+        # Histórico
+        self.historico_avaliacoes = []
+        self.historico_intervalos = []
+
+    def inicializar(self) -> None:
+        """Inicializa o processo de busca"""
+        self.fase_atual = FaseBuscaParametrica.BUSCA
+        self.inicio = self.inicio_original
+        self.fim = self.fim_original
+
+        self.historico_intervalos.append({
+            'inicio': self.inicio,
+            'fim': self.fim,
+            'iteracao': self.iteracoes
+        })
+
+        if self.callback_visual:
+            self.callback_visual('inicializar_busca', {
+                'inicio': self.inicio,
+                'fim': self.fim,
+                'modo_inteiro': self.modo_inteiro
+            })
+
+    def proximo_passo(self) -> bool:
+        """Executa o próximo passo do algoritmo"""
+        self.custos.passo()
+
+        if self.fase_atual == FaseBuscaParametrica.INICIALIZACAO:
+            self.inicializar()
+            return True
+
+        elif self.fase_atual == FaseBuscaParametrica.BUSCA:
+            return self._executar_iteracao_busca()
+
+        return False
+
+    def avaliar(self, valor: Numero) -> bool:
+        """Avalia o predicado em `valor`, usando o cache quando possível"""
+        self.avaliacoes_solicitadas += 1
+        self.custos.comparar()
+
+        if valor in self._cache:
+            self.acertos_cache += 1
+            return self._cache[valor]
+
+        # Avaliar o predicado é a "leitura" do espaço de busca; o cache é memória auxiliar
+        self.chamadas_predicado += 1
+        self.custos.ler()
+        resultado = bool(self.predicado(valor))
+        self._cache[valor] = resultado
+        self.custos.escrever()
+        self.custos.alocar(1)
+
+        self.historico_avaliacoes.append({
+            'valor': valor,
+            'resultado': resultado,
+            'iteracao': self.iteracoes
+        })
+        return resultado
+
+    def _limiar_convergencia(self, inicio: float, fim: float) -> float:
+        """Largura abaixo da qual o intervalo real é considerado convergido"""
+        return self.tolerancia * max(1.0, abs(inicio), abs(fim))
+
+    def _intervalo_convergiu(self) -> bool:
+        """Verifica se o intervalo já não pode ser dividido"""
+        if self.modo_inteiro:
+            return self.inicio >= self.fim
+        if self.fim - self.inicio <= self._limiar_convergencia(self.inicio, self.fim):
+            return True
+
+        # Limites vizinhos (a um ulp): o ponto médio cairia sobre um deles para sempre
+        meio = (self.inicio + self.fim) / 2
+        return meio <= self.inicio or meio >= self.fim
+
+    def _executar_iteracao_busca(self) -> bool:
+        """Executa uma iteração da busca"""
+        if self.inicio > self.fim:
+            return self._finalizar(None)
+
+        if self._intervalo_convergiu():
+            # O candidato é o limite direito (no modo inteiro, inicio == fim)
+            candidato = self.fim
+            return self._finalizar(candidato if self.avaliar(candidato) else None)
+
+        if self.modo_inteiro:
+            self.meio = (self.inicio + self.fim) // 2
+        else:
+            self.meio = (self.inicio + self.fim) / 2
+        self.iteracoes += 1
+        self.resultado_meio = self.avaliar(self.meio)
+
+        self.historico_intervalos.append({
+            'inicio': self.inicio,
+            'fim': self.fim,
+            'meio': self.meio,
+            'resultado_meio': self.resultado_meio,
+            'iteracao': self.iteracoes
+        })
+
+        if self.callback_visual:
+            self.callback_visual('nova_iteracao', {
+                'inicio': self.inicio,
+                'fim': self.fim,
+                'meio': self.meio,
+                'resultado_meio': self.resultado_meio,
+                'iteracao': self.iteracoes
+            })
+
+        return True
+
+    def _finalizar(self, resposta: Optional[Numero]) -> bool:
+        """Encerra a busca com a resposta encontrada (ou None)"""
+        self.resposta = resposta
+
+        if resposta is not None:
+            self.fase_atual = FaseBuscaParametrica.ENCONTRADO
+            if self.callback_visual:
+                self.callback_visual('valor_encontrado', {
+                    'resposta': resposta,
+                    'iteracoes': self.iteracoes
+                })
+        else:
+            self.fase_atual = FaseBuscaParametrica.NAO_ENCONTRADO
+            if self.callback_visual:
+                self.callback_visual('valor_nao_encontrado', {
+                    'iteracoes': self.iteracoes
+                })
+        return False
+
+    def fazer_decisao_direcao(self, buscar_esquerda: bool) -> Tuple[bool, str]:
+        """
+        Usuário decide em qual metade está a resposta
+
+        Args:
+            buscar_esquerda: True se a resposta está em [inicio, meio], False se está à direita
+
+        Returns:
+            Tuple[bool, str]: (decisao_correta, mensagem_feedback)
+        """
+        if self.fase_atual != FaseBuscaParametrica.BUSCA or self.iteracoes == 0:
+            return False, "Não é possível fazer decisão neste momento"
+
+        self.custos.passo()
+
+        if self.resultado_meio:
+            mensagem_correta = f"P({self.meio}) é verdadeiro, a resposta está à esquerda"
+        else:
+            mensagem_correta = f"P({self.meio}) é falso, a resposta está à direita"
+
+        decisao_correta = buscar_esquerda == self.resultado_meio
+
+        if decisao_correta:
+            self.decisoes_corretas += 1
+            mensagem = f"Correto! {mensagem_correta}"
+        else:
+            mensagem = f"Ops! {mensagem_correta}"
+
+        # Atualizar intervalo independentemente da decisão do usuário
+        if self.resultado_meio:
+            self.fim = self.meio
+        elif self.modo_inteiro:
+            self.inicio = self.meio + 1
+        else:
+            self.inicio = self.meio
+
+        if self.callback_visual:
+            self.callback_visual('decisao_direcao', {
+                'decisao_correta': decisao_correta,
+                'mensagem': mensagem,
+                'novo_inicio': self.inicio,
+                'novo_fim': self.fim,
+                'resultado_meio': self.resultado_meio
+            })
+
+        return decisao_correta, mensagem
+
+    def obter_proxima_comparacao(self) -> Optional[Tuple[Numero, bool]]:
+        """
+        Retorna o ponto avaliado na iteração atual
+
+        Returns:
+            Tuple: (meio, predicado(meio)) ou None
+        """
+        if self.fase_atual == FaseBuscaParametrica.BUSCA and self.iteracoes > 0:
+            return (self.meio, self.resultado_meio)
+        return None
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas do processo de busca"""
+        precisao = (self.decisoes_corretas / self.iteracoes * 100
+                    if self.iteracoes > 0 else 0)
+
+        # Iterações esperadas para reduzir o intervalo ao mínimo
+        largura = self.fim_original - self.inicio_original
+        if self.modo_inteiro:
+            complexidade_teorica = math.ceil(math.log2(largura + 1)) if largura > 0 else 0
+        else:
+            # Pior caso: resposta na menor magnitude do intervalo, onde o limiar
+            # relativo é menor (nunca abaixo do espaçamento dos floats ali)
+            if self.inicio_original <= 0 <= self.fim_original:
+                menor_magnitude = 0.0
+            else:
+                menor_magnitude = min(abs(self.inicio_original), abs(self.fim_original))
+            limiar = max(self._limiar_convergencia(menor_magnitude, menor_magnitude),
+                         math.ulp(menor_magnitude))
+            complexidade_teorica = math.ceil(math.log2(largura / limiar)) if largura > limiar else 0
+
+        taxa_acerto_cache = (self.acertos_cache / self.avaliacoes_solicitadas * 100
+                             if self.avaliacoes_solicitadas > 0 else 0)
+
+        return {
+            'fase_atual': self.fase_atual.value,
+            'iteracoes': self.iteracoes,
+            'decisoes_corretas': self.decisoes_corretas,
+            'precisao': round(precisao, 2),
+            'complexidade_teorica': complexidade_teorica,
+            'avaliacoes_solicitadas': self.avaliacoes_solicitadas,
+            'chamadas_predicado': self.chamadas_predicado,
+            'acertos_cache': self.acertos_cache,
+            'taxa_acerto_cache': round(taxa_acerto_cache, 2),
+            'tamanho_cache': len(self._cache),
+            'custos': self.obter_custos(),
+            'resposta': self.resposta,
+            'esta_completo': self.fase_atual in [FaseBuscaParametrica.ENCONTRADO,
+                                                 FaseBuscaParametrica.NAO_ENCONTRADO]
+        }
+
+    def obter_resultado_final(self) -> Optional[dict]:
+        """Retorna o resultado final se a busca estiver completa"""
+        if self.fase_atual in [FaseBuscaParametrica.ENCONTRADO, FaseBuscaParametrica.NAO_ENCONTRADO]:
+            return {
+                'encontrado': self.fase_atual == FaseBuscaParametrica.ENCONTRADO,
+                'resposta': self.resposta,
+                'iteracoes': self.iteracoes,
+                'chamadas_predicado': self.chamadas_predicado,
+                'historico': copy.deepcopy(self.historico_intervalos)
+            }
+        return None
+
+    def reiniciar(self, novo_inicio: Optional[Numero] = None,
+                  novo_fim: Optional[Numero] = None) -> None:
+        """Reinicia a busca mantendo o cache de avaliações do predicado"""
+        inicio = novo_inicio if novo_inicio is not None else self.inicio_original
+        fim = novo_fim if novo_fim is not None else self.fim_original
+        tolerancia = None if self.modo_inteiro else self.tolerancia
+        self.__init__(self.predicado, inicio, fim, tolerancia,
+                      self.callback_visual, self._cache)
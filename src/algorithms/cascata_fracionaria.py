@@ -0,0 +1,134 @@
+"""
+Cascata fracionária (fractional cascading)
+Localiza uma chave em k listas ordenadas em O(k + log n) em vez de O(k log n)
+"""
+
+import math
+from bisect import bisect_left
+from typing import List, Sequence
+
+
+def _limites_inferiores(consultas_ordenadas: Sequence, alvo: Sequence) -> List[int]:
+    """
+    Calcula bisect_left(alvo, v) para cada v de uma sequência já ordenada.
+
+    Percorre as duas sequências juntas (como na fusão do merge sort), em tempo
+    linear. Acrescenta ao final a posição sentinela len(alvo).
+    """
+    posicoes = []
+    j = 0
+    tamanho = len(alvo)
+    for valor in consultas_ordenadas:
+        while j < tamanho and alvo[j] < valor:
+            j += 1
+        posicoes.append(j)
+    posicoes.append(tamanho)
+    return posicoes
+
+
+class CascataFracionaria:
+    """
+    Índice de cascata fracionária sobre uma sequência de listas ordenadas.
+
+    A lista aumentada M[i] é a fusão de L[i] com um a cada dois elementos de
+    M[i+1]. Para cada posição de M[i] guardamos onde ela cai em L[i] e em
+    M[i+1]. Assim, uma única busca binária em M[0] basta: cada lista seguinte
+    é alcançada seguindo o ponteiro e recuando no máximo uma posição.
+    """
+
+    def __init__(self, listas: Sequence[Sequence]):
+        self.listas = [list(lista) for lista in listas]
+        self.k = len(self.listas)
+
+        # Estatísticas
+        self.consultas_realizadas = 0
+        self.comparacoes_realizadas = 0
+        self.comparacoes_ultima_consulta = 0
+
+        self.aumentadas: List[list] = [[] for _ in range(self.k)]
+        self.posicao_na_lista: List[List[int]] = [[] for _ in range(self.k)]
+        self.posicao_na_proxima: List[List[int]] = [[] for _ in range(self.k)]
+        self._construir()
+
+    @classmethod
+    def a_partir_do_merge_sort(cls, motor) -> 'CascataFracionaria':
+        """Constrói o índice sobre as sublistas ordenadas de um MergeSortEducativo
+
+        Usa obter_sublistas(): no meio de um nível, `motor.sublistas` ainda
+        guarda as sublistas que já foram fundidas.
+        """
+        return cls(motor.obter_sublistas())
+
+    def _construir(self) -> None:
+        """Constrói as listas aumentadas de trás para frente"""
+        if self.k == 0:
+            return
+
+        ultima = self.k - 1
+        self.aumentadas[ultima] = list(self.listas[ultima])
+
+        for i in range(ultima - 1, -1, -1):
+            promovidos = self.aumentadas[i + 1][1::2]
+            # sorted() detecta as duas sequências já ordenadas: fusão linear
+            self.aumentadas[i] = sorted(self.listas[i] + promovidos)
+            self.posicao_na_proxima[i] = _limites_inferiores(
+                self.aumentadas[i], self.aumentadas[i + 1])
+
+        for i in range(self.k):
+            self.posicao_na_lista[i] = _limites_inferiores(
+                self.aumentadas[i], self.listas[i])
+
+    def buscar(self, valor) -> List[int]:
+        """
+        Localiza `valor` em todas as listas
+
+        Returns:
+            List[int]: para cada lista i, a posição bisect_left(listas[i], valor)
+        """
+        if self.k == 0:
+            return []
+
+        primeira = self.aumentadas[0]
+        p = bisect_left(primeira, valor)
+        comparacoes = math.ceil(math.log2(len(primeira) + 1))
+        posicoes = [self.posicao_na_lista[0][p]]
+
+        for i in range(self.k - 1):
+            proxima = self.aumentadas[i + 1]
+            q = self.posicao_na_proxima[i][p]
+
+            # A posição real é o ponteiro ou a imediatamente anterior
+            if q > 0:
+                comparacoes += 1
+                if proxima[q - 1] >= valor:
+                    q -= 1
+
+            posicoes.append(self.posicao_na_lista[i + 1][q])
+            p = q
+
+        self.consultas_realizadas += 1
+        self.comparacoes_ultima_consulta = comparacoes
+        self.comparacoes_realizadas += comparacoes
+        return posicoes
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas do índice e das consultas"""
+        elementos = sum(len(lista) for lista in self.listas)
+        elementos_aumentados = sum(len(lista) for lista in self.aumentadas)
+        media = (self.comparacoes_realizadas / self.consultas_realizadas
+                 if self.consultas_realizadas > 0 else 0)
+
+        # Custo de k buscas binárias independentes, para comparação
+        comparacoes_bisect = sum(math.ceil(math.log2(len(lista) + 1))
+                                 for lista in self.listas)
+
+        return {
+            'listas': self.k,
+            'elementos': elementos,
+            'elementos_aumentados': elementos_aumentados,
+            'fator_memoria': round(elementos_aumentados / elementos, 2) if elementos else 0,
+            'consultas_realizadas': self.consultas_realizadas,
+            'comparacoes_realizadas': self.comparacoes_realizadas,
+            'comparacoes_por_consulta': round(media, 2),
+            'comparacoes_bisect_independente': comparacoes_bisect
+        }
@@ -0,0 +1,207 @@
+"""
+Busca binária sobre o layout de Eytzinger (ordem de busca em largura)
+Versão amigável à cache para arrays grandes, com consultas sem desvios em NumPy
+"""
+
+from typing import List, Sequence, Union
+
+import numpy as np
+
+
+# Tamanho de uma linha de cache típica (bytes)
+LINHA_CACHE = 64
+
+
+def _alocar_alinhado(tamanho: int, dtype: np.dtype, alinhamento: int = LINHA_CACHE) -> np.ndarray:
+    """
+    Aloca um array cujo primeiro elemento começa em um limite de linha de cache.
+
+    Com o índice 0 alinhado, os 2^k descendentes de um nó k níveis abaixo
+    ocupam posições contíguas que caem em uma única linha de cache.
+    """
+    dtype = np.dtype(dtype)
+    bruto = np.empty(tamanho * dtype.itemsize + alinhamento, dtype=np.uint8)
+    deslocamento = (-bruto.ctypes.data) % alinhamento
+    return bruto[deslocamento:deslocamento + tamanho * dtype.itemsize].view(dtype)
+
+
+def _sentinela(dtype: np.dtype) -> Union[int, float]:
+    """Retorna o maior valor representável no dtype (usado como preenchimento)"""
+    if np.issubdtype(dtype, np.integer):
+        return np.iinfo(dtype).max
+    return np.inf
+
+
+class BuscaEytzinger:
+    """
+    Busca binária sobre um array ordenado reorganizado no layout de Eytzinger.
+
+    O layout é construído uma única vez: o nó k tem filhos em 2k e 2k+1, de modo
+    que os primeiros níveis da árvore ficam juntos na memória e cada passo da
+    busca desce para uma região previsível. As consultas em lote avançam todas
+    as chaves juntas, um nível por iteração, sem desvios condicionais.
+    """
+
+    def __init__(self, lista_ordenada: Sequence, alinhar_cache: bool = False,
+                 tamanho_lote: int = 1 << 16):
+        valores = np.asarray(lista_ordenada)
+        if valores.ndim != 1:
+            raise ValueError("A lista ordenada deve ser unidimensional")
+
+        self.n = len(valores)
+        self.alinhar_cache = alinhar_cache
+        self.tamanho_lote = max(1, tamanho_lote)
+
+        # Altura da árvore completa: nós 1..n ficam nos níveis 0..altura-1
+        self.altura = self.n.bit_length()
+
+        # Estatísticas
+        self.consultas_realizadas = 0
+        self.comparacoes_realizadas = 0
+
+        self.layout, self.posicao_ordenada, self.indice_layout = \
+            self._construir_layout(valores)
+
+    def _construir_layout(self, valores: np.ndarray):
+        """
+        Constrói o layout de Eytzinger de forma vetorizada.
+
+        Calcula a posição em ordem simétrica de cada nó de uma árvore perfeita
+        de 2^altura - 1 nós, descarta os nós além de n (o que preserva a ordem
+        simétrica dos restantes) e espalha os valores ordenados nessa ordem.
+        """
+        n = self.n
+        tamanho = max(1 << self.altura, 2)
+        dtype = valores.dtype
+
+        if self.alinhar_cache:
+            layout = _alocar_alinhado(tamanho, dtype)
+        else:
+            layout = np.empty(tamanho, dtype=dtype)
+        layout.fill(_sentinela(dtype))
+
+        # Índice do layout -> posição no array ordenado (0 = "nenhum", vale n)
+        posicao = np.empty(n + 1, dtype=np.int64)
+        posicao[0] = n
+
+        if n == 0:
+            return layout, posicao, np.empty(0, dtype=np.int64)
+
+        total = (1 << self.altura) - 1
+        nos = np.arange(1, total + 1, dtype=np.int64)
+        profundidade = np.frexp(nos.astype(np.float64))[1].astype(np.int64) - 1
+        primeiro_do_nivel = np.left_shift(1, profundidade)
+        ordem_simetrica = ((2 * (nos - primeiro_do_nivel) + 1)
+                           << (self.altura - 1 - profundidade)) - 1
+
+        nos_em_ordem = np.empty(total, dtype=np.int64)
+        nos_em_ordem[ordem_simetrica] = nos
+        nos_em_ordem = nos_em_ordem[nos_em_ordem <= n]
+
+        layout[nos_em_ordem] = valores
+        posicao[nos_em_ordem] = np.arange(n, dtype=np.int64)
+        return layout, posicao, nos_em_ordem
+
+    def limite_inferior(self, valor) -> int:
+        """
+        Retorna o índice (no array ordenado) do primeiro elemento >= valor.
+
+        Returns:
+            int: posição do limite inferior, ou n se todos forem menores
+        """
+        layout = self.layout
+        n = self.n
+        k = 1
+        while k <= n:
+            k = 2 * k + int(layout[k] < valor)
+            self.comparacoes_realizadas += 1
+
+        # Desfaz as descidas à direita finais: o último nó onde descemos à
+        # esquerda é o limite inferior
+        k >>= ((~k) & (k + 1)).bit_length()
+        self.consultas_realizadas += 1
+        return int(self.posicao_ordenada[k])
+
+    def buscar(self, valor) -> int:
+        """
+        Busca um único valor.
+
+        Returns:
+            int: posição do valor no array ordenado, ou -1 se não existir
+        """
+        posicao = self.limite_inferior(valor)
+        if posicao < self.n and self.valor_em(posicao) == valor:
+            return posicao
+        return -1
+
+    def limite_inferior_lote(self, valores: Sequence) -> np.ndarray:
+        """
+        Calcula o limite inferior de várias chaves de uma vez.
+
+        As chaves são processadas em lotes de `tamanho_lote` para que os
+        arrays temporários de cada nível permaneçam na cache.
+        """
+        consultas = np.asarray(valores)
+        resultado = np.empty(len(consultas), dtype=np.int64)
+
+        for inicio in range(0, len(consultas), self.tamanho_lote):
+            lote = consultas[inicio:inicio + self.tamanho_lote]
+            resultado[inicio:inicio + len(lote)] = self._limite_inferior_lote(lote)
+
+        self.consultas_realizadas += len(consultas)
+        self.comparacoes_realizadas += len(consultas) * self.altura
+        return resultado
+
+    def _limite_inferior_lote(self, lote: np.ndarray) -> np.ndarray:
+        """Desce a árvore com todas as chaves do lote, um nível por iteração"""
+        layout = self.layout
+        k = np.ones(len(lote), dtype=np.int64)
+        for _ in range(self.altura):
+            k = 2 * k + (layout[k] < lote)
+
+        # Chaves que pararam um nível antes passaram por um nó sentinela
+        acima = k >> 1
+        k = np.where(acima > self.n, acima, k)
+
+        k = k // (2 * ((k + 1) & ~k))
+        return self.posicao_ordenada[k]
+
+    def buscar_lote(self, valores: Sequence) -> np.ndarray:
+        """
+        Busca várias chaves de uma vez.
+
+        Returns:
+            np.ndarray: posição de cada chave no array ordenado, ou -1
+        """
+        consultas = np.asarray(valores)
+        posicoes = self.limite_inferior_lote(consultas)
+        validas = posicoes < self.n
+        encontrados = np.zeros(len(consultas), dtype=bool)
+        encontrados[validas] = self.valores_em(posicoes[validas]) == consultas[validas]
+        return np.where(encontrados, posicoes, -1)
+
+    def valor_em(self, posicao: int):
+        """Retorna o valor da posição `posicao` do array ordenado"""
+        return self.layout[self.indice_layout[posicao]]
+
+    def valores_em(self, posicoes: np.ndarray) -> np.ndarray:
+        """Versão vetorizada de `valor_em`"""
+        return self.layout[self.indice_layout[posicoes]]
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas da estrutura e das consultas realizadas"""
+        media = (self.comparacoes_realizadas / self.consultas_realizadas
+                 if self.consultas_realizadas > 0 else 0)
+        return {
+            'elementos': self.n,
+            'altura': self.altura,
+            'alinhado_cache': self.alinhar_cache,
+            'bytes_layout': int(self.layout.nbytes),
+            'consultas_realizadas': self.consultas_realizadas,
+            'comparacoes_realizadas': self.comparacoes_realizadas,
+            'comparacoes_por_consulta': round(media, 2)
+        }
+
+    def obter_lista_ordenada(self) -> List:
+        """Reconstrói a lista ordenada original a partir do layout"""
+        return self.valores_em(np.arange(self.n)).tolist()
@@ -0,0 +1,132 @@
+"""
+Fonte de dados ordenados mapeada em memória
+Permite buscar em arquivos maiores que a RAM lendo apenas as páginas necessárias
+"""
+
+import mmap
+import os
+from typing import Iterable, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Registros de largura fixa: inteiros de 64 bits little-endian
+DTYPE_REGISTRO = np.dtype('<i8')
+
+
+def criar_arquivo_ordenado(caminho: str, valores: Iterable[int],
+                           tamanho_bloco: int = 1 << 20) -> int:
+    """
+    Grava valores (já ordenados) como registros int64 em um arquivo binário.
+
+    Args:
+        caminho: arquivo de destino
+        valores: inteiros em ordem crescente (lista, array ou gerador)
+        tamanho_bloco: quantidade de registros gravados por vez
+
+    Returns:
+        int: quantidade de registros gravados
+    """
+    total = 0
+    with open(caminho, 'wb') as arquivo:
+        if isinstance(valores, np.ndarray):
+            valores.astype(DTYPE_REGISTRO, copy=False).tofile(arquivo)
+            return len(valores)
+
+        bloco = []
+        for valor in valores:
+            bloco.append(valor)
+            if len(bloco) >= tamanho_bloco:
+                np.asarray(bloco, dtype=DTYPE_REGISTRO).tofile(arquivo)
+                total += len(bloco)
+                bloco = []
+        if bloco:
+            np.asarray(bloco, dtype=DTYPE_REGISTRO).tofile(arquivo)
+            total += len(bloco)
+    return total
+
+
+class ArquivoOrdenadoMapeado:
+    """
+    Sequência somente leitura de int64 ordenados, mapeada a partir de um arquivo.
+
+    Comporta-se como uma lista para o BinarySearchEducativo (len e indexação),
+    mas nada é copiado para a memória: o sistema operacional carrega sob demanda
+    apenas as páginas efetivamente lidas. Cada leitura registra a página
+    tocada, para mostrar que uma busca lê cerca de log2(n) páginas.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self.tamanho_pagina = mmap.PAGESIZE
+
+        tamanho_arquivo = os.path.getsize(caminho)
+        if tamanho_arquivo % DTYPE_REGISTRO.itemsize != 0:
+            raise ValueError(f"Tamanho de '{caminho}' não é múltiplo de "
+                             f"{DTYPE_REGISTRO.itemsize} bytes")
+
+        if tamanho_arquivo > 0:
+            self._mapa = np.memmap(caminho, dtype=DTYPE_REGISTRO, mode='r')
+        else:
+            self._mapa = np.empty(0, dtype=DTYPE_REGISTRO)
+
+        # Contabilidade de acesso (por consulta e acumulada)
+        self.leituras = 0
+        self.paginas_consulta = set()
+        self.paginas_totais = set()
+        self._falhas_inicio = self._falhas_pagina()
+
+    def __len__(self) -> int:
+        return len(self._mapa)
+
+    def __bool__(self) -> bool:
+        return len(self._mapa) > 0
+
+    def __getitem__(self, indice: int) -> int:
+        if indice < 0:
+            indice += len(self._mapa)
+        pagina = indice * DTYPE_REGISTRO.itemsize // self.tamanho_pagina
+        self.paginas_consulta.add(pagina)
+        self.paginas_totais.add(pagina)
+        self.leituras += 1
+        return int(self._mapa[indice])
+
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield self[indice]
+
+    def iniciar_consulta(self) -> None:
+        """Zera a contabilidade da consulta atual"""
+        self.leituras = 0
+        self.paginas_consulta = set()
+        self._falhas_inicio = self._falhas_pagina()
+
+    @staticmethod
+    def _falhas_pagina() -> Optional[int]:
+        """Falhas de página do processo até agora (None se indisponível)"""
+        if resource is None:
+            return None
+        uso = resource.getrusage(resource.RUSAGE_SELF)
+        return uso.ru_minflt + uso.ru_majflt
+
+    def obter_estatisticas_acesso(self) -> dict:
+        """Retorna a contabilidade de acesso da consulta atual"""
+        falhas_atual = self._falhas_pagina()
+        falhas = (falhas_atual - self._falhas_inicio
+                  if falhas_atual is not None and self._falhas_inicio is not None
+                  else None)
+        return {
+            'leituras': self.leituras,
+            'bytes_lidos': self.leituras * DTYPE_REGISTRO.itemsize,
+            'paginas_tocadas': len(self.paginas_consulta),
+            'bytes_tocados': len(self.paginas_consulta) * self.tamanho_pagina,
+            'paginas_tocadas_total': len(self.paginas_totais),
+            'falhas_pagina': falhas,
+            'tamanho_pagina': self.tamanho_pagina,
+            'tamanho_arquivo': len(self) * DTYPE_REGISTRO.itemsize
+        }
@@ -0,0 +1,347 @@
+"""
+Implementação educativa da multiplicação de Karatsuba
+Inteiros grandes como arrays de dígitos, com multiplicação escolar abaixo de um limiar
+"""
+
+import math
+from typing import Callable, List, Optional, Tuple
+from enum import Enum
+
+import numpy as np
+
+from .base import MotorBase
+
+
+class FaseKaratsuba(Enum):
+    """Fases do algoritmo de Karatsuba"""
+    INICIALIZACAO = "inicializacao"
+    DIVISAO = "divisao"
+    CASO_BASE = "caso_base"
+    COMBINACAO = "combinacao"
+    FINALIZACAO = "finalizacao"
+
+
+# Bases aceitas: potências de 10 pequenas o bastante para a convolução em int64
+BASES_VALIDAS = (10, 100, 1000, 10000)
+
+# Blocos convertidos via str de uma vez; acima disso divide ao meio, o que
+# respeita o limite de dígitos de int <-> str do Python (sys.int_info)
+_DIGITOS_POR_BLOCO = 256
+
+# Passes vetorizados de propagação de vai-um antes de recorrer ao laço escalar
+_PASSES_VETORIZADOS = 16
+_TAMANHO_MINIMO_VETORIZADO = 128
+
+
+def para_digitos(valor: int, base: int = 10) -> np.ndarray:
+    """Converte um inteiro não negativo em dígitos (little-endian) na base dada"""
+    quantidade = max(1, math.ceil(valor.bit_length() * math.log(2) / math.log(base)) + 1)
+    return _aparar(np.array(_decompor(valor, base, quantidade), dtype=np.int64))
+
+
+def _decompor(valor: int, base: int, quantidade: int) -> List[int]:
+    """Exatamente `quantidade` dígitos de valor < base**quantidade"""
+    if quantidade <= _DIGITOS_POR_BLOCO:
+        largura = len(str(base)) - 1
+        texto = str(valor).zfill(quantidade * largura)
+        return [int(texto[fim - largura:fim])
+                for fim in range(len(texto), 0, -largura)]
+
+    metade = quantidade // 2
+    alto, baixo = divmod(valor, base ** metade)
+    return _decompor(baixo, base, metade) + _decompor(alto, base, quantidade - metade)
+
+
+def para_inteiro(digitos: np.ndarray, base: int = 10) -> int:
+    """Converte dígitos (little-endian) de volta para inteiro"""
+    if len(digitos) == 0:
+        return 0
+    if len(digitos) <= _DIGITOS_POR_BLOCO:
+        largura = len(str(base)) - 1
+        return int(''.join(str(int(d)).zfill(largura) for d in digitos[::-1]))
+
+    metade = len(digitos) // 2
+    return para_inteiro(digitos[metade:], base) * base ** metade + para_inteiro(digitos[:metade], base)
+
+
+def _aparar(digitos: np.ndarray) -> np.ndarray:
+    """Remove zeros à esquerda (no fim do array little-endian)"""
+    nao_nulos = np.flatnonzero(digitos)
+    if len(nao_nulos) == 0:
+        return digitos[:0]
+    return digitos[:nao_nulos[-1] + 1]
+
+
+class KaratsubaEducativo(MotorBase):
+    """
+    Multiplicação de Karatsuba com suporte a visualização passo a passo.
+
+    Divide x = x1·B^m + x0 e y = y1·B^m + y0 e usa apenas três produtos:
+    z0 = x0·y0, z2 = x1·y1 e z1 = (x0+x1)(y0+y1) - z2 - z0, o que leva a
+    O(n^1.585) operações de dígito. Abaixo de `limiar` dígitos, a multiplicação
+    escolar O(n²) é mais barata e é usada como caso base. A recursão é simulada
+    por uma pilha, como no QuickSortEducativo.
+    """
+
+    def __init__(self, a: int, b: int, limiar: int = 32, base: int = 10,
+                 callback_visual: Optional[Callable] = None):
+        if base not in BASES_VALIDAS:
+            raise ValueError(f"Base deve ser uma de {BASES_VALIDAS}")
+
+        super().__init__(callback_visual)
+        self.a = a
+        self.b = b
+        self.limiar = max(1, limiar)
+        self.base = base
+
+        self.sinal = -1 if (a < 0) != (b < 0) else 1
+        self.digitos_a = para_digitos(abs(a), base)
+        self.digitos_b = para_digitos(abs(b), base)
+
+        # Pilha para simular recursão e pilha de produtos parciais
+        self.pilha_recursao: List[tuple] = []
+        self.pilha_resultados: List[np.ndarray] = []
+
+        # Estado atual
+        self.fase_atual = FaseKaratsuba.INICIALIZACAO
+        self.produto: Optional[np.ndarray] = None
+
+        # Estatísticas
+        self.multiplicacoes_digito = 0
+        self.adicoes_digito = 0
+        self.chamadas_recursivas = 0
+        self.casos_base = 0
+        self.profundidade_maxima = 0
+
+        # Histórico
+        self.historico_divisoes = []
+        self.historico_combinacoes = []
+
+    def inicializar(self) -> None:
+        """Empilha o problema inteiro"""
+        self.fase_atual = FaseKaratsuba.DIVISAO
+        self.pilha_recursao.append(('resolver', self.digitos_a, self.digitos_b, 0))
+
+        if self.callback_visual:
+            self.callback_visual('inicializar', {
+                'digitos_a': len(self.digitos_a),
+                'digitos_b': len(self.digitos_b),
+                'limiar': self.limiar
+            })
+
+    def proximo_passo(self) -> bool:
+        """
+        Executa o próximo passo do algoritmo
+        Retorna True se ainda há passos a executar
+        """
+        self.custos.passo()
+
+        if self.fase_atual == FaseKaratsuba.INICIALIZACAO:
+            self.inicializar()
+            return True
+
+        if self.fase_atual == FaseKaratsuba.FINALIZACAO:
+            return False
+
+        if not self.pilha_recursao:
+            return self._finalizar()
+
+        quadro = self.pilha_recursao.pop()
+        if quadro[0] == 'resolver':
+            self._resolver(*quadro[1:])
+        else:
+            self._combinar(*quadro[1:])
+        return True
+
+    def _resolver(self, x: np.ndarray, y: np.ndarray, profundidade: int) -> None:
+        """Resolve pelo método escolar ou divide em três subproblemas"""
+        self.chamadas_recursivas += 1
+        self.profundidade_maxima = max(self.profundidade_maxima, profundidade)
+
+        if min(len(x), len(y)) <= self.limiar:
+            self._resolver_caso_base(x, y, profundidade)
+            return
+
+        self.fase_atual = FaseKaratsuba.DIVISAO
+        m = max(len(x), len(y)) // 2
+        x0, x1 = _aparar(x[:m]), x[m:]
+        y0, y1 = _aparar(y[:m]), y[m:]
+        soma_x = self._somar(x0, x1)
+        soma_y = self._somar(y0, y1)
+
+        # As metades são fatias; só as somas ocupam memória nova até a combinação
+        alocados = len(soma_x) + len(soma_y)
+        self.custos.alocar(alocados)
+
+        # Ordem de resolução: z0, z2 e depois z1
+        self.pilha_recursao.append(('combinar', m, profundidade, alocados))
+        self.pilha_recursao.append(('resolver', soma_x, soma_y, profundidade + 1))
+        self.pilha_recursao.append(('resolver', x1, y1, profundidade + 1))
+        self.pilha_recursao.append(('resolver', x0, y0, profundidade + 1))
+
+        self.historico_divisoes.append({
+            'digitos_x': len(x),
+            'digitos_y': len(y),
+            'm': m,
+            'profundidade': profundidade
+        })
+
+        if self.callback_visual:
+            self.callback_visual('divisao', {
+                'digitos_x': len(x),
+                'digitos_y': len(y),
+                'm': m,
+                'profundidade': profundidade
+            })
+
+    def _resolver_caso_base(self, x: np.ndarray, y: np.ndarray, profundidade: int) -> None:
+        """Multiplicação escolar: cada dígito de x por cada dígito de y"""
+        self.fase_atual = FaseKaratsuba.CASO_BASE
+        self.casos_base += 1
+
+        if len(x) == 0 or len(y) == 0:
+            produto = x[:0]
+        else:
+            produto = self._normalizar(np.convolve(x, y))
+            self.multiplicacoes_digito += len(x) * len(y)
+            self.adicoes_digito += len(x) * len(y)
+            self.custos.ler(2 * len(x) * len(y))
+            self.custos.escrever(len(produto))
+
+        self.pilha_resultados.append(produto)
+        self.custos.alocar(len(produto))
+
+        if self.callback_visual:
+            self.callback_visual('caso_base', {
+                'digitos_x': len(x),
+                'digitos_y': len(y),
+                'digitos_produto': len(produto),
+                'profundidade': profundidade
+            })
+
+    def _combinar(self, m: int, profundidade: int, alocados: int) -> None:
+        """Combina z0, z1 e z2 em z2·B^2m + (z1 - z2 - z0)·B^m + z0"""
+        self.fase_atual = FaseKaratsuba.COMBINACAO
+
+        z1 = self.pilha_resultados.pop()
+        z2 = self.pilha_resultados.pop()
+        z0 = self.pilha_resultados.pop()
+
+        tamanho = max(len(z0), len(z1) + m, len(z2) + 2 * m) + 1
+        acumulado = np.zeros(tamanho, dtype=np.int64)
+        acumulado[:len(z0)] += z0
+        acumulado[m:m + len(z1)] += z1
+        acumulado[m:m + len(z2)] -= z2
+        acumulado[m:m + len(z0)] -= z0
+        acumulado[2 * m:2 * m + len(z2)] += z2
+        self.adicoes_digito += 2 * len(z0) + len(z1) + 2 * len(z2)
+        self.custos.ler(2 * len(z0) + len(z1) + 2 * len(z2))
+
+        produto = self._normalizar(acumulado)
+        self.pilha_resultados.append(produto)
+        self.custos.escrever(len(produto))
+        self.custos.liberar(alocados + len(z0) + len(z1) + len(z2))
+        self.custos.alocar(len(produto))
+
+        self.historico_combinacoes.append({
+            'm': m,
+            'digitos_produto': len(produto),
+            'profundidade': profundidade
+        })
+
+        if self.callback_visual:
+            self.callback_visual('combinacao', {
+                'm': m,
+                'digitos_z0': len(z0),
+                'digitos_z1': len(z1),
+                'digitos_z2': len(z2),
+                'digitos_produto': len(produto),
+                'profundidade': profundidade
+            })
+
+    def _somar(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Soma dois números em dígitos"""
+        tamanho = max(len(x), len(y))
+        soma = np.zeros(tamanho + 1, dtype=np.int64)
+        soma[:len(x)] += x
+        soma[:len(y)] += y
+        self.adicoes_digito += tamanho
+        self.custos.ler(len(x) + len(y))
+        self.custos.escrever(tamanho + 1)
+        return self._normalizar(soma)
+
+    def _normalizar(self, digitos: np.ndarray) -> np.ndarray:
+        """Propaga os vai-uns (e empréstimos) para que todo dígito fique em [0, base)"""
+        base = self.base
+        valores = digitos
+
+        # Cada passe desloca todos os vai-uns uma posição de uma vez; cadeias
+        # longas (ex.: 999...9 + 1) são raras e terminam no laço escalar
+        if len(digitos) >= _TAMANHO_MINIMO_VETORIZADO:
+            valores = np.append(digitos, np.zeros(_PASSES_VETORIZADOS, dtype=np.int64))
+            for _ in range(_PASSES_VETORIZADOS):
+                vai_uns = valores // base
+                if not vai_uns.any():
+                    return _aparar(valores)
+                valores -= vai_uns * base
+                valores[1:] += vai_uns[:-1]
+
+        valores = valores.tolist()
+        vai_um = 0
+        for i, valor in enumerate(valores):
+            vai_um, valores[i] = divmod(valor + vai_um, base)
+        while vai_um > 0:
+            vai_um, digito = divmod(vai_um, base)
+            valores.append(digito)
+        return _aparar(np.array(valores, dtype=np.int64))
+
+    def _finalizar(self) -> bool:
+        """Finaliza o algoritmo com o produto completo"""
+        self.fase_atual = FaseKaratsuba.FINALIZACAO
+        self.produto = self.pilha_resultados.pop() if self.pilha_resultados else None
+
+        if self.callback_visual:
+            self.callback_visual('produto_calculado', {
+                'digitos_produto': len(self.produto) if self.produto is not None else 0,
+                'multiplicacoes_digito': self.multiplicacoes_digito
+            })
+        return False
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas do processo, comparadas com a multiplicação escolar"""
+        multiplicacoes_escolar = len(self.digitos_a) * len(self.digitos_b)
+        economia = ((1 - self.multiplicacoes_digito / multiplicacoes_escolar) * 100
+                    if multiplicacoes_escolar > 0 else 0)
+
+        return {
+            'fase_atual': self.fase_atual.value,
+            'digitos_a': len(self.digitos_a),
+            'digitos_b': len(self.digitos_b),
+            'limiar': self.limiar,
+            'multiplicacoes_digito': self.multiplicacoes_digito,
+            'adicoes_digito': self.adicoes_digito,
+            'multiplicacoes_escolar': multiplicacoes_escolar,
+            'economia_multiplicacoes': round(economia, 2),
+            'chamadas_recursivas': self.chamadas_recursivas,
+            'casos_base': self.casos_base,
+            'profundidade_maxima': self.profundidade_maxima,
+            'custos': self.obter_custos(),
+            'subproblemas_restantes': len(self.pilha_recursao),
+            'esta_completo': self.fase_atual == FaseKaratsuba.FINALIZACAO
+        }
+
+    def obter_resultado_final(self) -> Optional[int]:
+        """Retorna o produto se a multiplicação estiver completa"""
+        if self.fase_atual == FaseKaratsuba.FINALIZACAO and self.produto is not None:
+            return self.sinal * para_inteiro(self.produto, self.base)
+        return None
+
+    def obter_digitos_resultado(self) -> Optional[Tuple[int, np.ndarray]]:
+        """Retorna (sinal, dígitos little-endian) do produto, se completo"""
+        if self.fase_atual == FaseKaratsuba.FINALIZACAO and self.produto is not None:
+            return self.sinal, self.produto.copy()
+        return None
+
+    def reiniciar(self) -> None:
+        """Reinicia o algoritmo para uma nova execução"""
+        self.__init__(self.a, self.b, self.limiar, self.base, self.callback_visual)
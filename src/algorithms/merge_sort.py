@@ -4,9 +4,13 @@ Com visualização e interação para fins didáticos
 """
 
 import copy
-from typing import List, Tuple, Optional, Callable
+from typing import List, Sequence, Tuple, Optional, Callable
 from enum import Enum
 
+import numpy as np
+
+from .base import MotorBase
+
 
 class FaseMergeSort(Enum):
     """Fases do algoritmo Merge Sort"""
@@ -24,23 +28,28 @@ class EstadoFusao(Enum):
     COMPLETADA = "completada"
 
 
-class MergeSortEducativo:
+class MergeSortEducativo(MotorBase):
     """
     Implementação educativa do Merge Sort com suporte a visualização
     e interação do usuário durante o processo de fusão
     """
     
     def __init__(self, lista_original: List[int], callback_visual: Optional[Callable] = None):
+        super().__init__(callback_visual)
         self.lista_original = copy.deepcopy(lista_original)
-        self.callback_visual = callback_visual
         
         # Estado atual do algoritmo
         self.fase_atual = FaseMergeSort.INICIALIZACAO
         self.sublistas = []
         self.nivel_atual = 0
+        # Fusões do nível: pares (indice_fusao, indice_fusao + 1) de sublistas;
+        # os resultados formam o próximo nível
+        self.indice_fusao = 0
+        self.proximo_nivel = []
         self.fusoes_realizadas = 0
         self.comparacoes_realizadas = 0
         self.decisoes_corretas = 0
+        self.inversoes = 0
         self.tempo_inicio = None
         
         # Estado da fusão atual
@@ -62,9 +71,12 @@ class MergeSortEducativo:
         # Criar sublistas individuais
         self.sublistas = [[elemento] for elemento in self.lista_original]
         self.nivel_atual = 0
+        self.indice_fusao = 0
+        self.proximo_nivel = []
         self.fusoes_realizadas = 0
         self.comparacoes_realizadas = 0
         self.decisoes_corretas = 0
+        self.inversoes = 0
         
         # Registrar divisão inicial
         self.historico_divisoes.append({
@@ -83,6 +95,8 @@ class MergeSortEducativo:
         Executa o próximo passo do algoritmo
         Retorna True se ainda há passos a executar
         """
+        self.custos.passo()
+        
         if self.fase_atual == FaseMergeSort.INICIALIZACAO:
             self.inicializar()
             return True
@@ -104,21 +118,18 @@ class MergeSortEducativo:
         return False
     
     def _processar_nivel_atual(self) -> bool:
-        """Processa todas as fusões do nível atual"""
-        novas_sublistas = []
-        i = 0
-        
-        while i < len(self.sublistas):
-            if i + 1 < len(self.sublistas):
-                # Iniciar fusão entre sublistas[i] e sublistas[i+1]
-                self._iniciar_fusao(self.sublistas[i], self.sublistas[i+1])
-                return True
-            else:
-                # Sublista ímpar, passa para o próximo nível
-                novas_sublistas.append(self.sublistas[i])
-                i += 1
+        """Inicia a próxima fusão do nível atual ou passa para o próximo nível"""
+        i = self.indice_fusao
+        if i + 1 < len(self.sublistas):
+            # Iniciar fusão entre sublistas[i] e sublistas[i+1]
+            self._iniciar_fusao(self.sublistas[i], self.sublistas[i+1])
+            return True
         
-        self.sublistas = novas_sublistas
+        # Sublista ímpar, se houver, passa para o próximo nível
+        self.proximo_nivel.extend(self.sublistas[i:])
+        self.sublistas = self.proximo_nivel
+        self.proximo_nivel = []
+        self.indice_fusao = 0
         self.nivel_atual += 1
         
         if len(self.sublistas) <= 1:
@@ -138,6 +149,9 @@ class MergeSortEducativo:
         self.indice_direita = 0
         self.resultado_fusao = []
         
+        # Buffer da fusão: memória auxiliar do tamanho das duas sublistas
+        self.custos.alocar(len(lista_esq) + len(lista_dir))
+        
         if self.callback_visual:
             self.callback_visual('iniciar_fusao', {
                 'lista_esquerda': self.lista_esquerda,
@@ -170,6 +184,8 @@ class MergeSortEducativo:
         escolha_correta = (escolher_esquerda and elemento_esq <= elemento_dir) or \
                          (not escolher_esquerda and elemento_dir < elemento_esq)
         
+        self.custos.passo()
+        self.custos.ler(2)
         self.comparacoes_realizadas += 1
         
         if escolha_correta:
@@ -181,6 +197,8 @@ class MergeSortEducativo:
             else:
                 self.resultado_fusao.append(elemento_dir)
                 self.indice_direita += 1
+                # O elemento da direita é menor que todos os restantes da esquerda
+                self.inversoes += len(self.lista_esquerda) - self.indice_esquerda
                 mensagem = f"Correto! {elemento_dir} é menor que {elemento_esq}"
         else:
             # Fazer a escolha correta automaticamente após feedback
@@ -191,7 +209,9 @@ class MergeSortEducativo:
             else:
                 self.resultado_fusao.append(elemento_dir)
                 self.indice_direita += 1
+                self.inversoes += len(self.lista_esquerda) - self.indice_esquerda
                 mensagem = f"Ops! {elemento_dir} é menor que {elemento_esq}"
+        self.custos.escrever()
         
         # Registrar comparação
         self.historico_comparacoes.append({
@@ -207,7 +227,8 @@ class MergeSortEducativo:
                 'escolha_correta': escolha_correta,
                 'mensagem': mensagem,
                 'resultado_parcial': copy.deepcopy(self.resultado_fusao),
-                'elemento_escolhido': self.resultado_fusao[-1]
+                'elemento_escolhido': self.resultado_fusao[-1],
+                'inversoes': self.inversoes
             })
         
         # Verificar se a fusão está completa
@@ -223,8 +244,12 @@ class MergeSortEducativo:
     def _finalizar_fusao_automatica(self) -> Tuple[bool, str]:
         """Finaliza a fusão automaticamente quando uma lista se esgota"""
         # Adicionar elementos restantes
+        restantes = (len(self.lista_esquerda) - self.indice_esquerda +
+                     len(self.lista_direita) - self.indice_direita)
         self.resultado_fusao.extend(self.lista_esquerda[self.indice_esquerda:])
         self.resultado_fusao.extend(self.lista_direita[self.indice_direita:])
+        self.custos.ler(restantes)
+        self.custos.escrever(restantes)
         
         return self._finalizar_fusao()
     
@@ -241,13 +266,16 @@ class MergeSortEducativo:
             'nivel': self.nivel_atual
         })
         
-        # Atualizar sublistas com o resultado
+        # Atualizar sublistas com o resultado (cópia de volta do buffer)
         self._atualizar_sublistas_com_resultado()
+        self.custos.ler(len(self.resultado_fusao))
+        self.custos.escrever(len(self.resultado_fusao))
+        self.custos.liberar(len(self.resultado_fusao))
         
         if self.callback_visual:
             self.callback_visual('fusao_completa', {
                 'resultado': copy.deepcopy(self.resultado_fusao),
-                'sublistas_atualizadas': copy.deepcopy(self.sublistas),
+                'sublistas_atualizadas': copy.deepcopy(self.obter_sublistas()),
                 'nivel': self.nivel_atual
             })
         
@@ -257,25 +285,14 @@ class MergeSortEducativo:
         return True, "Fusão completada!"
     
     def _atualizar_sublistas_com_resultado(self) -> None:
-        """Atualiza as sublistas com o resultado da fusão"""
-        novas_sublistas = []
-        encontrou_fusao = False
-        
-        i = 0
-        while i < len(self.sublistas):
-            if (not encontrou_fusao and 
-                i + 1 < len(self.sublistas) and
-                self.sublistas[i] == self.lista_esquerda and
-                self.sublistas[i + 1] == self.lista_direita):
-                # Substituir as duas sublistas pelo resultado
-                novas_sublistas.append(copy.deepcopy(self.resultado_fusao))
-                encontrou_fusao = True
-                i += 2
-            else:
-                novas_sublistas.append(self.sublistas[i])
-                i += 1
-        
-        self.sublistas = novas_sublistas
+        """Substitui o par fundido pelo resultado no próximo nível"""
+        # A posição do par é conhecida: nada de procurá-lo comparando listas
+        self.proximo_nivel.append(self.resultado_fusao)
+        self.indice_fusao += 2
+    
+    def obter_sublistas(self) -> List[List[int]]:
+        """Sublistas atuais: as já fundidas neste nível seguidas das pendentes"""
+        return self.proximo_nivel + self.sublistas[self.indice_fusao:]
     
     def obter_proxima_comparacao(self) -> Optional[Tuple[int, int]]:
         """
@@ -307,8 +324,10 @@ class MergeSortEducativo:
             'comparacoes_realizadas': self.comparacoes_realizadas,
             'decisoes_corretas': self.decisoes_corretas,
             'precisao': round(precisao, 2),
-            'elementos_restantes': sum(len(sublista) for sublista in self.sublistas),
-            'sublistas_restantes': len(self.sublistas),
+            'inversoes': self.inversoes,
+            'custos': self.obter_custos(),
+            'elementos_restantes': sum(len(sublista) for sublista in self.obter_sublistas()),
+            'sublistas_restantes': len(self.proximo_nivel) + len(self.sublistas) - self.indice_fusao,
             'esta_completo': len(self.sublistas) <= 1
         }
     
@@ -321,3 +340,48 @@ class MergeSortEducativo:
     def reiniciar(self) -> None:
         """Reinicia o algoritmo para uma nova execução"""
         self.__init__(self.lista_original, self.callback_visual)
+
+
+
+def contar_inversoes(valores: Sequence[int]) -> int:
+    """
+    Conta as inversões (pares i < j com valores[i] > valores[j]) em O(n log n).
+
+    Versão em lote do contador do MergeSortEducativo, pensada para arrays
+    grandes (10^6 elementos). Faz o merge sort de baixo para cima com NumPy:
+    em cada nível, para cada elemento da metade direita de um par de blocos,
+    conta quantos elementos da metade esquerda são maiores que ele.
+    """
+    a = np.asarray(valores)
+    n = len(a)
+    if n < 2:
+        return 0
+
+    # Postos densos: iguais recebem o mesmo posto e as chaves cabem em int64
+    _, postos = np.unique(a, return_inverse=True)
+    atual = postos.astype(np.int64).ravel()
+    quantidade_postos = int(atual.max()) + 1
+
+    indices = np.arange(n, dtype=np.int64)
+    total = 0
+    largura = 1
+    while largura < n:
+        par = indices // (2 * largura)
+        na_direita = (indices % (2 * largura)) >= largura
+
+        # Chave = (par, posto): blocos de pares diferentes não se misturam
+        chaves = par * quantidade_postos + atual
+        esquerda = chaves[~na_direita]
+        direita = chaves[na_direita]
+        par_direita = par[na_direita]
+
+        inicio_esquerda = np.searchsorted(esquerda, par_direita * quantidade_postos)
+        fim_esquerda = np.searchsorted(esquerda, (par_direita + 1) * quantidade_postos)
+        menores_ou_iguais = np.searchsorted(esquerda, direita, side='right') - inicio_esquerda
+        total += int((fim_esquerda - inicio_esquerda - menores_ou_iguais).sum())
+
+        # Fundir os pares: cada par é formado por duas sequências já ordenadas
+        atual = np.sort(chaves, kind='stable') - par * quantidade_postos
+        largura *= 2
+
+    return total
@@ -0,0 +1,298 @@
+"""
+Implementação educativa do par de pontos mais próximo (dividir e conquistar)
+Com visualização passo a passo e verificação da faixa central vetorizada
+"""
+
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+from enum import Enum
+
+import numpy as np
+
+from .base import MotorBase
+
+
+class FaseParMaisProximo(Enum):
+    """Fases do algoritmo do par mais próximo"""
+    INICIALIZACAO = "inicializacao"
+    DIVISAO = "divisao"
+    CASO_BASE = "caso_base"
+    COMBINACAO = "combinacao"
+    FINALIZACAO = "finalizacao"
+
+
+class ParMaisProximoEducativo(MotorBase):
+    """
+    Par de pontos mais próximo no plano em O(n log n).
+
+    Os pontos são ordenados por x e por y uma única vez. Cada subproblema é
+    um intervalo da ordem por x acompanhado de seus pontos já ordenados por y
+    (obtidos filtrando a ordem do pai em tempo linear). A recursão é simulada
+    por uma pilha, como no QuickSortEducativo, para que cada divisão, caso base
+    e combinação seja um passo visível. A faixa central é verificada com NumPy.
+    """
+
+    def __init__(self, pontos: Sequence[Sequence[float]],
+                 callback_visual: Optional[Callable] = None,
+                 tamanho_folha: int = 3):
+        super().__init__(callback_visual)
+        self.pontos = np.array(pontos, dtype=np.float64).reshape(-1, 2)
+        self.tamanho_folha = max(2, tamanho_folha)
+        self.n = len(self.pontos)
+
+        # Ordenações feitas uma única vez
+        self.ordem_x = np.empty(0, dtype=np.int64)
+        self.ordem_y = np.empty(0, dtype=np.int64)
+        self.posto_x = np.empty(0, dtype=np.int64)
+
+        # Pilha para simular recursão e pilha de resultados parciais
+        self.pilha_recursao: List[tuple] = []
+        self.pilha_resultados: List[Tuple[float, int, int]] = []
+
+        # Estado atual
+        self.fase_atual = FaseParMaisProximo.INICIALIZACAO
+        self.melhor_resultado: Optional[Tuple[float, int, int]] = None
+
+        # Estatísticas
+        self.distancias_calculadas = 0
+        self.casos_base = 0
+        self.combinacoes = 0
+        self.pontos_em_faixas = 0
+        self.profundidade_maxima = 0
+
+        # Histórico
+        self.historico_divisoes = []
+        self.historico_faixas = []
+
+    def inicializar(self) -> None:
+        """Ordena os pontos por x e por y e empilha o problema inteiro"""
+        self.fase_atual = FaseParMaisProximo.DIVISAO
+
+        x, y = self.pontos[:, 0], self.pontos[:, 1]
+        self.ordem_x = np.lexsort((y, x))
+        self.ordem_y = np.lexsort((x, y))
+        self.posto_x = np.empty(self.n, dtype=np.int64)
+        self.posto_x[self.ordem_x] = np.arange(self.n)
+
+        # Três arrays de índices (ordem por x, ordem por y e posto em x)
+        self.custos.ler(2 * self.n)
+        self.custos.escrever(3 * self.n)
+        self.custos.alocar(3 * self.n)
+
+        if self.n >= 2:
+            self.pilha_recursao.append(('dividir', 0, self.n, self.ordem_y, 0))
+
+        if self.callback_visual:
+            self.callback_visual('inicializar', {
+                'pontos': self.pontos.copy(),
+                'ordem_x': self.ordem_x.copy(),
+                'ordem_y': self.ordem_y.copy()
+            })
+
+    def proximo_passo(self) -> bool:
+        """
+        Executa o próximo passo do algoritmo
+        Retorna True se ainda há passos a executar
+        """
+        self.custos.passo()
+
+        if self.fase_atual == FaseParMaisProximo.INICIALIZACAO:
+            self.inicializar()
+            return True
+
+        if self.fase_atual == FaseParMaisProximo.FINALIZACAO:
+            return False
+
+        if not self.pilha_recursao:
+            return self._finalizar()
+
+        quadro = self.pilha_recursao.pop()
+        if quadro[0] == 'dividir':
+            self._dividir(*quadro[1:])
+        else:
+            self._combinar(*quadro[1:])
+        return True
+
+    def _dividir(self, inicio: int, fim: int, indices_y: np.ndarray, profundidade: int) -> None:
+        """Resolve diretamente intervalos pequenos ou divide pela mediana de x"""
+        self.profundidade_maxima = max(self.profundidade_maxima, profundidade)
+
+        if fim - inicio <= self.tamanho_folha:
+            self._resolver_caso_base(inicio, fim, profundidade)
+            return
+
+        self.fase_atual = FaseParMaisProximo.DIVISAO
+        meio = (inicio + fim) // 2
+        x_meio = float(self.pontos[self.ordem_x[meio], 0])
+
+        # Particionar a ordem por y do pai mantém as duas metades ordenadas por y
+        na_esquerda = self.posto_x[indices_y] < meio
+        esquerda_y = indices_y[na_esquerda]
+        direita_y = indices_y[~na_esquerda]
+
+        # As ordens por y dos filhos vivem até a combinação deste intervalo
+        self.custos.ler(len(indices_y))
+        self.custos.escrever(len(indices_y))
+        self.custos.alocar(len(indices_y))
+
+        # Direita empilhada primeiro para que a esquerda seja resolvida antes
+        self.pilha_recursao.append(('combinar', indices_y, x_meio, profundidade))
+        self.pilha_recursao.append(('dividir', meio, fim, direita_y, profundidade + 1))
+        self.pilha_recursao.append(('dividir', inicio, meio, esquerda_y, profundidade + 1))
+
+        self.historico_divisoes.append({
+            'inicio': inicio,
+            'fim': fim,
+            'x_meio': x_meio,
+            'profundidade': profundidade
+        })
+
+        if self.callback_visual:
+            self.callback_visual('divisao', {
+                'inicio': inicio,
+                'meio': meio,
+                'fim': fim,
+                'x_meio': x_meio,
+                'profundidade': profundidade
+            })
+
+    def _resolver_caso_base(self, inicio: int, fim: int, profundidade: int) -> None:
+        """Compara todos os pares de um intervalo pequeno"""
+        self.fase_atual = FaseParMaisProximo.CASO_BASE
+        self.casos_base += 1
+
+        indices = self.ordem_x[inicio:fim]
+        coordenadas = self.pontos[indices]
+        diferencas = coordenadas[:, None, :] - coordenadas[None, :, :]
+        distancias2 = np.einsum('ijk,ijk->ij', diferencas, diferencas)
+        distancias2[np.tril_indices(len(indices))] = np.inf
+
+        m = len(indices)
+        self.distancias_calculadas += m * (m - 1) // 2
+        self.custos.ler(m)
+        self.custos.comparar(m * (m - 1) // 2)
+
+        posicao = int(np.argmin(distancias2))
+        a, b = divmod(posicao, m)
+        resultado = (float(distancias2[a, b]), int(indices[a]), int(indices[b]))
+        self._registrar_resultado(resultado)
+
+        if self.callback_visual:
+            self.callback_visual('caso_base', {
+                'inicio': inicio,
+                'fim': fim,
+                'distancia': math.sqrt(resultado[0]),
+                'par': resultado[1:],
+                'profundidade': profundidade
+            })
+
+    def _combinar(self, indices_y: np.ndarray, x_meio: float, profundidade: int) -> None:
+        """Combina as duas metades verificando os pontos da faixa central"""
+        self.fase_atual = FaseParMaisProximo.COMBINACAO
+        self.combinacoes += 1
+
+        direita = self.pilha_resultados.pop()
+        esquerda = self.pilha_resultados.pop()
+        melhor = min(esquerda, direita)
+        distancia = math.sqrt(melhor[0])
+
+        # Faixa: pontos a menos de `distancia` da reta x = x_meio, já ordenados por y
+        coordenadas_y = self.pontos[indices_y]
+        na_faixa = np.abs(coordenadas_y[:, 0] - x_meio) < distancia
+        faixa = indices_y[na_faixa]
+        coordenadas = coordenadas_y[na_faixa]
+        self.pontos_em_faixas += len(faixa)
+        self.custos.ler(len(indices_y))
+        self.custos.comparar(len(indices_y))
+        self.custos.escrever(len(faixa))
+        self.custos.alocar(len(faixa))
+
+        # Comparar cada ponto com os seguintes em y enquanto a diferença em y
+        # ainda puder ser menor que a melhor distância (no máximo 7 vizinhos)
+        salto = 1
+        while salto < len(faixa):
+            dy = coordenadas[salto:, 1] - coordenadas[:-salto, 1]
+            if not np.any(dy * dy < melhor[0]):
+                break
+            dx = coordenadas[salto:, 0] - coordenadas[:-salto, 0]
+            distancias2 = dx * dx + dy * dy
+            self.distancias_calculadas += len(distancias2)
+            self.custos.comparar(len(distancias2))
+
+            posicao = int(np.argmin(distancias2))
+            if distancias2[posicao] < melhor[0]:
+                melhor = (float(distancias2[posicao]),
+                          int(faixa[posicao]), int(faixa[posicao + salto]))
+            salto += 1
+
+        self._registrar_resultado(melhor)
+        self.custos.liberar(len(faixa) + len(indices_y))
+
+        self.historico_faixas.append({
+            'x_meio': x_meio,
+            'largura': distancia,
+            'pontos_faixa': len(faixa),
+            'vizinhos_verificados': salto - 1,
+            'profundidade': profundidade
+        })
+
+        if self.callback_visual:
+            self.callback_visual('faixa_verificada', {
+                'x_meio': x_meio,
+                'largura': distancia,
+                'pontos_faixa': faixa.copy(),
+                'distancia': math.sqrt(melhor[0]),
+                'par': melhor[1:],
+                'profundidade': profundidade
+            })
+
+    def _registrar_resultado(self, resultado: Tuple[float, int, int]) -> None:
+        """Empilha o resultado de um subproblema e atualiza o melhor global"""
+        self.pilha_resultados.append(resultado)
+        if self.melhor_resultado is None or resultado[0] < self.melhor_resultado[0]:
+            self.melhor_resultado = resultado
+
+    def _finalizar(self) -> bool:
+        """Finaliza o algoritmo com o resultado do problema inteiro"""
+        self.fase_atual = FaseParMaisProximo.FINALIZACAO
+        if self.pilha_resultados:
+            self.melhor_resultado = self.pilha_resultados.pop()
+
+        if self.callback_visual and self.melhor_resultado is not None:
+            self.callback_visual('par_encontrado', {
+                'distancia': math.sqrt(self.melhor_resultado[0]),
+                'par': self.melhor_resultado[1:]
+            })
+        return False
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas do processo"""
+        forca_bruta = self.n * (self.n - 1) // 2
+        return {
+            'fase_atual': self.fase_atual.value,
+            'pontos': self.n,
+            'distancias_calculadas': self.distancias_calculadas,
+            'distancias_forca_bruta': forca_bruta,
+            'casos_base': self.casos_base,
+            'combinacoes': self.combinacoes,
+            'pontos_em_faixas': self.pontos_em_faixas,
+            'profundidade_maxima': self.profundidade_maxima,
+            'custos': self.obter_custos(),
+            'subproblemas_restantes': len(self.pilha_recursao),
+            'esta_completo': self.fase_atual == FaseParMaisProximo.FINALIZACAO
+        }
+
+    def obter_resultado_final(self) -> Optional[dict]:
+        """Retorna o par mais próximo se o algoritmo estiver completo"""
+        if self.fase_atual == FaseParMaisProximo.FINALIZACAO and self.melhor_resultado:
+            distancia2, i, j = self.melhor_resultado
+            return {
+                'distancia': math.sqrt(distancia2),
+                'par': (i, j),
+                'pontos': (tuple(self.pontos[i]), tuple(self.pontos[j]))
+            }
+        return None
+
+    def reiniciar(self) -> None:
+        """Reinicia o algoritmo para uma nova execução"""
+        self.__init__(self.pontos, self.callback_visual, self.tamanho_folha)
@@ -0,0 +1,238 @@
+"""
+Implementação educativa do Quickselect (seleção do k-ésimo menor elemento)
+Reaproveita o particionamento interativo do Quick Sort
+"""
+
+import copy
+import math
+import random
+from typing import List, Optional, Callable
+from enum import Enum
+
+from .quick_sort import QuickSortEducativo, FaseQuickSort
+
+
+class EstrategiaPivot(Enum):
+    """Estratégias de escolha do pivot"""
+    ALEATORIO = "aleatorio"                        # O(n) esperado
+    MEDIANA_DAS_MEDIANAS = "mediana_das_medianas"  # O(n) no pior caso
+
+
+class QuickSelectEducativo(QuickSortEducativo):
+    """
+    Encontra o k-ésimo menor elemento (k a partir de 0) particionando como o
+    Quick Sort, mas descendo apenas no lado que contém a posição k.
+
+    O particionamento, as decisões do usuário e as trocas são os mesmos do
+    QuickSortEducativo; só mudam a escolha do pivot (levado para o fim do
+    intervalo antes de particionar) e a recursão, que segue um único ramo.
+    Como a partição manda os iguais ao pivot para a esquerda, eles são
+    agrupados junto ao pivot antes de descer: se k cai nesse bloco a seleção
+    termina, e chaves repetidas não reduzem o intervalo um elemento por vez.
+    """
+
+    def __init__(self, lista_original: List[int], k: int,
+                 estrategia: EstrategiaPivot = EstrategiaPivot.ALEATORIO,
+                 callback_visual: Optional[Callable] = None,
+                 semente: Optional[int] = None):
+        if not 0 <= k < len(lista_original):
+            raise ValueError(f"k deve estar entre 0 e {len(lista_original) - 1}")
+
+        super().__init__(lista_original, callback_visual)
+        self.k = k
+        self.estrategia = estrategia
+        self.semente = semente
+        self._rng = random.Random(semente)
+
+        # Comparações gastas escolhendo o pivot (mediana das medianas)
+        self.comparacoes_pivot = 0
+        self.elemento_k = None
+
+    @classmethod
+    def para_percentil(cls, lista_original: List[int], percentil: float,
+                       **kwargs) -> 'QuickSelectEducativo':
+        """Cria o motor para o percentil informado (0 a 100); 50 é a mediana"""
+        k = round(percentil / 100 * (len(lista_original) - 1))
+        return cls(lista_original, k, **kwargs)
+
+    def inicializar(self) -> None:
+        """Posiciona o pivot do próximo intervalo e inicia a partição"""
+        if self.pilha_recursao:
+            inicio, fim = self.pilha_recursao[-1]
+            if inicio < fim:
+                self._posicionar_pivot(inicio, fim)
+
+        super().inicializar()
+
+        if self.fase_atual == FaseQuickSort.FINALIZACAO:
+            self._registrar_resultado()
+
+    def _posicionar_pivot(self, inicio: int, fim: int) -> None:
+        """Escolhe o pivot segundo a estratégia e o troca com o último elemento"""
+        if self.estrategia == EstrategiaPivot.ALEATORIO:
+            posicao = self._rng.randint(inicio, fim)
+        else:
+            valor = self._mediana_das_medianas(self.lista_atual[inicio:fim + 1])
+            posicao = self.lista_atual.index(valor, inicio, fim + 1)
+
+        self._fazer_troca(posicao, fim)
+
+    def _preparar_recursao(self) -> None:
+        """Continua apenas no lado da partição que contém a posição k"""
+        posicao_pivot_final = self.i_atual
+
+        self.historico_particoes.append({
+            'inicio': self.inicio_atual,
+            'fim': self.fim_atual,
+            'pivot_final': posicao_pivot_final,
+            'lista': copy.deepcopy(self.lista_atual)
+        })
+
+        # Bloco [inicio_iguais, posicao_pivot_final] já está na posição final;
+        # intervalos de um elemento também
+        inicio_iguais = posicao_pivot_final
+        if self.k < posicao_pivot_final:
+            inicio_iguais = self._agrupar_iguais_ao_pivot(self.inicio_atual, posicao_pivot_final)
+
+        if self.k < inicio_iguais and self.inicio_atual < inicio_iguais - 1:
+            self.pilha_recursao.append((self.inicio_atual, inicio_iguais - 1))
+        elif self.k > posicao_pivot_final and posicao_pivot_final + 1 < self.fim_atual:
+            self.pilha_recursao.append((posicao_pivot_final + 1, self.fim_atual))
+        self.custos.observar_auxiliar(len(self.pilha_recursao))
+
+        if self.callback_visual:
+            self.callback_visual('particao_completa', {
+                'pivot_final': posicao_pivot_final,
+                'inicio_iguais': inicio_iguais,
+                'lista': copy.deepcopy(self.lista_atual),
+                'subproblemas': len(self.pilha_recursao),
+                'k': self.k
+            })
+
+        if self.pilha_recursao:
+            self.nivel_recursao += 1
+            self.fase_atual = FaseQuickSort.INICIALIZACAO
+        else:
+            self.fase_atual = FaseQuickSort.FINALIZACAO
+            self._registrar_resultado()
+
+    def _agrupar_iguais_ao_pivot(self, inicio: int, posicao_pivot: int) -> int:
+        """
+        Move os iguais ao pivot de [inicio, posicao_pivot) para junto dele.
+
+        Completa a partição em três partes (<, =, >) com uma passada sobre o
+        lado esquerdo, e retorna onde começa o bloco dos iguais.
+        """
+        valor_pivot = self.lista_atual[posicao_pivot]
+        inicio_iguais = posicao_pivot
+        for posicao in range(posicao_pivot - 1, inicio - 1, -1):
+            self.custos.ler()
+            self.custos.comparar()
+            if self.lista_atual[posicao] == valor_pivot:
+                inicio_iguais -= 1
+                self._fazer_troca(posicao, inicio_iguais)
+        return inicio_iguais
+
+    def _registrar_resultado(self) -> None:
+        """Registra o k-ésimo elemento, que já está em sua posição final"""
+        if self.elemento_k is not None:
+            return
+        self.elemento_k = self.lista_atual[self.k]
+
+        if self.callback_visual:
+            self.callback_visual('elemento_encontrado', {
+                'k': self.k,
+                'valor': self.elemento_k,
+                'lista': copy.deepcopy(self.lista_atual)
+            })
+
+    def _ordenar_grupo(self, grupo: List[int]) -> List[int]:
+        """Ordena um grupo pequeno por inserção, contando comparações"""
+        ordenado = list(grupo)
+        for i in range(1, len(ordenado)):
+            atual = ordenado[i]
+            j = i - 1
+            while j >= 0:
+                self.comparacoes_pivot += 1
+                self.custos.comparar()
+                if ordenado[j] <= atual:
+                    break
+                ordenado[j + 1] = ordenado[j]
+                j -= 1
+            ordenado[j + 1] = atual
+        return ordenado
+
+    def _mediana_das_medianas(self, valores: List[int]) -> int:
+        """
+        Retorna a mediana das medianas dos grupos de 5.
+
+        O valor devolvido é maior que ~30% e menor que ~30% dos elementos,
+        o que garante partições equilibradas e seleção em O(n) no pior caso.
+        """
+        if len(valores) <= 5:
+            return self._ordenar_grupo(valores)[(len(valores) - 1) // 2]
+
+        medianas = []
+        for i in range(0, len(valores), 5):
+            grupo = self._ordenar_grupo(valores[i:i + 5])
+            medianas.append(grupo[(len(grupo) - 1) // 2])
+
+        return self._selecionar_deterministico(medianas, (len(medianas) - 1) // 2)
+
+    def _selecionar_deterministico(self, valores: List[int], k: int) -> int:
+        """Seleção por mediana das medianas (usada para escolher o pivot)"""
+        while True:
+            if len(valores) <= 5:
+                return self._ordenar_grupo(valores)[k]
+
+            pivot = self._mediana_das_medianas(valores)
+            menores = [v for v in valores if v < pivot]
+            maiores = [v for v in valores if v > pivot]
+            self.comparacoes_pivot += 2 * len(valores)
+            self.custos.comparar(2 * len(valores))
+            quantidade_iguais = len(valores) - len(menores) - len(maiores)
+
+            if k < len(menores):
+                valores = menores
+            elif k < len(menores) + quantidade_iguais:
+                return pivot
+            else:
+                k -= len(menores) + quantidade_iguais
+                valores = maiores
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas da seleção, comparadas com ordenar tudo"""
+        estatisticas = super().obter_estatisticas()
+
+        n = len(self.lista_original)
+        # O contador de custos já inclui as comparações da escolha do pivot
+        comparacoes_totais = self.custos.comparacoes
+        # Mínimo de comparações que qualquer ordenação precisa: log2(n!)
+        comparacoes_ordenacao = math.ceil(math.lgamma(n + 1) / math.log(2)) if n > 1 else 0
+
+        estatisticas.update({
+            'k': self.k,
+            'estrategia': self.estrategia.value,
+            'elemento_k': self.elemento_k,
+            'comparacoes_pivot': self.comparacoes_pivot,
+            'comparacoes_totais': comparacoes_totais,
+            'comparacoes_minimas_ordenacao': comparacoes_ordenacao,
+            'economia_vs_ordenacao': (round((1 - comparacoes_totais / comparacoes_ordenacao) * 100, 2)
+                                      if comparacoes_ordenacao > 0 else 0)
+        })
+        return estatisticas
+
+    def obter_resultado_final(self) -> Optional[dict]:
+        """Retorna o k-ésimo elemento se a seleção estiver completa"""
+        if self.fase_atual == FaseQuickSort.FINALIZACAO:
+            return {
+                'k': self.k,
+                'elemento': self.elemento_k,
+                'lista_particionada': copy.deepcopy(self.lista_atual)
+            }
+        return None
+
+    def reiniciar(self) -> None:
+        """Reinicia o algoritmo para uma nova execução"""
+        self.__init__(self.lista_original, self.k, self.estrategia,
+                      self.callback_visual, self.semente)
@@ -7,6 +7,8 @@ import copy
 from typing import List, Tuple, Optional, Callable
 from enum import Enum
 
+from .base import MotorBase
+
 
 class FaseQuickSort(Enum):
     """Fases do algoritmo Quick Sort"""
@@ -17,15 +19,15 @@ class FaseQuickSort(Enum):
     FINALIZACAO = "finalizacao"
 
 
-class QuickSortEducativo:
+class QuickSortEducativo(MotorBase):
     """
     Implementação educativa do Quick Sort com suporte a visualização
     e interação do usuário durante o processo de particionamento
     """
     
     def __init__(self, lista_original: List[int], callback_visual: Optional[Callable] = None):
+        super().__init__(callback_visual)
         self.lista_original = copy.deepcopy(lista_original)
-        self.callback_visual = callback_visual
         self.lista_atual = copy.deepcopy(lista_original)
         
         # Pilha para simular recursão
@@ -43,6 +45,7 @@ class QuickSortEducativo:
         self.comparacoes_realizadas = 0
         self.trocas_realizadas = 0
         self.decisoes_corretas = 0
+        self.decisoes_tomadas = 0
         self.nivel_recursao = 0
         
         # Histórico
@@ -57,6 +60,7 @@ class QuickSortEducativo:
             return
             
         self.inicio_atual, self.fim_atual = self.pilha_recursao.pop()
+        self.custos.observar_auxiliar(len(self.pilha_recursao))
         
         if self.inicio_atual < self.fim_atual:
             self.fase_atual = FaseQuickSort.ESCOLHA_PIVOT
@@ -74,6 +78,8 @@ class QuickSortEducativo:
     
     def proximo_passo(self) -> bool:
         """Executa o próximo passo do algoritmo"""
+        self.custos.passo()
+        
         if self.fase_atual == FaseQuickSort.INICIALIZACAO:
             self.inicializar()
             return len(self.pilha_recursao) > 0 or self.inicio_atual < self.fim_atual
@@ -133,6 +139,7 @@ class QuickSortEducativo:
                 'lista': copy.deepcopy(self.lista_atual)
             })
         
+        self.custos.ler(2)
         self.comparacoes_realizadas += 1
         
         if elemento_atual <= valor_pivot:
@@ -162,6 +169,11 @@ class QuickSortEducativo:
         decisao_correta = (elemento_menor_que_pivot and elemento_atual <= valor_pivot) or \
                          (not elemento_menor_que_pivot and elemento_atual > valor_pivot)
         
+        self.custos.passo()
+        self.custos.ler(2)
+        self.comparacoes_realizadas += 1
+        self.decisoes_tomadas += 1
+        
         if decisao_correta:
             self.decisoes_corretas += 1
             mensagem = f"Correto! {elemento_atual} {'<=' if elemento_atual <= valor_pivot else '>'} {valor_pivot}"
@@ -193,7 +205,7 @@ class QuickSortEducativo:
             self.lista_atual[pos1], self.lista_atual[pos2] = \
                 self.lista_atual[pos2], self.lista_atual[pos1]
             
-            self.trocas_realizadas += 1
+            self.custos.trocar()
             
             # Registrar troca
             self.historico_trocas.append({
@@ -229,6 +241,9 @@ class QuickSortEducativo:
         if self.inicio_atual < posicao_pivot_final - 1:
             self.pilha_recursao.append((self.inicio_atual, posicao_pivot_final - 1))
         
+        # A pilha de subproblemas é a memória auxiliar do Quick Sort
+        self.custos.observar_auxiliar(len(self.pilha_recursao))
+        
         if self.callback_visual:
             self.callback_visual('particao_completa', {
                 'pivot_final': posicao_pivot_final,
@@ -252,7 +267,7 @@ class QuickSortEducativo:
     
     def obter_estatisticas(self) -> dict:
         """Retorna estatísticas do processo de ordenação"""
-        total_decisoes = self.comparacoes_realizadas
+        total_decisoes = self.decisoes_tomadas
         precisao = (self.decisoes_corretas / total_decisoes * 100 
                    if total_decisoes > 0 else 0)
         
@@ -263,6 +278,7 @@ class QuickSortEducativo:
             'trocas_realizadas': self.trocas_realizadas,
             'decisoes_corretas': self.decisoes_corretas,
             'precisao': round(precisao, 2),
+            'custos': self.obter_custos(),
             'subproblemas_restantes': len(self.pilha_recursao),
             'esta_completo': self.fase_atual == FaseQuickSort.FINALIZACAO
         }
@@ -0,0 +1,88 @@
+"""
+Registro dos motores de algoritmos
+Resolve os motores pelos ids de ALGORITMOS (config.py) apenas no primeiro uso
+"""
+
+import importlib
+from typing import Callable, Dict, List, Optional, Union
+
+from ..utils.config import ALGORITMOS
+
+
+class RegistroAlgoritmos:
+    """
+    Mapeia ids de algoritmos para as classes dos motores.
+
+    Cada id aponta para um caminho "modulo:Classe" dentro deste pacote (ou
+    para uma fábrica já pronta). O módulo só é importado quando o motor é
+    pedido pela primeira vez; a fábrica resolvida fica em cache, de modo que
+    as criações seguintes não passam mais pelo importlib. Novos motores entram
+    com uma chave 'motor' em ALGORITMOS ou com `registrar`, sem mudar a UI.
+    """
+
+    def __init__(self, definicoes: Optional[Dict[str, dict]] = None):
+        self._definicoes: Dict[str, dict] = {}
+        self._caminhos: Dict[str, str] = {}
+        self._fabricas: Dict[str, Callable] = {}
+
+        for identificador, definicao in (definicoes or {}).items():
+            if 'motor' in definicao:
+                self.registrar(identificador, definicao['motor'], definicao)
+
+    def registrar(self, identificador: str, motor: Union[str, Callable],
+                  definicao: Optional[dict] = None) -> None:
+        """Registra um motor por caminho "modulo:Classe" ou por fábrica"""
+        self._definicoes[identificador] = definicao or {'nome': identificador}
+        self._fabricas.pop(identificador, None)
+        self._caminhos.pop(identificador, None)
+
+        if isinstance(motor, str):
+            self._caminhos[identificador] = motor
+        else:
+            self._fabricas[identificador] = motor
+
+    def obter_fabrica(self, identificador: str) -> Callable:
+        """Retorna a classe (ou fábrica) do motor, importando-a na primeira vez"""
+        fabrica = self._fabricas.get(identificador)
+        if fabrica is not None:
+            return fabrica
+
+        caminho = self._caminhos.get(identificador)
+        if caminho is None:
+            raise ValueError(f"Algoritmo desconhecido: {identificador}")
+
+        nome_modulo, _, nome_classe = caminho.partition(':')
+        modulo = importlib.import_module(f'.{nome_modulo}', __package__)
+        fabrica = getattr(modulo, nome_classe)
+        self._fabricas[identificador] = fabrica
+        return fabrica
+
+    def criar(self, identificador: str, *args, **kwargs):
+        """Cria uma instância do motor com os argumentos do seu construtor"""
+        return self.obter_fabrica(identificador)(*args, **kwargs)
+
+    def esta_carregado(self, identificador: str) -> bool:
+        """Indica se a fábrica do motor já foi resolvida"""
+        return identificador in self._fabricas
+
+    def listar(self) -> List[str]:
+        """Retorna os ids registrados, na ordem de registro"""
+        return list(self._definicoes)
+
+    def obter_definicao(self, identificador: str) -> dict:
+        """Retorna os metadados (nome, descrição, ...) de um algoritmo"""
+        if identificador not in self._definicoes:
+            raise ValueError(f"Algoritmo desconhecido: {identificador}")
+        return self._definicoes[identificador]
+
+    def __contains__(self, identificador: str) -> bool:
+        return identificador in self._definicoes
+
+
+# Registro global, alimentado por ALGORITMOS
+registro = RegistroAlgoritmos(ALGORITMOS)
+
+
+def criar_motor(identificador: str, *args, **kwargs):
+    """Atalho para registro.criar"""
+    return registro.criar(identificador, *args, **kwargs)
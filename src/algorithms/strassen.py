@@ -0,0 +1,270 @@
+"""
+Implementação educativa da multiplicação de matrizes de Strassen
+Recursão sobre blocos NumPy, com numpy.matmul nas folhas
+"""
+
+from typing import Callable, List, Optional
+from enum import Enum
+
+import numpy as np
+
+from .base import MotorBase
+
+
+class FaseStrassen(Enum):
+    """Fases do algoritmo de Strassen"""
+    INICIALIZACAO = "inicializacao"
+    DIVISAO = "divisao"
+    CASO_BASE = "caso_base"
+    COMBINACAO = "combinacao"
+    FINALIZACAO = "finalizacao"
+
+
+class StrassenEducativo(MotorBase):
+    """
+    Multiplicação de matrizes de Strassen com suporte a visualização passo a passo.
+
+    Cada nível divide A e B em quatro blocos e calcula o produto com sete
+    multiplicações de blocos (M1..M7) em vez de oito, ao custo de 18 somas de
+    blocos, o que leva a O(n^2.807) multiplicações escalares. Blocos com até
+    `tamanho_folha` linhas são multiplicados com numpy.matmul. As matrizes são
+    preenchidas com zeros até uma dimensão divisível por 2^níveis. A recursão é
+    simulada por uma pilha, como no QuickSortEducativo.
+    """
+
+    def __init__(self, A, B, tamanho_folha: int = 64,
+                 callback_visual: Optional[Callable] = None):
+        super().__init__(callback_visual)
+        self.A = np.asarray(A)
+        self.B = np.asarray(B)
+        if self.A.ndim != 2 or self.B.ndim != 2 or self.A.shape[1] != self.B.shape[0]:
+            raise ValueError(f"Dimensões incompatíveis: {self.A.shape} x {self.B.shape}")
+
+        self.tamanho_folha = max(1, tamanho_folha)
+
+        # Dimensão preenchida: múltiplo de 2^níveis com blocos folha <= tamanho_folha
+        maior = max(self.A.shape + self.B.shape)
+        self.niveis = 0
+        while -(-maior // 2 ** self.niveis) > self.tamanho_folha:
+            self.niveis += 1
+        self.dimensao_preenchida = -(-maior // 2 ** self.niveis) * 2 ** self.niveis
+
+        # Pilha para simular recursão e pilha de produtos parciais
+        self.pilha_recursao: List[tuple] = []
+        self.pilha_resultados: List[np.ndarray] = []
+
+        # Estado atual
+        self.fase_atual = FaseStrassen.INICIALIZACAO
+        self.produto: Optional[np.ndarray] = None
+
+        # Estatísticas
+        self.multiplicacoes_escalares = 0
+        self.adicoes_escalares = 0
+        self.chamadas_recursivas = 0
+        self.casos_base = 0
+        self.profundidade_maxima = 0
+
+        # Histórico
+        self.historico_divisoes = []
+        self.historico_combinacoes = []
+
+    def inicializar(self) -> None:
+        """Preenche as matrizes com zeros e empilha o problema inteiro"""
+        self.fase_atual = FaseStrassen.DIVISAO
+
+        tipo = np.result_type(self.A, self.B)
+        p = self.dimensao_preenchida
+        A = np.zeros((p, p), dtype=tipo)
+        B = np.zeros((p, p), dtype=tipo)
+        A[:self.A.shape[0], :self.A.shape[1]] = self.A
+        B[:self.B.shape[0], :self.B.shape[1]] = self.B
+        self.custos.ler(self.A.size + self.B.size)
+        self.custos.escrever(2 * p * p)
+        self.custos.alocar(2 * p * p)
+
+        self.pilha_recursao.append(('resolver', A, B, 0))
+
+        if self.callback_visual:
+            self.callback_visual('inicializar', {
+                'dimensoes_a': self.A.shape,
+                'dimensoes_b': self.B.shape,
+                'dimensao_preenchida': p,
+                'niveis': self.niveis
+            })
+
+    def proximo_passo(self) -> bool:
+        """
+        Executa o próximo passo do algoritmo
+        Retorna True se ainda há passos a executar
+        """
+        self.custos.passo()
+
+        if self.fase_atual == FaseStrassen.INICIALIZACAO:
+            self.inicializar()
+            return True
+
+        if self.fase_atual == FaseStrassen.FINALIZACAO:
+            return False
+
+        if not self.pilha_recursao:
+            return self._finalizar()
+
+        quadro = self.pilha_recursao.pop()
+        if quadro[0] == 'resolver':
+            self._resolver(*quadro[1:])
+        else:
+            self._combinar(*quadro[1:])
+        return True
+
+    def _resolver(self, X: np.ndarray, Y: np.ndarray, profundidade: int) -> None:
+        """Multiplica a folha com matmul ou divide em sete subproblemas"""
+        self.chamadas_recursivas += 1
+        self.profundidade_maxima = max(self.profundidade_maxima, profundidade)
+
+        n = len(X)
+        if n <= self.tamanho_folha or n % 2:
+            self._resolver_caso_base(X, Y, profundidade)
+            return
+
+        self.fase_atual = FaseStrassen.DIVISAO
+        h = n // 2
+        X11, X12, X21, X22 = X[:h, :h], X[:h, h:], X[h:, :h], X[h:, h:]
+        Y11, Y12, Y21, Y22 = Y[:h, :h], Y[:h, h:], Y[h:, :h], Y[h:, h:]
+
+        # Dez somas de blocos formam os operandos dos sete produtos
+        operandos = [
+            (X11 + X22, Y11 + Y22),  # M1
+            (X21 + X22, Y11),        # M2
+            (X11, Y12 - Y22),        # M3
+            (X22, Y21 - Y11),        # M4
+            (X11 + X12, Y22),        # M5
+            (X21 - X11, Y11 + Y12),  # M6
+            (X12 - X22, Y21 + Y22),  # M7
+        ]
+        self.adicoes_escalares += 10 * h * h
+
+        # Os blocos são vistas; as dez somas ocupam memória nova até a combinação
+        self.custos.ler(20 * h * h)
+        self.custos.escrever(10 * h * h)
+        self.custos.alocar(10 * h * h)
+
+        # Empilhados ao contrário para que M1 seja resolvido primeiro
+        self.pilha_recursao.append(('combinar', h, profundidade))
+        for esquerda, direita in reversed(operandos):
+            self.pilha_recursao.append(('resolver', esquerda, direita, profundidade + 1))
+
+        self.historico_divisoes.append({
+            'dimensao': n,
+            'dimensao_bloco': h,
+            'profundidade': profundidade
+        })
+
+        if self.callback_visual:
+            self.callback_visual('divisao', {
+                'dimensao': n,
+                'dimensao_bloco': h,
+                'profundidade': profundidade
+            })
+
+    def _resolver_caso_base(self, X: np.ndarray, Y: np.ndarray, profundidade: int) -> None:
+        """Multiplicação clássica da folha com numpy.matmul"""
+        self.fase_atual = FaseStrassen.CASO_BASE
+        self.casos_base += 1
+
+        n = len(X)
+        self.pilha_resultados.append(np.matmul(X, Y))
+        self.multiplicacoes_escalares += n ** 3
+        self.adicoes_escalares += n * n * (n - 1)
+        self.custos.ler(2 * n ** 3)
+        self.custos.escrever(n * n)
+        self.custos.alocar(n * n)
+
+        if self.callback_visual:
+            self.callback_visual('caso_base', {
+                'dimensao': n,
+                'profundidade': profundidade
+            })
+
+    def _combinar(self, h: int, profundidade: int) -> None:
+        """Monta C a partir de M1..M7 com oito somas de blocos"""
+        self.fase_atual = FaseStrassen.COMBINACAO
+
+        M1, M2, M3, M4, M5, M6, M7 = self.pilha_resultados[-7:]
+        del self.pilha_resultados[-7:]
+
+        C = np.empty((2 * h, 2 * h), dtype=M1.dtype)
+        C[:h, :h] = M1 + M4 - M5 + M7
+        C[:h, h:] = M3 + M5
+        C[h:, :h] = M2 + M4
+        C[h:, h:] = M1 - M2 + M3 + M6
+        self.adicoes_escalares += 8 * h * h
+        self.custos.ler(12 * h * h)
+        self.custos.escrever(4 * h * h)
+        # Libera M1..M7 e as dez somas da divisão; C substitui os sete produtos
+        self.custos.liberar(17 * h * h)
+        self.custos.alocar(4 * h * h)
+
+        self.pilha_resultados.append(C)
+
+        self.historico_combinacoes.append({
+            'dimensao': 2 * h,
+            'profundidade': profundidade
+        })
+
+        if self.callback_visual:
+            self.callback_visual('combinacao', {
+                'dimensao': 2 * h,
+                'profundidade': profundidade
+            })
+
+    def _finalizar(self) -> bool:
+        """Finaliza o algoritmo recortando o preenchimento do produto"""
+        self.fase_atual = FaseStrassen.FINALIZACAO
+        if self.pilha_resultados:
+            C = self.pilha_resultados.pop()
+            self.produto = C[:self.A.shape[0], :self.B.shape[1]]
+
+        if self.callback_visual and self.produto is not None:
+            self.callback_visual('produto_calculado', {
+                'dimensoes': self.produto.shape,
+                'multiplicacoes_escalares': self.multiplicacoes_escalares
+            })
+        return False
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas do processo, comparadas com o algoritmo clássico"""
+        m, k = self.A.shape
+        n = self.B.shape[1]
+        multiplicacoes_classico = m * k * n
+        adicoes_classico = m * (k - 1) * n if k > 0 else 0
+        economia = ((1 - self.multiplicacoes_escalares / multiplicacoes_classico) * 100
+                    if multiplicacoes_classico > 0 else 0)
+
+        return {
+            'fase_atual': self.fase_atual.value,
+            'dimensoes_a': self.A.shape,
+            'dimensoes_b': self.B.shape,
+            'dimensao_preenchida': self.dimensao_preenchida,
+            'tamanho_folha': self.tamanho_folha,
+            'multiplicacoes_escalares': self.multiplicacoes_escalares,
+            'adicoes_escalares': self.adicoes_escalares,
+            'multiplicacoes_classico': multiplicacoes_classico,
+            'adicoes_classico': adicoes_classico,
+            'economia_multiplicacoes': round(economia, 2),
+            'chamadas_recursivas': self.chamadas_recursivas,
+            'casos_base': self.casos_base,
+            'profundidade_maxima': self.profundidade_maxima,
+            'custos': self.obter_custos(),
+            'subproblemas_restantes': len(self.pilha_recursao),
+            'esta_completo': self.fase_atual == FaseStrassen.FINALIZACAO
+        }
+
+    def obter_resultado_final(self) -> Optional[np.ndarray]:
+        """Retorna o produto A·B se a multiplicação estiver completa"""
+        if self.fase_atual == FaseStrassen.FINALIZACAO and self.produto is not None:
+            return self.produto.copy()
+        return None
+
+    def reiniciar(self) -> None:
+        """Reinicia o algoritmo para uma nova execução"""
+        self.__init__(self.A, self.B, self.tamanho_folha, self.callback_visual)
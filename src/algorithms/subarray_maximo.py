@@ -0,0 +1,286 @@
+"""
+Implementação educativa do subarray de soma máxima
+Dividir e conquistar passo a passo, com o algoritmo linear de Kadane para comparação
+"""
+
+from typing import Callable, List, Optional, Sequence, Tuple
+from enum import Enum
+
+import numpy as np
+
+from .base import MotorBase
+
+
+# Intervalos menores que isto calculam o cruzamento em Python puro
+_TAMANHO_MINIMO_VETORIZADO = 64
+
+
+class ModoSubarray(Enum):
+    """Algoritmos disponíveis para o subarray máximo"""
+    DIVIDIR_CONQUISTAR = "dividir_conquistar"  # O(n log n)
+    KADANE = "kadane"                          # O(n)
+
+
+class FaseSubarrayMaximo(Enum):
+    """Fases do algoritmo do subarray máximo"""
+    INICIALIZACAO = "inicializacao"
+    DIVISAO = "divisao"
+    COMBINACAO = "combinacao"
+    VARREDURA = "varredura"
+    FINALIZACAO = "finalizacao"
+
+
+class SubarrayMaximoEducativo(MotorBase):
+    """
+    Subarray contíguo de soma máxima (não vazio).
+
+    No modo DIVIDIR_CONQUISTAR, cada intervalo [inicio, fim] é dividido ao meio
+    e a resposta é a melhor entre a da esquerda, a da direita e a que cruza o
+    meio (melhor sufixo da esquerda + melhor prefixo da direita, obtidos com
+    somas acumuladas do NumPy). A recursão usa `pilha_recursao` como no
+    QuickSortEducativo. No modo KADANE, cada passo consome um elemento.
+
+    As operações contadas (somas e comparações) mostram que o dividir e
+    conquistar faz Θ(n log n) trabalho onde Kadane faz Θ(n).
+    """
+
+    def __init__(self, lista_original: Sequence[int],
+                 modo: ModoSubarray = ModoSubarray.DIVIDIR_CONQUISTAR,
+                 callback_visual: Optional[Callable] = None):
+        if len(lista_original) == 0:
+            raise ValueError("A lista deve ter pelo menos um elemento")
+
+        super().__init__(callback_visual)
+        self.lista_original = np.array(lista_original)
+        self._valores = self.lista_original.tolist()
+        self.modo = modo
+        self.n = len(self.lista_original)
+
+        # Pilha para simular recursão e pilha de resultados (soma, inicio, fim)
+        self.pilha_recursao: List[tuple] = [('dividir', 0, self.n - 1, 0)]
+        self.pilha_resultados: List[Tuple[int, int, int]] = []
+
+        # Estado do modo Kadane
+        self.posicao_atual = 0
+        self.soma_corrente = 0
+        self.inicio_corrente = 0
+
+        # Estado atual
+        self.fase_atual = FaseSubarrayMaximo.INICIALIZACAO
+        self.melhor_resultado: Optional[Tuple[int, int, int]] = None
+
+        # Estatísticas
+        self.somas_realizadas = 0
+        self.comparacoes_realizadas = 0
+        self.chamadas_recursivas = 0
+        self.profundidade_maxima = 0
+
+        # Histórico
+        self.historico_cruzamentos = []
+
+    def inicializar(self) -> None:
+        """Inicia a divisão ou a varredura, conforme o modo"""
+        if self.modo == ModoSubarray.KADANE:
+            self.fase_atual = FaseSubarrayMaximo.VARREDURA
+            self.pilha_recursao.clear()
+        else:
+            self.fase_atual = FaseSubarrayMaximo.DIVISAO
+
+        if self.callback_visual:
+            self.callback_visual('inicializar', {
+                'modo': self.modo.value,
+                'tamanho': self.n
+            })
+
+    def proximo_passo(self) -> bool:
+        """
+        Executa o próximo passo do algoritmo
+        Retorna True se ainda há passos a executar
+        """
+        self.custos.passo()
+
+        if self.fase_atual == FaseSubarrayMaximo.INICIALIZACAO:
+            self.inicializar()
+            return True
+
+        if self.fase_atual == FaseSubarrayMaximo.FINALIZACAO:
+            return False
+
+        if self.modo == ModoSubarray.KADANE:
+            if self.posicao_atual >= self.n:
+                return self._finalizar()
+            self._passo_kadane()
+            return True
+
+        if not self.pilha_recursao:
+            return self._finalizar()
+
+        quadro = self.pilha_recursao.pop()
+        if quadro[0] == 'dividir':
+            self._dividir(*quadro[1:])
+        else:
+            self._combinar(*quadro[1:])
+        return True
+
+    def _dividir(self, inicio: int, fim: int, profundidade: int) -> None:
+        """Resolve um elemento isolado ou divide o intervalo ao meio"""
+        self.chamadas_recursivas += 1
+        self.profundidade_maxima = max(self.profundidade_maxima, profundidade)
+
+        if inicio == fim:
+            self.pilha_resultados.append((self._valores[inicio], inicio, fim))
+            self.custos.ler()
+            return
+
+        self.fase_atual = FaseSubarrayMaximo.DIVISAO
+        meio = (inicio + fim) // 2
+
+        # Direita empilhada primeiro para que a esquerda seja resolvida antes
+        self.pilha_recursao.append(('combinar', inicio, meio, fim, profundidade))
+        self.pilha_recursao.append(('dividir', meio + 1, fim, profundidade + 1))
+        self.pilha_recursao.append(('dividir', inicio, meio, profundidade + 1))
+        self.custos.observar_auxiliar(len(self.pilha_recursao) + len(self.pilha_resultados))
+
+        if self.callback_visual:
+            self.callback_visual('divisao', {
+                'inicio': inicio,
+                'meio': meio,
+                'fim': fim,
+                'profundidade': profundidade
+            })
+
+    def _combinar(self, inicio: int, meio: int, fim: int, profundidade: int) -> None:
+        """Escolhe entre a melhor da esquerda, da direita e a que cruza o meio"""
+        self.fase_atual = FaseSubarrayMaximo.COMBINACAO
+
+        direita = self.pilha_resultados.pop()
+        esquerda = self.pilha_resultados.pop()
+
+        # Melhor sufixo de [inicio, meio] e melhor prefixo de [meio + 1, fim]
+        tamanho = fim - inicio + 1
+        if tamanho >= _TAMANHO_MINIMO_VETORIZADO:
+            sufixos = np.cumsum(self.lista_original[meio:inicio - 1 if inicio else None:-1])
+            prefixos = np.cumsum(self.lista_original[meio + 1:fim + 1])
+            k = int(np.argmax(sufixos))
+            r = int(np.argmax(prefixos))
+            cruzando = ((sufixos[k] + prefixos[r]).item(), meio - k, meio + 1 + r)
+        else:
+            cruzando = self._cruzamento_escalar(inicio, meio, fim)
+
+        self.somas_realizadas += tamanho + 1
+        self.comparacoes_realizadas += tamanho + 2
+        self.custos.ler(tamanho)
+
+        melhor = max(esquerda, direita, cruzando, key=lambda resultado: resultado[0])
+        self.pilha_resultados.append(melhor)
+
+        self.historico_cruzamentos.append({
+            'inicio': inicio,
+            'meio': meio,
+            'fim': fim,
+            'soma_cruzando': cruzando[0],
+            'profundidade': profundidade
+        })
+
+        if self.callback_visual:
+            self.callback_visual('combinacao', {
+                'inicio': inicio,
+                'fim': fim,
+                'esquerda': esquerda,
+                'direita': direita,
+                'cruzando': cruzando,
+                'melhor': melhor,
+                'profundidade': profundidade
+            })
+
+    def _cruzamento_escalar(self, inicio: int, meio: int, fim: int) -> Tuple[int, int, int]:
+        """Mesmo cálculo do cruzamento sem NumPy, mais barato em intervalos curtos"""
+        valores = self._valores
+        soma = 0
+        melhor_esquerda, inicio_melhor = valores[meio], meio
+        for i in range(meio, inicio - 1, -1):
+            soma += valores[i]
+            if soma > melhor_esquerda:
+                melhor_esquerda, inicio_melhor = soma, i
+
+        soma = 0
+        melhor_direita, fim_melhor = valores[meio + 1], meio + 1
+        for j in range(meio + 1, fim + 1):
+            soma += valores[j]
+            if soma > melhor_direita:
+                melhor_direita, fim_melhor = soma, j
+
+        return melhor_esquerda + melhor_direita, inicio_melhor, fim_melhor
+
+    def _passo_kadane(self) -> None:
+        """Estende o subarray corrente ou recomeça no elemento atual"""
+        i = self.posicao_atual
+        valor = self._valores[i]
+        self.custos.ler()
+
+        if i == 0 or self.soma_corrente <= 0:
+            self.soma_corrente = valor
+            self.inicio_corrente = i
+        else:
+            self.soma_corrente += valor
+            self.somas_realizadas += 1
+        self.comparacoes_realizadas += 2
+
+        if self.melhor_resultado is None or self.soma_corrente > self.melhor_resultado[0]:
+            self.melhor_resultado = (self.soma_corrente, self.inicio_corrente, i)
+
+        self.posicao_atual += 1
+
+        if self.callback_visual:
+            self.callback_visual('varredura', {
+                'posicao': i,
+                'soma_corrente': self.soma_corrente,
+                'melhor': self.melhor_resultado
+            })
+
+    def _finalizar(self) -> bool:
+        """Finaliza o algoritmo com o melhor subarray"""
+        self.fase_atual = FaseSubarrayMaximo.FINALIZACAO
+        if self.pilha_resultados:
+            self.melhor_resultado = self.pilha_resultados.pop()
+
+        if self.callback_visual and self.melhor_resultado is not None:
+            soma, inicio, fim = self.melhor_resultado
+            self.callback_visual('subarray_encontrado', {
+                'soma': soma,
+                'inicio': inicio,
+                'fim': fim
+            })
+        return False
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas do processo"""
+        return {
+            'fase_atual': self.fase_atual.value,
+            'modo': self.modo.value,
+            'tamanho': self.n,
+            'somas_realizadas': self.somas_realizadas,
+            'comparacoes_realizadas': self.comparacoes_realizadas,
+            'operacoes_totais': self.somas_realizadas + self.comparacoes_realizadas,
+            'chamadas_recursivas': self.chamadas_recursivas,
+            'profundidade_maxima': self.profundidade_maxima,
+            'custos': self.obter_custos(),
+            'subproblemas_restantes': len(self.pilha_recursao),
+            'esta_completo': self.fase_atual == FaseSubarrayMaximo.FINALIZACAO
+        }
+
+    def obter_resultado_final(self) -> Optional[dict]:
+        """Retorna o subarray máximo (índices inclusivos) se o algoritmo estiver completo"""
+        if self.fase_atual == FaseSubarrayMaximo.FINALIZACAO and self.melhor_resultado:
+            soma, inicio, fim = self.melhor_resultado
+            return {
+                'soma': soma,
+                'inicio': inicio,
+                'fim': fim,
+                'subarray': self.lista_original[inicio:fim + 1].tolist()
+            }
+        return None
+
+    def reiniciar(self) -> None:
+        """Reinicia o algoritmo para uma nova execução"""
+        self.__init__(self.lista_original, self.modo, self.callback_visual)
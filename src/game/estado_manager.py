@@ -3,12 +3,21 @@ Sistema de gerenciamento de estados do jogo
 """
 from abc import ABC, abstractmethod
 import pygame
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from ..ui.regioes import regioes_sujas
+from ..utils.config import CORES
 
 
 class Estado(ABC):
     """Classe base abstrata para todos os estados do jogo"""
     
+    # Estados que invalidam tudo o que mudam podem ser redesenhados por regiões;
+    # os demais são redesenhados por inteiro a cada quadro
+    suporta_regioes_sujas = False
+    
+    # Estados que pintam o próprio fundo opaco dispensam o fill com CORES['FUNDO']
+    cobre_tela_inteira = False
+    
     def __init__(self, game_manager):
         self.game_manager = game_manager
         self.tela = game_manager.tela
@@ -29,6 +38,33 @@ class Estado(ABC):
         """Renderiza o estado na tela"""
         pass
     
+    def esta_animando(self) -> bool:
+        """
+        Se a tela muda sozinha nos próximos quadros, sem depender de eventos.
+        
+        Quando é falso, o loop principal dorme até o próximo evento. Por
+        padrão o estado é considerado sempre animado.
+        """
+        return True
+    
+    def invalidar(self, rect: Optional[pygame.Rect] = None) -> None:
+        """Pede o redesenho de uma área desenhada pelo próprio estado (None = tela inteira)"""
+        regioes_sujas.invalidar(rect)
+    
+    def renderizar_regioes(self, regioes: List[pygame.Rect]) -> None:
+        """
+        Redesenha apenas as regiões pedidas.
+        
+        Por padrão, o estado inteiro é desenhado com a tela recortada em cada
+        região: só os pixels dentro dela são tocados.
+        """
+        for regiao in regioes:
+            self.tela.set_clip(regiao)
+            if not self.cobre_tela_inteira:
+                self.tela.fill(CORES['FUNDO'])
+            self.renderizar()
+        self.tela.set_clip(None)
+    
     def entrar(self) -> None:
         """Chamado quando o estado é ativado"""
         pass
@@ -100,3 +136,7 @@ class GerenciadorEstados:
         """Renderiza o estado atual"""
         if self.estado_atual:
             self.estado_atual.renderizar()
+            
+    def esta_animando(self) -> bool:
+        """Se o estado atual precisa de quadros mesmo sem eventos"""
+        return self.estado_atual is not None and self.estado_atual.esta_animando()
@@ -6,14 +6,19 @@ import random
 import time
 from typing import List, Optional, Tuple
 from ..estado_manager import Estado
-from ...ui.componentes import BlocoNumero, Texto, BarraProgresso, Botao
+from ...ui.componentes import BlocoNumero, Texto, BarraProgresso, Botao, PoolBlocos
 from ...utils.config import CORES, FONTES, LARGURA, ALTURA, VISUAL, NIVEIS, JOGO
 from ..pontuacao import SistemaPontuacao
+from ...algorithms.base import ContadorCustos
+from ...utils.distribuicoes import gerar
 
 
 class EstadoJogo(Estado):
     """Estado principal do jogo com Merge Sort interativo"""
     
+    suporta_regioes_sujas = True
+    cobre_tela_inteira = True
+    
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.pontuacao_sistema = SistemaPontuacao()
@@ -30,11 +35,22 @@ class EstadoJogo(Estado):
         self.elementos_comparacao = []
         self.tempo_resposta_inicio = 0
         self.blocos_numeros = []
+        
+        # Cena retida das sublistas: blocos refeitos só quando as sublistas mudam
+        self.pool_blocos = PoolBlocos()
+        self.blocos_sublistas = []
+        self.versao_sublistas = 0
+        self.versao_blocos_sublistas = -1
+        
         self.nivel = 'FACIL'
+        self.semente = None
         self.animando = False
         self.jogo_concluido = False
         self.jogo_pausado = False
         
+        # Custos da ordenação no mesmo modelo dos motores de algoritmos
+        self.custos = ContadorCustos()
+        
         # UI
         self.inicializar_ui()
         
@@ -63,6 +79,30 @@ class EstadoJogo(Estado):
             CORES['TEXTO']
         )
         
+        self.texto_custos = Texto(
+            LARGURA // 2, 140,
+            "",
+            FONTES['PEQUENA'],
+            CORES['HOVER'],
+            centralizado=True
+        )
+        
+        self.texto_atalhos = Texto(
+            LARGURA // 2, ALTURA - 50,
+            "ESC: Menu | ESPAÇO: Pausa | R: Reiniciar",
+            FONTES['PEQUENA'],
+            CORES['HOVER'],
+            centralizado=True
+        )
+        
+        self.texto_pausa = Texto(
+            LARGURA // 2, ALTURA // 2,
+            "JOGO PAUSADO\nPressione ESPAÇO para continuar",
+            FONTES['TITULO'],
+            CORES['TEXTO'],
+            centralizado=True
+        )
+        
         # Barra de progresso
         self.barra_progresso = BarraProgresso(
             LARGURA // 2 - 200, 100,
@@ -87,21 +127,27 @@ class EstadoJogo(Estado):
             CORES['SECUNDARIA']
         )
         
-    def iniciar_novo_jogo(self, nivel: str):
-        """Inicia um novo jogo com o nível especificado"""
+    def iniciar_novo_jogo(self, nivel: str, semente: Optional[int] = None):
+        """Inicia um novo jogo com o nível especificado (a mesma semente repete a lista)"""
         self.nivel = nivel
         config_nivel = NIVEIS[nivel]
+        self.invalidar()
         
-        # Gerar lista aleatória
+        # Gerar lista aleatória de valores distintos
         quantidade = config_nivel['elementos']
-        self.lista_original = random.sample(range(JOGO['MIN_VALOR'], JOGO['MAX_VALOR']), quantidade)
+        self.semente = semente if semente is not None else random.getrandbits(32)
+        self.lista_original = gerar('aleatorio', quantidade, self.semente,
+                                    minimo=JOGO['MIN_VALOR'], maximo=JOGO['MAX_VALOR'],
+                                    distintos=True).tolist()
         
         # Inicializar sublistas (cada elemento em sua própria lista)
         self.sublistas = [[num] for num in self.lista_original]
+        self.marcar_sublistas_alteradas()
         self.fase_atual = 0
         self.subfase_atual = 0
         self.jogo_concluido = False
         self.jogo_pausado = False
+        self.custos.zerar()
         
         # Inicializar sistema de pontuação
         self.pontuacao_sistema.iniciar_partida(nivel, quantidade)
@@ -109,6 +155,7 @@ class EstadoJogo(Estado):
         # Atualizar UI
         self.texto_nivel.definir_texto(f"Nível: {config_nivel['nome']}")
         self.atualizar_pontuacao_ui()
+        self.atualizar_custos_ui()
         self.atualizar_progresso()
         
         # Preparar primeira fusão
@@ -156,6 +203,9 @@ class EstadoJogo(Estado):
         self.i = 0  # Índice para lista1
         self.j = 0  # Índice para lista2
         
+        # Buffer da fusão: memória auxiliar do tamanho das duas sublistas
+        self.custos.alocar(len(self.lista1) + len(self.lista2))
+        
         self.aguardando_resposta = True
         self.apresentar_comparacao()
         
@@ -164,12 +214,16 @@ class EstadoJogo(Estado):
         if self.i >= len(self.lista1):
             # Terminou lista1, adicionar resto da lista2
             self.resultado_fusao.extend(self.lista2[self.j:])
+            self.custos.ler(len(self.lista2) - self.j)
+            self.custos.escrever(len(self.lista2) - self.j)
             self.finalizar_fusao()
             return
             
         if self.j >= len(self.lista2):
             # Terminou lista2, adicionar resto da lista1
             self.resultado_fusao.extend(self.lista1[self.i:])
+            self.custos.ler(len(self.lista1) - self.i)
+            self.custos.escrever(len(self.lista1) - self.i)
             self.finalizar_fusao()
             return
             
@@ -195,6 +249,7 @@ class EstadoJogo(Estado):
         valor1, valor2 = self.lista1[self.i], self.lista2[self.j]
         escolha_correta = min(valor1, valor2)
         tempo_resposta = time.time() - self.tempo_resposta_inicio
+        self.custos.passo()
         
         if valor_escolhido == escolha_correta:
             # Resposta correta
@@ -202,8 +257,11 @@ class EstadoJogo(Estado):
             self.mostrar_feedback(f"+{pontos} pontos!", CORES['SUCESSO'])
             self.game_manager.audio.tocar_som('acerto')
             
-            # Adicionar elemento correto ao resultado
+            # Adicionar elemento correto ao resultado (uma comparação da fusão)
             self.resultado_fusao.append(valor_escolhido)
+            self.custos.comparar()
+            self.custos.ler(2)
+            self.custos.escrever()
             
             # Avançar índices
             if valor_escolhido == valor1:
@@ -221,6 +279,7 @@ class EstadoJogo(Estado):
         
         # Continuar com próxima comparação
         self.apresentar_comparacao()
+        self.atualizar_custos_ui()
         return True
         
     def finalizar_fusao(self):
@@ -230,6 +289,8 @@ class EstadoJogo(Estado):
         # Substituir as duas sublistas pelo resultado
         idx = self.subfase_atual * 2
         self.sublistas[idx:idx+2] = [self.resultado_fusao]
+        self.marcar_sublistas_alteradas()
+        self.custos.liberar(len(self.resultado_fusao))
         
         # Próxima subfase
         self.subfase_atual += 1
@@ -253,6 +314,7 @@ class EstadoJogo(Estado):
                 novas_sublistas.append(self.sublistas[i])
                 
         self.sublistas = novas_sublistas
+        self.marcar_sublistas_alteradas()
         self.subfase_atual = 0
         self.preparar_proxima_fusao()
         
@@ -275,9 +337,14 @@ class EstadoJogo(Estado):
         # Atualizar progresso para 100%
         self.barra_progresso.definir_valor(100)
         
+        # As instruções de atalho deixam de ser desenhadas
+        self.texto_atalhos.invalidar()
+        
     def mostrar_feedback(self, texto: str, cor: Tuple[int, int, int]):
         """Mostra feedback visual temporário"""
         # Implementação simples - poderia ser mais elaborada
+        if hasattr(self, 'feedback_texto'):
+            self.feedback_texto.invalidar()
         self.feedback_texto = Texto(
             LARGURA // 2, 180,
             texto,
@@ -285,6 +352,7 @@ class EstadoJogo(Estado):
             cor,
             centralizado=True
         )
+        self.feedback_texto.invalidar()
         
     def mostrar_resultado_fusao(self):
         """Mostra o resultado da fusão atual"""
@@ -293,6 +361,8 @@ class EstadoJogo(Estado):
         
     def atualizar_blocos_visuais(self):
         """Atualiza a representação visual dos blocos"""
+        for bloco in self.blocos_numeros:
+            bloco.invalidar()
         self.blocos_numeros.clear()
         
         if not self.elementos_comparacao:
@@ -308,13 +378,21 @@ class EstadoJogo(Estado):
             cor = CORES['SUCESSO'] if origem == 'lista1' else CORES['SECUNDARIA']
             
             bloco = BlocoNumero(x, y, valor, cor)
-            bloco.destacar(True)
+            bloco.destacar(True)  # Também invalida a área do bloco novo
             self.blocos_numeros.append(bloco)
             
     def atualizar_pontuacao_ui(self):
         """Atualiza a exibição da pontuação"""
         self.texto_pontuacao.definir_texto(f"Pontos: {self.pontuacao_sistema.pontuacao_atual}")
         
+    def atualizar_custos_ui(self):
+        """Atualiza a exibição dos custos da ordenação"""
+        custos = self.custos
+        self.texto_custos.definir_texto(
+            f"Comparações: {custos.comparacoes} | Leituras: {custos.leituras} | "
+            f"Escritas: {custos.escritas} | Memória auxiliar (pico): {custos.pico_auxiliar}"
+        )
+        
     def atualizar_progresso(self):
         """Atualiza a barra de progresso"""
         if not self.lista_original:
@@ -336,8 +414,8 @@ class EstadoJogo(Estado):
         """Pausa/despausa o jogo"""
         self.jogo_pausado = not self.jogo_pausado
         texto_botao = "▶ Continuar" if self.jogo_pausado else "⏸ Pausa"
-        self.botao_pausa.texto = texto_botao
-        self.botao_pausa.superficie_texto = self.botao_pausa.fonte.render(texto_botao, True, self.botao_pausa.cor_texto)
+        self.botao_pausa.definir_texto(texto_botao)
+        self.invalidar()  # O overlay de pausa cobre a tela inteira
         
     def reiniciar_jogo(self):
         """Reinicia o jogo com o mesmo nível"""
@@ -401,6 +479,12 @@ class EstadoJogo(Estado):
         for bloco in self.blocos_numeros:
             bloco.atualizar(dt)
             
+    def esta_animando(self):
+        """Componentes em transição; o timer entre fusões chega como evento"""
+        # Os tweens avançam no agendador mesmo com o jogo pausado
+        componentes = [self.barra_progresso, self.botao_pausa, self.botao_reiniciar] + self.blocos_numeros
+        return any(componente.esta_animando() for componente in componentes)
+        
     def renderizar(self):
         """Renderiza o estado do jogo"""
         # Fundo
@@ -415,14 +499,7 @@ class EstadoJogo(Estado):
             self.tela.blit(overlay, (0, 0))
             
             # Texto de pausa
-            texto_pausa = Texto(
-                LARGURA // 2, ALTURA // 2,
-                "JOGO PAUSADO\nPressione ESPAÇO para continuar",
-                FONTES['TITULO'],
-                CORES['TEXTO'],
-                centralizado=True
-            )
-            texto_pausa.renderizar(self.tela)
+            self.texto_pausa.renderizar(self.tela)
             self.botao_pausa.renderizar(self.tela)
             return
             
@@ -430,6 +507,7 @@ class EstadoJogo(Estado):
         self.texto_instrucao.renderizar(self.tela)
         self.texto_pontuacao.renderizar(self.tela)
         self.texto_nivel.renderizar(self.tela)
+        self.texto_custos.renderizar(self.tela)
         self.barra_progresso.renderizar(self.tela)
         self.botao_pausa.renderizar(self.tela)
         self.botao_reiniciar.renderizar(self.tela)
@@ -447,20 +525,36 @@ class EstadoJogo(Estado):
         
         # Instruções
         if not self.jogo_concluido:
-            instrucoes = Texto(
-                LARGURA // 2, ALTURA - 50,
-                "ESC: Menu | ESPAÇO: Pausa | R: Reiniciar",
-                FONTES['PEQUENA'],
-                CORES['HOVER'],
-                centralizado=True
-            )
-            instrucoes.renderizar(self.tela)
+            self.texto_atalhos.renderizar(self.tela)
             
+    def marcar_sublistas_alteradas(self):
+        """Avisa a cena retida que as sublistas mudaram"""
+        self.versao_sublistas += 1
+        
+        # Os blocos antigos e as linhas do novo layout precisam ser redesenhados
+        for bloco in self.blocos_sublistas:
+            bloco.invalidar()
+        self.invalidar(self.area_sublistas())
+        
+    def area_sublistas(self) -> pygame.Rect:
+        """Faixa da tela ocupada pelas linhas de sublistas (mesmo layout de reconstruir_blocos_sublistas)"""
+        linhas = (len(self.sublistas) + 5) // 6
+        return pygame.Rect(0, 400, LARGURA, linhas * 80)
+        
     def renderizar_sublistas(self):
         """Renderiza as sublistas atuais em formato visual"""
-        if not self.sublistas:
-            return
+        if self.versao_blocos_sublistas != self.versao_sublistas:
+            self.reconstruir_blocos_sublistas()
             
+        for bloco in self.blocos_sublistas:
+            bloco.renderizar(self.tela)
+            
+    def reconstruir_blocos_sublistas(self):
+        """Posiciona os blocos das sublistas, reciclando os do layout anterior"""
+        self.pool_blocos.devolver(self.blocos_sublistas)
+        self.blocos_sublistas = []
+        self.versao_blocos_sublistas = self.versao_sublistas
+        
         y_base = 400
         max_sublistas_por_linha = 6
         
@@ -483,8 +577,7 @@ class EstadoJogo(Estado):
                 # Desenhar cada sublista
                 for i, num in enumerate(sublista):
                     x = x_atual + i * (VISUAL['BLOCO_LARGURA'] + 5)
-                    bloco = BlocoNumero(x, y, num, CORES['CARD'])
-                    bloco.renderizar(self.tela)
+                    self.blocos_sublistas.append(self.pool_blocos.obter(x, y, num, CORES['CARD']))
                     
                 x_atual += len(sublista) * (VISUAL['BLOCO_LARGURA'] + 5) + 20
                 
@@ -3,20 +3,27 @@ Estado do menu principal
 """
 import pygame
 import math
+import random
 from ..estado_manager import Estado
 from ...ui.componentes import Botao, Texto
+from ...ui.fontes import desenhar_texto
+from ...ui.camadas import CompositorCamadas
+from ...ui.particulas import SistemaParticulas
 from ...utils.config import CORES, FONTES, LARGURA, ALTURA, VISUAL
 
 
 class EstadoMenu(Estado):
     """Menu principal do jogo"""
     
+    cobre_tela_inteira = True
+    
     def __init__(self, game_manager):
         super().__init__(game_manager)
-        self.particulas = []
         self.tempo_animacao = 0
+        self.tempo_animacao_anterior = 0  # Do passo anterior, para interpolar
         self.inicializar_ui()
         self.inicializar_particulas()
+        self.inicializar_camadas()
         
     def inicializar_ui(self):
         """Inicializa elementos da interface"""
@@ -93,17 +100,20 @@ class EstadoMenu(Estado):
         
     def inicializar_particulas(self):
         """Inicializa sistema de partículas de fundo"""
-        import random
-        for _ in range(50):
-            particula = {
-                'x': random.randint(0, LARGURA),
-                'y': random.randint(0, ALTURA),
-                'velocidade': random.uniform(0.5, 2.0),
-                'tamanho': random.randint(2, 5),
-                'cor': (*CORES['PRINCIPAL'], random.randint(50, 150))
-            }
-            self.particulas.append(particula)
+        self.particulas = SistemaParticulas(
+            VISUAL['PARTICULAS_MENU'], LARGURA, ALTURA,
+            CORES['PRINCIPAL'],
+            semente=random.getrandbits(32)
+        )
             
+    def inicializar_camadas(self):
+        """Gradiente em cache por baixo; partículas, título e interface redesenhados"""
+        self.compositor = CompositorCamadas()
+        self.compositor.adicionar_estatica('fundo', self.desenhar_fundo_gradiente)
+        self.compositor.adicionar_dinamica('particulas', self.renderizar_particulas)
+        self.compositor.adicionar_dinamica('titulo', self.renderizar_titulo_animado)
+        self.compositor.adicionar_dinamica('interface', self.renderizar_interface)
+        
     def iniciar_jogo(self):
         """Inicia o jogo"""
         self.game_manager.audio.tocar_som('clique')
@@ -147,84 +157,64 @@ class EstadoMenu(Estado):
                     self.game_manager.audio.tocar_som('hover')
                     
     def atualizar(self, dt):
-        """Atualiza o menu"""
+        """Atualiza o menu (chamado a cada passo fixo da simulação)"""
+        self.tempo_animacao_anterior = self.tempo_animacao
         self.tempo_animacao += dt
         
         # Atualizar botões
         for botao in self.botoes:
             botao.atualizar(dt)
             
-        # Atualizar partículas
-        for particula in self.particulas:
-            particula['y'] += particula['velocidade']
-            if particula['y'] > ALTURA:
-                particula['y'] = -particula['tamanho']
+        # Atualizar partículas (vetorizado)
+        self.particulas.atualizar(dt)
                 
     def renderizar(self):
-        """Renderiza o menu"""
-        # Fundo gradiente
-        self.desenhar_fundo_gradiente()
+        """Renderiza o menu (o gradiente de fundo vem do cache do compositor)"""
+        self.compositor.renderizar(self.tela)
         
-        # Partículas de fundo
-        self.renderizar_particulas()
+    def tempo_interpolado(self) -> float:
+        """Tempo de animação entre os dois últimos passos da simulação"""
+        return self.game_manager.relogio.interpolar(self.tempo_animacao_anterior, self.tempo_animacao)
         
-        # Título com efeito
-        self.renderizar_titulo_animado()
+    def renderizar_interface(self, tela: pygame.Surface):
+        """Subtítulo, botões e créditos"""
+        self.subtitulo.renderizar(tela)
         
-        # Subtítulo
-        self.subtitulo.renderizar(self.tela)
-        
-        # Botões
         for botao in self.botoes:
-            botao.renderizar(self.tela)
+            botao.renderizar(tela)
             
-        # Créditos
-        self.creditos.renderizar(self.tela)
+        self.creditos.renderizar(tela)
         
-    def desenhar_fundo_gradiente(self):
-        """Desenha um fundo gradiente"""
-        for y in range(ALTURA):
+    def desenhar_fundo_gradiente(self, superficie: pygame.Surface):
+        """Desenha um fundo gradiente (uma vez, na camada estática)"""
+        largura, altura = superficie.get_size()
+        for y in range(altura):
             # Interpolar entre as cores do fundo
-            fator = y / ALTURA
+            fator = y / altura
             r = int(CORES['FUNDO'][0] * (1 - fator) + CORES['CARD'][0] * fator)
             g = int(CORES['FUNDO'][1] * (1 - fator) + CORES['CARD'][1] * fator)
             b = int(CORES['FUNDO'][2] * (1 - fator) + CORES['CARD'][2] * fator)
             
-            pygame.draw.line(self.tela, (r, g, b), (0, y), (LARGURA, y))
+            pygame.draw.line(superficie, (r, g, b), (0, y), (largura, y))
             
-    def renderizar_particulas(self):
+    def renderizar_particulas(self, tela: pygame.Surface):
         """Renderiza partículas de fundo"""
-        for particula in self.particulas:
-            # Aplicar transparência baseada no tempo
-            alpha = int(128 + 127 * math.sin(self.tempo_animacao * 2 + particula['x'] * 0.01))
-            cor_com_alpha = (*particula['cor'][:3], alpha)
-            
-            # Criar surface temporária para transparência
-            superficie = pygame.Surface((particula['tamanho'] * 2, particula['tamanho'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(superficie, cor_com_alpha, 
-                             (particula['tamanho'], particula['tamanho']), 
-                             particula['tamanho'])
-            
-            self.tela.blit(superficie, (int(particula['x']), int(particula['y'])))
+        self.particulas.renderizar(tela, self.tempo_interpolado(), self.game_manager.relogio.alfa)
             
-    def renderizar_titulo_animado(self):
+    def renderizar_titulo_animado(self, tela: pygame.Surface):
         """Renderiza o título com efeito de animação"""
+        tempo = self.tempo_interpolado()
+        
         # Efeito de flutuação
-        offset_y = int(10 * math.sin(self.tempo_animacao * 3))
+        offset_y = int(10 * math.sin(tempo * 3))
         
         # Efeito de brilho
-        brilho = int(50 + 25 * math.sin(self.tempo_animacao * 4))
+        brilho = int(50 + 25 * math.sin(tempo * 4))
         cor_brilho = tuple(min(255, c + brilho) for c in CORES['DESTAQUE'])
         
-        # Renderizar título com posição animada
-        titulo_animado = Texto(
-            LARGURA // 2, 150 + offset_y,
-            "MERGE MIND",
-            FONTES['TITULO'],
-            cor_brilho,
-            centralizado=True
-        )
-        titulo_animado.renderizar(self.tela)
+        # Renderizar título com posição animada (uma superfície por nível de brilho, em cache)
+        desenhar_texto(tela, "MERGE MIND", LARGURA // 2, 150 + offset_y,
+                       FONTES['TITULO'], cor_brilho, centralizado=True)
         
     def entrar(self):
         """Chamado ao entrar no estado"""
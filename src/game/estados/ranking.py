@@ -4,6 +4,8 @@ Estado do ranking e estatísticas
 import pygame
 from ..estado_manager import Estado
 from ...ui.componentes import Botao, Texto
+from ...ui.fontes import desenhar_texto
+from ...ui.camadas import CompositorCamadas
 from ...utils.config import CORES, FONTES, LARGURA, ALTURA
 from ..pontuacao import SistemaPontuacao
 
@@ -11,11 +13,15 @@ from ..pontuacao import SistemaPontuacao
 class EstadoRanking(Estado):
     """Tela de ranking e estatísticas"""
     
+    suporta_regioes_sujas = True
+    cobre_tela_inteira = True
+    
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.pontuacao_sistema = SistemaPontuacao()
         self.scroll_y = 0
         self.inicializar_ui()
+        self.inicializar_camadas()
         
     def inicializar_ui(self):
         """Inicializa elementos da interface"""
@@ -46,6 +52,15 @@ class EstadoRanking(Estado):
             CORES['SECUNDARIA']
         )
         
+        # Instruções
+        self.texto_instrucoes = Texto(
+            LARGURA // 2, ALTURA - 150,
+            "Use ↑↓ ou scroll do mouse para navegar",
+            FONTES['PEQUENA'],
+            CORES['HOVER'],
+            centralizado=True
+        )
+        
         self.atualizar_dados()
         
     def atualizar_dados(self):
@@ -63,6 +78,14 @@ class EstadoRanking(Estado):
         self.game_manager.audio.tocar_som('clique')
         self.pontuacao_sistema.resetar_estatisticas()
         self.atualizar_dados()
+        self.invalidar()
+        
+    def rolar(self, deslocamento: int):
+        """Rola o conteúdo, limitado a [0, 500]"""
+        scroll_y = max(0, min(500, self.scroll_y + deslocamento))
+        if scroll_y != self.scroll_y:
+            self.scroll_y = scroll_y
+            self.invalidar()  # Todo o conteúdo se move
         
     def processar_eventos(self, eventos):
         """Processa eventos do ranking"""
@@ -74,12 +97,12 @@ class EstadoRanking(Estado):
                 if evento.key == pygame.K_ESCAPE:
                     self.voltar_menu()
                 elif evento.key == pygame.K_UP:
-                    self.scroll_y = max(0, self.scroll_y - 30)
+                    self.rolar(-30)
                 elif evento.key == pygame.K_DOWN:
-                    self.scroll_y = min(500, self.scroll_y + 30)
+                    self.rolar(30)
                     
             elif evento.type == pygame.MOUSEWHEEL:
-                self.scroll_y = max(0, min(500, self.scroll_y - evento.y * 30))
+                self.rolar(-evento.y * 30)
                 
             # Processar eventos dos botões
             if self.botao_voltar.processar_evento(evento):
@@ -92,14 +115,27 @@ class EstadoRanking(Estado):
         self.botao_voltar.atualizar(dt)
         self.botao_resetar.atualizar(dt)
         
+    def esta_animando(self):
+        """Só os botões animam nesta tela"""
+        return self.botao_voltar.esta_animando() or self.botao_resetar.esta_animando()
+        
+    def inicializar_camadas(self):
+        """Fundo e título em cache; o conteúdo rola por cima deles"""
+        self.compositor = CompositorCamadas()
+        self.compositor.adicionar_estatica('fundo', self.desenhar_fundo)
+        self.compositor.adicionar_dinamica('conteudo', self.renderizar_conteudo)
+        
     def renderizar(self):
         """Renderiza a tela de ranking"""
-        # Fundo
-        self.tela.fill(CORES['FUNDO'])
+        self.compositor.renderizar(self.tela)
         
-        # Título
-        self.titulo.renderizar(self.tela)
+    def desenhar_fundo(self, superficie: pygame.Surface):
+        """Partes fixas da tela (camada estática)"""
+        superficie.fill(CORES['FUNDO'])
+        self.titulo.renderizar(superficie)
         
+    def renderizar_conteudo(self, tela: pygame.Surface):
+        """Estatísticas, top 10, botões e instruções"""
         # Divisão em duas colunas
         coluna_esquerda = LARGURA // 2 - 50
         coluna_direita = LARGURA // 2 + 50
@@ -112,30 +148,17 @@ class EstadoRanking(Estado):
         self.renderizar_top_10(coluna_direita, y_base)
         
         # Botões
-        self.botao_voltar.renderizar(self.tela)
-        self.botao_resetar.renderizar(self.tela)
+        self.botao_voltar.renderizar(tela)
+        self.botao_resetar.renderizar(tela)
         
         # Instruções
-        instrucoes = Texto(
-            LARGURA // 2, ALTURA - 150,
-            "Use ↑↓ ou scroll do mouse para navegar",
-            FONTES['PEQUENA'],
-            CORES['HOVER'],
-            centralizado=True
-        )
-        instrucoes.renderizar(self.tela)
+        self.texto_instrucoes.renderizar(tela)
         
     def renderizar_estatisticas_gerais(self, x: int, y: int):
         """Renderiza estatísticas gerais"""
         # Título da seção
-        titulo_stats = Texto(
-            x + 150, y,
-            "📊 ESTATÍSTICAS GERAIS",
-            FONTES['SUBTITULO'],
-            CORES['PRINCIPAL'],
-            centralizado=True
-        )
-        titulo_stats.renderizar(self.tela)
+        desenhar_texto(self.tela, "📊 ESTATÍSTICAS GERAIS", x + 150, y,
+                       FONTES['SUBTITULO'], CORES['PRINCIPAL'], centralizado=True)
         
         y_atual = y + 50
         espacamento = 35
@@ -154,47 +177,20 @@ class EstadoRanking(Estado):
         ]
         
         for label, valor in estatisticas:
-            # Label
-            texto_label = Texto(
-                x, y_atual,
-                label,
-                FONTES['NORMAL'],
-                CORES['TEXTO']
-            )
-            texto_label.renderizar(self.tela)
-            
-            # Valor
-            texto_valor = Texto(
-                x + 200, y_atual,
-                valor,
-                FONTES['NORMAL'],
-                CORES['DESTAQUE']
-            )
-            texto_valor.renderizar(self.tela)
-            
+            desenhar_texto(self.tela, label, x, y_atual, FONTES['NORMAL'], CORES['TEXTO'])
+            desenhar_texto(self.tela, valor, x + 200, y_atual, FONTES['NORMAL'], CORES['DESTAQUE'])
             y_atual += espacamento
             
     def renderizar_top_10(self, x: int, y: int):
         """Renderiza o top 10 de pontuações"""
         # Título da seção
-        titulo_ranking = Texto(
-            x + 150, y,
-            "🏆 TOP 10 PONTUAÇÕES",
-            FONTES['SUBTITULO'],
-            CORES['DESTAQUE'],
-            centralizado=True
-        )
-        titulo_ranking.renderizar(self.tela)
+        desenhar_texto(self.tela, "🏆 TOP 10 PONTUAÇÕES", x + 150, y,
+                       FONTES['SUBTITULO'], CORES['DESTAQUE'], centralizado=True)
         
         if not self.ranking:
-            texto_vazio = Texto(
-                x + 150, y + 100,
-                "Nenhuma partida completa ainda!\nJogue para aparecer no ranking!",
-                FONTES['NORMAL'],
-                CORES['HOVER'],
-                centralizado=True
-            )
-            texto_vazio.renderizar(self.tela)
+            desenhar_texto(self.tela,
+                           "Nenhuma partida completa ainda!\nJogue para aparecer no ranking!",
+                           x + 150, y + 100, FONTES['NORMAL'], CORES['HOVER'], centralizado=True)
             return
             
         y_atual = y + 60
@@ -205,13 +201,7 @@ class EstadoRanking(Estado):
         x_colunas = [x, x + 40, x + 120, x + 200, x + 270]
         
         for i, texto in enumerate(cabecalho):
-            texto_cabecalho = Texto(
-                x_colunas[i], y_atual,
-                texto,
-                FONTES['NORMAL'],
-                CORES['TEXTO']
-            )
-            texto_cabecalho.renderizar(self.tela)
+            desenhar_texto(self.tela, texto, x_colunas[i], y_atual, FONTES['NORMAL'], CORES['TEXTO'])
             
         y_atual += 30
         
@@ -220,7 +210,7 @@ class EstadoRanking(Estado):
                         (x, y_atual), (x + 320, y_atual), 2)
         y_atual += 10
         
-        # Entradas do ranking
+        # Entradas do ranking (as superfícies de cada célula vêm do cache de texto)
         for i, partida in enumerate(self.ranking):
             if y_atual > ALTURA - 200:  # Não desenhar fora da tela
                 break
@@ -228,50 +218,17 @@ class EstadoRanking(Estado):
             # Posição
             cor_posicao = CORES['DESTAQUE'] if i < 3 else CORES['TEXTO']
             emoji_posicao = ["🥇", "🥈", "🥉"][i] if i < 3 else f"{i+1}."
+            cor_precisao = CORES['SUCESSO'] if partida.precisao >= 90 else CORES['AVISO']
             
-            texto_posicao = Texto(
-                x_colunas[0], y_atual,
-                emoji_posicao,
-                FONTES['NORMAL'],
-                cor_posicao
-            )
-            texto_posicao.renderizar(self.tela)
-            
-            # Pontuação
-            texto_pontos = Texto(
-                x_colunas[1], y_atual,
-                f"{partida.pontuacao:,}",
-                FONTES['NORMAL'],
-                CORES['DESTAQUE']
-            )
-            texto_pontos.renderizar(self.tela)
-            
-            # Nível
-            texto_nivel = Texto(
-                x_colunas[2], y_atual,
-                partida.nivel.title(),
-                FONTES['NORMAL'],
-                self.cor_por_nivel(partida.nivel)
-            )
-            texto_nivel.renderizar(self.tela)
-            
-            # Precisão
-            texto_precisao = Texto(
-                x_colunas[3], y_atual,
-                f"{partida.precisao:.0f}%",
-                FONTES['NORMAL'],
-                CORES['SUCESSO'] if partida.precisao >= 90 else CORES['AVISO']
-            )
-            texto_precisao.renderizar(self.tela)
-            
-            # Tempo
-            texto_tempo = Texto(
-                x_colunas[4], y_atual,
-                f"{partida.tempo_total:.1f}s",
-                FONTES['NORMAL'],
-                CORES['TEXTO']
-            )
-            texto_tempo.renderizar(self.tela)
+            celulas = [
+                (emoji_posicao, cor_posicao),
+                (f"{partida.pontuacao:,}", CORES['DESTAQUE']),
+                (partida.nivel.title(), self.cor_por_nivel(partida.nivel)),
+                (f"{partida.precisao:.0f}%", cor_precisao),
+                (f"{partida.tempo_total:.1f}s", CORES['TEXTO'])
+            ]
+            for x_coluna, (texto, cor) in zip(x_colunas, celulas):
+                desenhar_texto(self.tela, texto, x_coluna, y_atual, FONTES['NORMAL'], cor)
             
             y_atual += espacamento
             
@@ -4,15 +4,20 @@ Estado de seleção de nível de dificuldade
 import pygame
 from ..estado_manager import Estado
 from ...ui.componentes import Botao, Texto
+from ...ui.camadas import CompositorCamadas
 from ...utils.config import CORES, FONTES, LARGURA, ALTURA, NIVEIS
 
 
 class EstadoSelecaoNivel(Estado):
     """Tela de seleção de nível de dificuldade"""
     
+    suporta_regioes_sujas = True
+    cobre_tela_inteira = True
+    
     def __init__(self, game_manager):
         super().__init__(game_manager)
         self.inicializar_ui()
+        self.inicializar_camadas()
         
     def inicializar_ui(self):
         """Inicializa elementos da interface"""
@@ -146,23 +151,26 @@ class EstadoSelecaoNivel(Estado):
             botao.atualizar(dt)
         self.botao_voltar.atualizar(dt)
         
+    def esta_animando(self):
+        """Só os botões animam nesta tela"""
+        return any(botao.esta_animando() for botao in self.botoes_nivel + [self.botao_voltar])
+        
+    def inicializar_camadas(self):
+        """Fundo, título e instruções em cache; botões e descrição por cima"""
+        self.compositor = CompositorCamadas()
+        self.compositor.adicionar_estatica('fundo', self.desenhar_fundo)
+        self.compositor.adicionar_dinamica('interface', self.renderizar_interface)
+        
     def renderizar(self):
         """Renderiza a tela de seleção"""
-        # Fundo
-        self.tela.fill(CORES['FUNDO'])
-        
-        # Título
-        self.titulo.renderizar(self.tela)
+        self.compositor.renderizar(self.tela)
         
-        # Botões de nível
-        for botao in self.botoes_nivel:
-            botao.renderizar(self.tela)
-            
-        # Botão voltar
-        self.botao_voltar.renderizar(self.tela)
+    def desenhar_fundo(self, superficie: pygame.Surface):
+        """Partes fixas da tela (camada estática)"""
+        superficie.fill(CORES['FUNDO'])
         
-        # Descrição
-        self.texto_descricao.renderizar(self.tela)
+        # Título
+        self.titulo.renderizar(superficie)
         
         # Instruções de teclado
         instrucoes = Texto(
@@ -172,4 +180,16 @@ class EstadoSelecaoNivel(Estado):
             CORES['HOVER'],
             centralizado=True
         )
-        instrucoes.renderizar(self.tela)
+        instrucoes.renderizar(superficie)
+        
+    def renderizar_interface(self, tela: pygame.Surface):
+        """Botões e descrição do nível sob o mouse"""
+        # Botões de nível
+        for botao in self.botoes_nivel:
+            botao.renderizar(tela)
+            
+        # Botão voltar
+        self.botao_voltar.renderizar(tela)
+        
+        # Descrição
+        self.texto_descricao.renderizar(tela)
@@ -3,13 +3,17 @@ Gerenciador principal do jogo Merge_Mind
 """
 import pygame
 import sys
+import time
 from .estado_manager import GerenciadorEstados
+from .relogio import RelogioPassoFixo
 from .estados.menu import EstadoMenu
 from .estados.selecao_nivel import EstadoSelecaoNivel
 from .estados.jogo import EstadoJogo
 from .estados.ranking import EstadoRanking
-from ..utils.config import LARGURA, ALTURA, FPS, TITULO, CORES
+from ..utils.config import LARGURA, ALTURA, TITULO, CORES, RENDERIZACAO, AGENDADOR, SIMULACAO
 from ..utils.audio import GerenciadorAudio
+from ..ui.regioes import regioes_sujas
+from ..ui.tweens import agendador_tweens
 
 
 class GameManager:
@@ -23,13 +27,30 @@ class GameManager:
         self.tela = pygame.display.set_mode((LARGURA, ALTURA))
         pygame.display.set_caption(TITULO)
         
-        # Clock para controle de FPS
+        # Clock para o limite de FPS da renderização; a lógica roda em passo fixo
         self.clock = pygame.time.Clock()
+        self.relogio = RelogioPassoFixo()
+        self.fps_maximo = SIMULACAO['FPS_MAXIMO_RENDER']
         
         # Estado do jogo
         self.rodando = True
         self.nivel_selecionado = 'FACIL'
         
+        # Renderização por regiões sujas (opcional) e contornos de depuração
+        self.regioes_sujas = regioes_sujas
+        self.regioes_sujas.ativo = RENDERIZACAO['REGIOES_SUJAS']
+        self.mostrar_regioes = RENDERIZACAO['MOSTRAR_REGIOES']
+        self.contornos_regioes = []  # [rect, quadros restantes]
+        self.estado_renderizado = None
+        
+        # Agendador de quadros: espera por eventos quando nada está animando
+        self.esperar_ocioso = AGENDADOR['ESPERAR_OCIOSO']
+        self.evento_aguardado = None
+        self.eventos_sem_passo = False  # Eventos tratados que a lógica ainda não viu
+        self.estatisticas_agendador = {
+            modo: {'quadros': 0, 'tempo_s': 0.0, 'cpu_s': 0.0} for modo in ('ativo', 'ocioso')
+        }
+        
         # Sistemas
         self.audio = GerenciadorAudio()
         self.gerenciador_estados = GerenciadorEstados(self)
@@ -90,6 +111,11 @@ class GameManager:
         """Processa eventos globais do jogo"""
         eventos = pygame.event.get()
         
+        # Evento que acordou o loop ocioso vem antes dos que chegaram depois
+        if self.evento_aguardado is not None:
+            eventos.insert(0, self.evento_aguardado)
+            self.evento_aguardado = None
+        
         # Eventos globais
         for evento in eventos:
             if evento.type == pygame.QUIT:
@@ -98,11 +124,20 @@ class GameManager:
                 # Atalhos globais
                 if evento.key == pygame.K_F11:
                     self.alternar_tela_cheia()
+                elif evento.key == pygame.K_F8:
+                    self.alternar_regioes_sujas()
+                elif evento.key == pygame.K_F9:
+                    self.alternar_contornos_regioes()
                 elif evento.key == pygame.K_F4 and pygame.key.get_pressed()[pygame.K_LALT]:
                     self.rodando = False
+            elif evento.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                # O sistema pode ter descartado o conteúdo da janela
+                self.regioes_sujas.invalidar_tudo()
                     
         # Passar eventos para o estado atual
         self.gerenciador_estados.processar_eventos(eventos)
+        if eventos:
+            self.eventos_sem_passo = True
         
     def alternar_tela_cheia(self):
         """Alterna entre tela cheia e janela"""
@@ -114,17 +149,36 @@ class GameManager:
             else:
                 # Entrar em tela cheia
                 self.tela = pygame.display.set_mode((LARGURA, ALTURA), pygame.FULLSCREEN)
+            self.regioes_sujas.invalidar_tudo()
         except Exception as e:
             print(f"Erro ao alternar tela cheia: {e}")
             
+    def alternar_regioes_sujas(self):
+        """Liga/desliga a renderização por regiões sujas"""
+        self.regioes_sujas.ativo = not self.regioes_sujas.ativo
+        self.regioes_sujas.invalidar_tudo()
+        self.contornos_regioes.clear()
+        
+    def alternar_contornos_regioes(self):
+        """Liga/desliga os contornos das regiões redesenhadas"""
+        self.mostrar_regioes = not self.mostrar_regioes
+        self.regioes_sujas.invalidar_tudo()
+            
     def atualizar(self, dt: float):
         """Atualiza a lógica do jogo"""
+        agendador_tweens.avancar(dt)
         self.gerenciador_estados.atualizar(dt)
         
     def renderizar(self):
         """Renderiza o jogo"""
-        # Limpar tela
-        self.tela.fill(CORES['FUNDO'])
+        if self.regioes_sujas.ativo:
+            self.renderizar_regioes_sujas()
+            return
+            
+        # Limpar tela (desnecessário se o estado pinta um fundo opaco)
+        estado = self.gerenciador_estados.estado_atual
+        if estado is None or not estado.cobre_tela_inteira:
+            self.tela.fill(CORES['FUNDO'])
         
         # Renderizar estado atual
         self.gerenciador_estados.renderizar()
@@ -132,40 +186,57 @@ class GameManager:
         # Atualizar display
         pygame.display.flip()
         
+    def renderizar_regioes_sujas(self):
+        """Redesenha e envia ao display apenas as regiões invalidadas no quadro"""
+        estado = self.gerenciador_estados.estado_atual
+        
+        # Troca de estado ou estado sem suporte: tela inteira
+        if estado is not self.estado_renderizado or estado is None or not estado.suporta_regioes_sujas:
+            self.regioes_sujas.invalidar_tudo()
+            self.estado_renderizado = estado
+            
+        regioes = self.regioes_sujas.coletar()
+        
+        # Contornos de depuração vencidos são apagados redesenhando sua área,
+        # sem virar contornos novos; um quadro inteiro apaga todos
+        if regioes and regioes[0] == self.tela.get_rect():
+            self.contornos_regioes.clear()
+        for contorno in self.contornos_regioes:
+            contorno[1] -= 1
+        limpeza = [rect for rect, restantes in self.contornos_regioes if restantes <= 0]
+        self.contornos_regioes = [contorno for contorno in self.contornos_regioes if contorno[1] > 0]
+        
+        if estado is not None and (regioes or limpeza):
+            estado.renderizar_regioes(regioes + limpeza)
+            
+        if self.mostrar_regioes:
+            self.desenhar_contornos_regioes(regioes)
+            
+        if regioes or limpeza:
+            pygame.display.update(regioes + limpeza)
+            
+    def desenhar_contornos_regioes(self, regioes):
+        """Contorna as regiões redesenhadas; cada contorno some após alguns quadros"""
+        for regiao in regioes:
+            pygame.draw.rect(self.tela, CORES['AVISO'], regiao, 2)
+            self.contornos_regioes.append([regiao, RENDERIZACAO['QUADROS_DEPURACAO']])
+        
     def executar(self):
         """Loop principal do jogo"""
         print(f"Iniciando {TITULO}...")
         print("Controles:")
         print("- ESC: Voltar/Sair")
         print("- F11: Tela cheia")
+        print("- F8: Renderização por regiões sujas / F9: Mostrar regiões redesenhadas")
         print("- ESPAÇO: Pausar (durante o jogo)")
         print("- R: Reiniciar (durante o jogo)")
         print()
         
-        tempo_anterior = pygame.time.get_ticks()
+        self.relogio.reiniciar()
         
         try:
             while self.rodando:
-                # Calcular delta time
-                tempo_atual = pygame.time.get_ticks()
-                dt = (tempo_atual - tempo_anterior) / 1000.0  # Converter para segundos
-                tempo_anterior = tempo_atual
-                
-                # Limitar delta time para evitar saltos grandes
-                dt = min(dt, 1.0/30.0)  # Máximo 30 FPS para evitar problemas
-                
-                # Processar eventos
-                self.processar_eventos()
-                
-                # Atualizar
-                if self.rodando:  # Verificar novamente após eventos
-                    self.atualizar(dt)
-                    
-                # Renderizar
-                self.renderizar()
-                
-                # Controlar FPS
-                self.clock.tick(FPS)
+                self.executar_quadro()
                 
         except KeyboardInterrupt:
             print("\nJogo interrompido pelo usuário.")
@@ -176,10 +247,72 @@ class GameManager:
         finally:
             self.finalizar()
             
+    def executar_quadro(self):
+        """Executa um quadro e espera pelo próximo: limite de FPS se algo anima, senão um evento"""
+        inicio = time.perf_counter()
+        inicio_cpu = time.process_time()
+        
+        # Processar eventos
+        self.processar_eventos()
+        
+        # Atualizar em passos fixos; a sobra do acumulador interpola a renderização
+        passos = self.relogio.avancar()
+        for _ in range(passos):
+            if not self.rodando:  # Verificar novamente após eventos
+                break
+            self.atualizar(self.relogio.passo)
+            self.eventos_sem_passo = False
+            
+        # Renderizar
+        self.renderizar()
+        
+        # Os estados reagem a parte dos eventos em atualizar (ex.: cor dos blocos
+        # destacados), então o loop só dorme depois de um passo após o último evento
+        ocioso = (self.esperar_ocioso and not self.eventos_sem_passo
+                  and not self.gerenciador_estados.esta_animando())
+        if ocioso:
+            self.aguardar_evento()
+        else:
+            # Limitar FPS da renderização
+            self.clock.tick(self.fps_maximo)
+            
+        modo = self.estatisticas_agendador['ocioso' if ocioso else 'ativo']
+        modo['quadros'] += 1
+        modo['tempo_s'] += time.perf_counter() - inicio
+        modo['cpu_s'] += time.process_time() - inicio_cpu
+        
+    def aguardar_evento(self):
+        """Bloqueia até chegar um evento (ou até o timeout), sem consumir CPU"""
+        evento = pygame.event.wait(AGENDADOR['TIMEOUT_OCIOSO_MS'])
+        acordou_por_evento = evento.type != pygame.NOEVENT
+        if acordou_por_evento:
+            self.evento_aguardado = evento
+            
+        # O tempo parado não é simulado: nada estava animando. O quadro que
+        # trata o evento executa um passo, senão duraria poucos ms e nenhum
+        self.relogio.reiniciar(passos_pendentes=1 if acordou_por_evento else 0)
+        
+    def obter_estatisticas_agendador(self) -> dict:
+        """Retorna, por modo (ativo/ocioso), quadros e tempo de CPU médio por segundo"""
+        estatisticas = {}
+        for nome, modo in self.estatisticas_agendador.items():
+            cpu_por_segundo = modo['cpu_s'] / modo['tempo_s'] * 1000 if modo['tempo_s'] > 0 else 0
+            estatisticas[nome] = {
+                'quadros': modo['quadros'],
+                'tempo_s': round(modo['tempo_s'], 3),
+                'cpu_ms_por_segundo': round(cpu_por_segundo, 1)
+            }
+        return estatisticas
+        
     def finalizar(self):
         """Finaliza o jogo e libera recursos"""
         print("Finalizando jogo...")
         
+        # Uso de CPU em cada modo do agendador
+        for modo, dados in self.obter_estatisticas_agendador().items():
+            if dados['quadros'] > 0:
+                print(f"Quadros ({modo}): {dados['quadros']} | CPU: {dados['cpu_ms_por_segundo']} ms/s")
+        
         try:
             # Limpar áudio
             self.audio.limpar()
@@ -0,0 +1,102 @@
+"""
+Relógio de passo fixo: a lógica avança em passos de duração constante,
+independentemente da taxa de quadros da renderização
+"""
+import time
+from typing import Callable, Optional
+from ..utils.config import SIMULACAO
+
+# Tolerância para somas de intervalos como 3 x (1/60) não ficarem um ulp abaixo do passo
+EPSILON = 1e-9
+
+
+class RelogioPassoFixo:
+    """
+    Acumulador de tempo para simulação em passo fixo.
+
+    A cada quadro, o tempo real decorrido entra no acumulador e sai dele em
+    passos de `1 / frequencia` segundos: `avancar` diz quantos passos de lógica
+    executar. A sobra (menos de um passo) vira `alfa`, a fração do caminho
+    entre o penúltimo e o último estado simulado, usada para interpolar a
+    renderização. Com o jogo travado por muito tempo, no máximo `max_passos`
+    são executados e o resto do atraso é descartado, em vez de a simulação
+    tentar recuperá-lo e atrasar ainda mais.
+
+    `fonte_tempo` retorna segundos; pode ser trocada por um relógio falso
+    para simular taxas de quadros sem janela.
+    """
+
+    def __init__(self, frequencia: float = SIMULACAO['FREQUENCIA_HZ'],
+                 max_passos: int = SIMULACAO['MAX_PASSOS_POR_QUADRO'],
+                 fonte_tempo: Callable[[], float] = time.perf_counter):
+        self.passo = 1.0 / frequencia
+        self.max_passos = max_passos
+        self.fonte_tempo = fonte_tempo
+
+        self.acumulador = 0.0
+        self.alfa = 0.0
+        self.ultimo_tempo = fonte_tempo()
+
+        # Estatísticas
+        self.passos_executados = 0
+        self.passos_descartados = 0
+        self.quadros = 0
+
+    def reiniciar(self, passos_pendentes: int = 0) -> None:
+        """
+        Recomeça a medição agora, sem simular o tempo desde o último quadro.
+
+        Args:
+            passos_pendentes: passos já devidos ao próximo `avancar` (ex.: um
+                passo para a lógica reagir ao evento que acordou o loop)
+        """
+        self.ultimo_tempo = self.fonte_tempo()
+        self.acumulador = passos_pendentes * self.passo
+        self.alfa = 0.0
+
+    def avancar(self, decorrido: Optional[float] = None) -> int:
+        """
+        Contabiliza o tempo do quadro e retorna quantos passos de lógica executar.
+
+        Args:
+            decorrido: segundos desde o último quadro; por padrão, medido pela fonte_tempo
+        """
+        if decorrido is None:
+            agora = self.fonte_tempo()
+            decorrido = agora - self.ultimo_tempo
+            self.ultimo_tempo = agora
+
+        self.acumulador += max(0.0, decorrido)
+        passos = int((self.acumulador + EPSILON) // self.passo)
+        self.acumulador = max(0.0, self.acumulador - passos * self.passo)
+
+        if passos > self.max_passos:
+            self.passos_descartados += passos - self.max_passos
+            passos = self.max_passos
+
+        self.alfa = self.acumulador / self.passo
+        self.passos_executados += passos
+        self.quadros += 1
+        return passos
+
+    def interpolar(self, anterior: float, atual: float) -> float:
+        """Valor a renderizar entre o estado do passo anterior e o do atual"""
+        return anterior + (atual - anterior) * self.alfa
+
+    @property
+    def tempo_simulado(self) -> float:
+        """Segundos de lógica simulados até agora"""
+        return self.passos_executados * self.passo
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna passos por quadro e passos descartados por atraso"""
+        passos_por_quadro = self.passos_executados / self.quadros if self.quadros > 0 else 0
+
+        return {
+            'frequencia_hz': round(1.0 / self.passo, 2),
+            'quadros': self.quadros,
+            'passos_executados': self.passos_executados,
+            'passos_por_quadro': round(passos_por_quadro, 3),
+            'passos_descartados': self.passos_descartados,
+            'tempo_simulado_s': round(self.tempo_simulado, 3)
+        }
@@ -0,0 +1,96 @@
+"""
+Compositor de camadas: fundos estáticos desenhados uma vez em superfícies
+em cache, com as camadas dinâmicas desenhadas por cima a cada quadro
+"""
+import pygame
+from typing import Callable, List, Optional
+
+# Incrementada quando as cores do tema mudam; as camadas estáticas comparam
+# com a versão com que foram desenhadas
+versao_tema = 0
+
+
+def notificar_mudanca_tema() -> None:
+    """Faz todas as camadas estáticas serem redesenhadas no próximo quadro"""
+    global versao_tema
+    versao_tema += 1
+
+
+class CamadaEstatica:
+    """
+    Camada desenhada uma vez em uma superfície do tamanho da tela.
+
+    A superfície é refeita quando o tamanho da tela muda, quando o tema muda
+    (notificar_mudanca_tema) ou quando a camada é invalidada. Camadas
+    opacas usam uma superfície convertida para o formato da tela, que é a
+    cópia mais rápida; as transparentes usam SRCALPHA.
+    """
+
+    def __init__(self, nome: str, desenhar: Callable[[pygame.Surface], None],
+                 transparente: bool = False):
+        self.nome = nome
+        self.desenhar = desenhar
+        self.transparente = transparente
+        self.superficie: Optional[pygame.Surface] = None
+        self.versao = -1
+        self.reconstrucoes = 0
+
+    def invalidar(self) -> None:
+        """Força o redesenho da camada no próximo uso"""
+        self.superficie = None
+
+    def obter(self, tamanho) -> pygame.Surface:
+        """Retorna a superfície da camada, redesenhando-a se estiver desatualizada"""
+        if (self.superficie is None or self.superficie.get_size() != tuple(tamanho)
+                or self.versao != versao_tema):
+            if self.transparente:
+                superficie = pygame.Surface(tamanho, pygame.SRCALPHA)
+            else:
+                superficie = pygame.Surface(tamanho)
+                if pygame.display.get_surface() is not None:
+                    superficie = superficie.convert()
+            self.desenhar(superficie)
+            self.superficie = superficie
+            self.versao = versao_tema
+            self.reconstrucoes += 1
+        return self.superficie
+
+
+class CompositorCamadas:
+    """Lista ordenada de camadas estáticas (em cache) e dinâmicas (redesenhadas)"""
+
+    def __init__(self):
+        self._camadas: List[tuple] = []  # (nome, CamadaEstatica ou função de desenho)
+
+    def adicionar_estatica(self, nome: str, desenhar: Callable[[pygame.Surface], None],
+                           transparente: bool = False) -> CamadaEstatica:
+        """Adiciona uma camada desenhada uma vez e copiada a cada quadro"""
+        camada = CamadaEstatica(nome, desenhar, transparente)
+        self._camadas.append((nome, camada))
+        return camada
+
+    def adicionar_dinamica(self, nome: str, desenhar: Callable[[pygame.Surface], None]) -> None:
+        """Adiciona uma camada redesenhada a cada quadro sobre as anteriores"""
+        self._camadas.append((nome, desenhar))
+
+    def invalidar(self, nome: Optional[str] = None) -> None:
+        """Invalida uma camada estática pelo nome (ou todas)"""
+        for nome_camada, camada in self._camadas:
+            if isinstance(camada, CamadaEstatica) and nome in (None, nome_camada):
+                camada.invalidar()
+
+    def renderizar(self, tela: pygame.Surface) -> None:
+        """Compõe as camadas na ordem em que foram adicionadas"""
+        tamanho = tela.get_size()
+        for _, camada in self._camadas:
+            if isinstance(camada, CamadaEstatica):
+                tela.blit(camada.obter(tamanho), (0, 0))
+            else:
+                camada(tela)
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna quantas vezes cada camada estática foi desenhada"""
+        return {
+            nome: camada.reconstrucoes
+            for nome, camada in self._camadas if isinstance(camada, CamadaEstatica)
+        }
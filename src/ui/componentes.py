@@ -4,9 +4,14 @@ Sistema moderno e profissional de UI
 """
 import pygame
 import math
+from bisect import bisect_left, bisect_right
 from typing import Callable, Optional, Tuple, List, Any, Dict
 from enum import Enum
 from ..utils.config import CORES, FONTES, VISUAL, ANIMACAO
+from .fontes import obter_fonte, renderizar_texto
+from .regioes import regioes_sujas
+from .sprites import cache_sprites, redimensionar
+from .tweens import agendador_tweens
 
 
 class EstadoComponente(Enum):
@@ -27,6 +32,15 @@ class TipoAnimacao(Enum):
     ROTATE = "rotate"
 
 
+# Atributo interpolado por tipo de animação (BOUNCE só aguarda a duração)
+ATRIBUTOS_ANIMACAO = {
+    TipoAnimacao.FADE: 'alpha',
+    TipoAnimacao.SLIDE: 'offset_x',
+    TipoAnimacao.SCALE: 'escala',
+    TipoAnimacao.ROTATE: 'rotacao',
+}
+
+
 class ComponenteUI:
     """Classe base para componentes de UI com sistema de animação"""
     
@@ -36,8 +50,7 @@ class ComponenteUI:
         self.ativo = True
         self.estado = EstadoComponente.NORMAL
         
-        # Sistema de animação
-        self.animacoes = {}
+        # Atributos animados pelo agendador de tweens
         self.alpha = 255
         self.escala = 1.0
         self.rotacao = 0.0
@@ -47,54 +60,31 @@ class ComponenteUI:
         # Eventos e callbacks
         self.callbacks = {}
         
+        # Contêiner que desenha o componente fora da posição de tela (ex.: ListaScrollavel)
+        self.pai = None
+        
     def adicionar_animacao(self, tipo: TipoAnimacao, duracao: int, 
                           valor_inicial: float, valor_final: float,
                           callback: Optional[Callable] = None) -> None:
-        """Adiciona uma animação ao componente"""
-        self.animacoes[tipo] = {
-            'duracao': duracao,
-            'tempo_atual': 0,
-            'valor_inicial': valor_inicial,
-            'valor_final': valor_final,
-            'callback': callback,
-            'ativa': True
-        }
+        """Adiciona uma animação ao componente (duração em milissegundos)"""
+        atributo = ATRIBUTOS_ANIMACAO.get(tipo)
+        agendador_tweens.animar(self, atributo, duracao, valor_inicial, valor_final,
+                                callback=callback, inteiro=tipo == TipoAnimacao.FADE)
     
-    def atualizar_animacoes(self, dt: float) -> None:
-        """Atualiza todas as animações ativas"""
-        for tipo, anim in list(self.animacoes.items()):
-            if not anim['ativa']:
-                continue
-                
-            anim['tempo_atual'] += dt
-            progresso = min(anim['tempo_atual'] / anim['duracao'], 1.0)
-            
-            # Aplicar easing
-            progresso_suave = self._aplicar_easing(progresso)
-            
-            # Calcular valor atual
-            valor_atual = anim['valor_inicial'] + (anim['valor_final'] - anim['valor_inicial']) * progresso_suave
-            
-            # Aplicar ao componente
-            if tipo == TipoAnimacao.FADE:
-                self.alpha = int(valor_atual)
-            elif tipo == TipoAnimacao.SCALE:
-                self.escala = valor_atual
-            elif tipo == TipoAnimacao.ROTATE:
-                self.rotacao = valor_atual
-            elif tipo == TipoAnimacao.SLIDE:
-                self.offset_x = valor_atual
-            
-            # Verificar se terminou
-            if progresso >= 1.0:
-                anim['ativa'] = False
-                if anim['callback']:
-                    anim['callback']()
+    def esta_animando(self) -> bool:
+        """Se o componente ainda muda sozinho nos próximos quadros (sem eventos)"""
+        return agendador_tweens.esta_animando(self)
     
-    def _aplicar_easing(self, t: float) -> float:
-        """Aplica função de easing para animações suaves"""
-        # Ease out cubic
-        return 1 - (1 - t) ** 3
+    def area_ocupada(self) -> pygame.Rect:
+        """Área da tela que o componente pode ter desenhado no estado atual"""
+        return self.rect.move(self.offset_x, self.offset_y)
+    
+    def invalidar(self) -> None:
+        """Pede o redesenho da área do componente (no modo de regiões sujas)"""
+        if self.pai is not None:
+            self.pai.invalidar_filho(self)
+        else:
+            regioes_sujas.invalidar(self.area_ocupada())
     
     def processar_evento(self, evento: pygame.event.Event) -> bool:
         """Processa eventos. Retorna True se o evento foi consumido"""
@@ -104,8 +94,8 @@ class ComponenteUI:
         return False
         
     def atualizar(self, dt: float) -> None:
-        """Atualiza o componente"""
-        self.atualizar_animacoes(dt)
+        """Atualiza o componente (as animações avançam no agendador de tweens)"""
+        pass
         
     def renderizar(self, tela: pygame.Surface) -> None:
         """Renderiza o componente"""
@@ -143,13 +133,21 @@ class Botao(ComponenteUI):
         self.brilho_atual = 0
         
         # Fonte e texto
-        self.fonte = pygame.font.Font(None, FONTES['BOTAO'])
+        self.fonte = obter_fonte(FONTES['BOTAO'])
         self._atualizar_superficie_texto()
         
         # Sombra
         self.sombra_offset = 4
         self.sombra_blur = 8
     
+    def area_ocupada(self) -> pygame.Rect:
+        """Retângulo escalado do botão mais a sombra"""
+        largura = int(self.rect.width * self.escala)
+        altura = int(self.rect.height * self.escala)
+        rect_botao = pygame.Rect(0, 0, largura, altura)
+        rect_botao.center = (self.rect.centerx + self.offset_x, self.rect.centery + self.offset_y)
+        return rect_botao.union(rect_botao.move(self.sombra_offset, self.sombra_offset))
+    
     def _configurar_estilo(self) -> None:
         """Configura cores baseadas no estilo"""
         estilos = {
@@ -187,7 +185,7 @@ class Botao(ComponenteUI):
     
     def _atualizar_superficie_texto(self) -> None:
         """Atualiza a superfície de texto"""
-        self.superficie_texto = self.fonte.render(self.texto, True, self.cor_texto)
+        self.superficie_texto = renderizar_texto(self.texto, FONTES['BOTAO'], self.cor_texto)
         self.rect_texto = self.superficie_texto.get_rect(center=self.rect.center)
     
     def processar_evento(self, evento: pygame.event.Event) -> bool:
@@ -278,8 +276,10 @@ class Botao(ComponenteUI):
         
         # Desenhar texto
         if self.alpha > 0:
-            texto_surface = self.superficie_texto.copy()
+            # A superfície vem do cache compartilhado: só copiar para mudar o alpha
+            texto_surface = self.superficie_texto
             if self.alpha < 255:
+                texto_surface = texto_surface.copy()
                 texto_surface.set_alpha(self.alpha)
             
             rect_texto_ajustado = self.superficie_texto.get_rect(center=rect_botao.center)
@@ -289,6 +289,7 @@ class Botao(ComponenteUI):
         """Atualiza o texto do botão"""
         self.texto = novo_texto
         self._atualizar_superficie_texto()
+        self.invalidar()
 
 
 class Modal(ComponenteUI):
@@ -347,6 +348,9 @@ class Modal(ComponenteUI):
         self.alpha = 0
         self.adicionar_animacao(TipoAnimacao.FADE, 200, 0, 255)
     
+    def esta_animando(self) -> bool:
+        return super().esta_animando() or any(elemento.esta_animando() for elemento in self.elementos)
+    
     def atualizar(self, dt: float) -> None:
         """Atualiza modal e elementos"""
         super().atualizar(dt)
@@ -377,7 +381,20 @@ class Modal(ComponenteUI):
 
 
 class ListaScrollavel(ComponenteUI):
-    """Lista scrollável de elementos"""
+    """
+    Lista scrollável virtualizada.
+    
+    Os elementos ficam ordenados pelo topo, com o máximo acumulado dos fundos
+    ao lado; o intervalo visível sai de duas buscas binárias, então o custo
+    de um quadro depende só das linhas na tela, não do total da lista.
+    Cada linha visível é desenhada em uma superfície própria, reaproveitada
+    enquanto o elemento não se invalida nem anima; as linhas que saem da
+    tela devolvem a superfície para um pequeno pool de reuso.
+    
+    Os elementos são posicionados em coordenadas de tela sem scroll. Quem
+    alterar um elemento sem passar pelos métodos dele deve chamar
+    `invalidar_filho`; quem mover elementos depois de adicionados, `reorganizar`.
+    """
     
     def __init__(self, x: int, y: int, largura: int, altura: int):
         super().__init__(x, y, largura, altura)
@@ -386,6 +403,20 @@ class ListaScrollavel(ComponenteUI):
         self.velocidade_scroll = 30
         self.altura_conteudo = 0
         
+        # Índices para a busca binária (coordenadas de tela, sem scroll)
+        self._topos: List[int] = []   # Topo de cada elemento, em ordem crescente
+        self._fundos: List[int] = []  # Maior fundo entre os elementos até o índice
+        
+        # Linhas desenhadas: elemento -> [superfície, área da tela sem scroll]
+        self._linhas: Dict[ComponenteUI, list] = {}
+        self._sujos = set()  # Elementos com linha desenhada que se invalidaram desde então
+        self._superficies_livres: List[pygame.Surface] = []
+        self.max_superficies_livres = VISUAL['SUPERFICIES_LIVRES_LISTA']
+        
+        # Estatísticas
+        self.linhas_desenhadas = 0
+        self.superficies_criadas = 0
+        
         # Scrollbar
         self.largura_scrollbar = 12
         self.cor_scrollbar = CORES['HOVER']
@@ -393,8 +424,41 @@ class ListaScrollavel(ComponenteUI):
         self.arrastando_scroll = False
     
     def adicionar_elemento(self, elemento: ComponenteUI) -> None:
-        """Adiciona elemento à lista"""
-        self.elementos.append(elemento)
+        """Adiciona elemento à lista, mantendo a ordem pelo topo"""
+        topo = elemento.rect.y
+        elemento.pai = self
+        
+        if not self._topos or topo >= self._topos[-1]:
+            # Caso comum: linhas adicionadas de cima para baixo
+            fundo = elemento.rect.bottom
+            self.elementos.append(elemento)
+            self._topos.append(topo)
+            self._fundos.append(max(self._fundos[-1], fundo) if self._fundos else fundo)
+            self._calcular_altura_conteudo()
+        else:
+            indice = bisect_right(self._topos, topo)
+            self.elementos.insert(indice, elemento)
+            self._topos.insert(indice, topo)
+            self._fundos.insert(indice, 0)
+            self._reindexar(indice)
+        
+        self.invalidar()
+    
+    def reorganizar(self) -> None:
+        """Reordena e reindexa a lista depois de elementos terem sido movidos"""
+        self.elementos.sort(key=lambda elemento: elemento.rect.y)
+        self._topos = [elemento.rect.y for elemento in self.elementos]
+        self._fundos = [0] * len(self.elementos)
+        self._reindexar(0)
+        self._limitar_scroll()
+        self.invalidar()
+    
+    def _reindexar(self, inicio: int) -> None:
+        """Recalcula o máximo acumulado dos fundos a partir de um índice"""
+        maior = self._fundos[inicio - 1] if inicio > 0 else -math.inf
+        for indice in range(inicio, len(self.elementos)):
+            maior = max(maior, self.elementos[indice].rect.bottom)
+            self._fundos[indice] = maior
         self._calcular_altura_conteudo()
     
     def _calcular_altura_conteudo(self) -> None:
@@ -403,11 +467,19 @@ class ListaScrollavel(ComponenteUI):
             self.altura_conteudo = 0
             return
         
-        max_y = 0
-        for elemento in self.elementos:
-            max_y = max(max_y, elemento.rect.bottom)
-        
-        self.altura_conteudo = max_y - self.rect.y
+        self.altura_conteudo = self._fundos[-1] - self.rect.y
+    
+    def _intervalo_visivel(self) -> Tuple[int, int]:
+        """Índices [inicio, fim) dos elementos que podem cruzar a área visível"""
+        topo_visivel = self.rect.y + self.scroll_y
+        inicio = bisect_left(self._fundos, topo_visivel)
+        fim = bisect_right(self._topos, topo_visivel + self.rect.height)
+        return inicio, max(inicio, fim)
+    
+    def elementos_visiveis(self) -> List[ComponenteUI]:
+        """Elementos que cruzam a área visível no scroll atual"""
+        inicio, fim = self._intervalo_visivel()
+        return [elemento for elemento in self.elementos[inicio:fim] if self._elemento_visivel(elemento)]
     
     def processar_evento(self, evento: pygame.event.Event) -> bool:
         """Processa eventos da lista"""
@@ -415,15 +487,20 @@ class ListaScrollavel(ComponenteUI):
             return False
         
         if evento.type == pygame.MOUSEWHEEL and self.rect.collidepoint(pygame.mouse.get_pos()):
-            self.scroll_y -= evento.y * self.velocidade_scroll
-            self._limitar_scroll()
+            self.rolar(-evento.y * self.velocidade_scroll)
             return True
         
+        # Eventos de mouse chegam aos elementos nas coordenadas sem scroll
+        if hasattr(evento, 'pos'):
+            if evento.type == pygame.MOUSEBUTTONDOWN and not self.rect.collidepoint(evento.pos):
+                return False
+            evento = pygame.event.Event(evento.type, {**evento.dict,
+                                                      'pos': (evento.pos[0], evento.pos[1] + self.scroll_y)})
+        
         # Processar elementos visíveis
-        for elemento in self.elementos:
-            if self._elemento_visivel(elemento):
-                if elemento.processar_evento(evento):
-                    return True
+        for elemento in self.elementos_visiveis():
+            if elemento.processar_evento(evento):
+                return True
         
         return False
     
@@ -433,46 +510,120 @@ class ListaScrollavel(ComponenteUI):
         return (y_elemento + elemento.rect.height >= self.rect.y and
                 y_elemento <= self.rect.bottom)
     
+    def rolar(self, deslocamento: int) -> None:
+        """Desloca o conteúdo em pixels (positivo = para baixo)"""
+        self.scroll_y += deslocamento
+        self._limitar_scroll()
+    
     def _limitar_scroll(self) -> None:
         """Limita o scroll aos limites do conteúdo"""
+        anterior = self.scroll_y
         max_scroll = max(0, self.altura_conteudo - self.rect.height)
         self.scroll_y = max(0, min(self.scroll_y, max_scroll))
+        if self.scroll_y != anterior:
+            self.invalidar()
+    
+    def invalidar_filho(self, elemento: ComponenteUI) -> None:
+        """Marca a linha do elemento para ser redesenhada e pede o redesenho da área dela"""
+        linha = self._linhas.get(elemento)
+        if linha is not None:
+            self._sujos.add(elemento)
+            regioes_sujas.invalidar(linha[1].move(0, -self.scroll_y).clip(self.rect))
+        regioes_sujas.invalidar(elemento.area_ocupada().move(0, -self.scroll_y).clip(self.rect))
+    
+    def esta_animando(self) -> bool:
+        return super().esta_animando() or any(
+            elemento.esta_animando() for elemento in self.elementos_visiveis())
     
     def atualizar(self, dt: float) -> None:
         """Atualiza lista e elementos"""
         super().atualizar(dt)
-        for elemento in self.elementos:
-            if self._elemento_visivel(elemento):
-                elemento.atualizar(dt)
+        for elemento in self.elementos_visiveis():
+            elemento.atualizar(dt)
+    
+    def _obter_superficie(self, largura: int, altura: int) -> pygame.Surface:
+        """Superfície transparente de pelo menos largura x altura, do pool se houver"""
+        for indice, superficie in enumerate(self._superficies_livres):
+            if superficie.get_width() >= largura and superficie.get_height() >= altura:
+                return self._superficies_livres.pop(indice)
+        
+        # Arredondar para cima aumenta as chances de reuso por linhas de outro tamanho
+        superficie = pygame.Surface((-(-largura // 32) * 32, -(-altura // 32) * 32), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            superficie = superficie.convert_alpha()
+        self.superficies_criadas += 1
+        return superficie
+    
+    def _liberar_linha(self, elemento: ComponenteUI) -> None:
+        """Devolve a superfície da linha ao pool"""
+        superficie, _ = self._linhas.pop(elemento)
+        self._sujos.discard(elemento)
+        if len(self._superficies_livres) < self.max_superficies_livres:
+            self._superficies_livres.append(superficie)
+    
+    def _desenhar_linha(self, elemento: ComponenteUI) -> list:
+        """Retorna [superfície, área] da linha, redesenhando-a só se mudou"""
+        area = elemento.area_ocupada()
+        linha = self._linhas.get(elemento)
+        if (linha is not None and linha[1] == area and elemento not in self._sujos
+                and not elemento.esta_animando()):
+            return linha
+        
+        superficie = linha[0] if linha is not None else None
+        if superficie is None or superficie.get_width() < area.width or superficie.get_height() < area.height:
+            if linha is not None:
+                self._liberar_linha(elemento)
+            superficie = self._obter_superficie(area.width, area.height)
+        
+        superficie.fill((0, 0, 0, 0), (0, 0, area.width, area.height))
+        
+        # O elemento desenha na própria posição; deslocá-lo leva a área para a origem da superfície
+        elemento.rect.move_ip(-area.x, -area.y)
+        try:
+            elemento.renderizar(superficie)
+        finally:
+            elemento.rect.move_ip(area.x, area.y)
+        
+        linha = [superficie, area]
+        self._linhas[elemento] = linha
+        self._sujos.discard(elemento)
+        self.linhas_desenhadas += 1
+        return linha
     
     def renderizar(self, tela: pygame.Surface) -> None:
-        """Renderiza a lista com clipping"""
+        """Renderiza as linhas visíveis, recortadas pela área da lista"""
         if not self.visivel:
             return
         
-        # Criar superfície para clipping
-        clip_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        visiveis = [elemento for elemento in self.elementos_visiveis() if elemento.visivel]
         
-        # Renderizar elementos com offset de scroll
-        for elemento in self.elementos:
-            if self._elemento_visivel(elemento):
-                # Calcular posição relativa ao scroll
-                x_rel = elemento.rect.x - self.rect.x
-                y_rel = elemento.rect.y - self.rect.y - self.scroll_y
-                
-                # Criar superfície temporária para o elemento
-                elemento_surface = pygame.Surface((elemento.rect.width, elemento.rect.height), pygame.SRCALPHA)
-                elemento.renderizar(elemento_surface)
-                
-                clip_surface.blit(elemento_surface, (x_rel, y_rel))
+        # Linhas que saíram da tela liberam a superfície
+        if len(self._linhas) > len(visiveis):
+            na_tela = set(visiveis)
+            for elemento in [elemento for elemento in self._linhas if elemento not in na_tela]:
+                self._liberar_linha(elemento)
         
-        # Blit superfície com clipping
-        tela.blit(clip_surface, self.rect.topleft)
+        clip_anterior = tela.get_clip()
+        tela.set_clip(self.rect.clip(clip_anterior))
+        for elemento in visiveis:
+            superficie, area = self._desenhar_linha(elemento)
+            tela.blit(superficie, (area.x, area.y - self.scroll_y), (0, 0, area.width, area.height))
+        tela.set_clip(clip_anterior)
         
         # Renderizar scrollbar se necessário
         if self.altura_conteudo > self.rect.height:
             self._renderizar_scrollbar(tela)
     
+    def obter_estatisticas(self) -> dict:
+        """Retorna linhas redesenhadas, superfícies criadas e o tamanho do pool"""
+        return {
+            'elementos': len(self.elementos),
+            'linhas_na_tela': len(self._linhas),
+            'linhas_desenhadas': self.linhas_desenhadas,
+            'superficies_criadas': self.superficies_criadas,
+            'superficies_livres': len(self._superficies_livres)
+        }
+    
     def _renderizar_scrollbar(self, tela: pygame.Surface) -> None:
         """Renderiza a scrollbar"""
         # Posição da scrollbar
@@ -499,10 +650,10 @@ class Tooltip(ComponenteUI):
     def __init__(self, texto: str, elemento_pai: ComponenteUI):
         self.texto = texto
         self.elemento_pai = elemento_pai
-        self.fonte = pygame.font.Font(None, FONTES['PEQUENA'])
+        self.fonte = obter_fonte(FONTES['PEQUENA'])
         
         # Calcular tamanho do tooltip
-        superficie_texto = self.fonte.render(texto, True, CORES['TEXTO'])
+        superficie_texto = renderizar_texto(texto, FONTES['PEQUENA'], CORES['TEXTO'])
         largura = superficie_texto.get_width() + 20
         altura = superficie_texto.get_height() + 12
         
@@ -631,34 +782,71 @@ class BlocoNumero(ComponenteUI):
         self.selecionado = False
         self.destacado = False
         
-        self.fonte = pygame.font.Font(None, FONTES['NORMAL'])
-        self.superficie_texto = self.fonte.render(str(numero), True, CORES['TEXTO'])
+        self.fonte = obter_fonte(FONTES['NORMAL'])
+        self.superficie_texto = renderizar_texto(str(numero), FONTES['NORMAL'], CORES['TEXTO'])
+        self.rect_texto = self.superficie_texto.get_rect(center=self.rect.center)
+        
+        self.escala = 1.0
+        self.escala_alvo = 1.0
+        self.rotacao = 0.0
+        self.animando = False
+        
+    def area_ocupada(self) -> pygame.Rect:
+        """Retângulo escalado (nunca menor que o original) mais a sombra"""
+        escala = max(self.escala_desenhada(), self.escala_alvo, 1.0)
+        rect_escalado = pygame.Rect(0, 0, int(self.rect.width * escala), int(self.rect.height * escala))
+        rect_escalado.center = self.rect.center
+        return rect_escalado.union(rect_escalado.move(VISUAL['SOMBRA_OFFSET'], VISUAL['SOMBRA_OFFSET']))
+        
+    def reconfigurar(self, x: int, y: int, numero: int,
+                     cor: Tuple[int, int, int] = CORES['PRINCIPAL']) -> None:
+        """Reaproveita o bloco para outro número/posição, voltando ao estado inicial"""
+        self.invalidar()
+        self.rect.topleft = (x, y)
+        if numero != self.numero:
+            self.numero = numero
+            self.superficie_texto = renderizar_texto(str(numero), FONTES['NORMAL'], CORES['TEXTO'])
         self.rect_texto = self.superficie_texto.get_rect(center=self.rect.center)
         
+        self.cor_base = cor
+        self.cor_atual = cor
+        self.selecionado = False
+        self.destacado = False
+        self.visivel = True
         self.escala = 1.0
         self.escala_alvo = 1.0
         self.rotacao = 0.0
         self.animando = False
+        agendador_tweens.cancelar(self)
+        self.invalidar()
+        
+    def _animar_escala(self, escala_alvo: float, callback: Optional[Callable] = None) -> None:
+        self.escala_alvo = escala_alvo
+        agendador_tweens.animar(self, 'escala', ANIMACAO['DURACAO_ESCALA_BLOCO'],
+                                self.escala, escala_alvo, callback=callback)
         
     def selecionar(self) -> None:
         """Marca o bloco como selecionado"""
         self.selecionado = True
-        self.escala_alvo = 1.1
+        self._animar_escala(1.1)
+        self.invalidar()
         
     def desselecionar(self) -> None:
         """Remove a seleção do bloco"""
+        self.invalidar()
         self.selecionado = False
-        self.escala_alvo = 1.0
+        self._animar_escala(1.0)
         
     def destacar(self, destacar: bool = True) -> None:
         """Destaca ou remove destaque do bloco"""
         self.destacado = destacar
+        self.invalidar()
         
     def animar_entrada(self) -> None:
         """Inicia animação de entrada"""
         self.escala = 0.0
-        self.escala_alvo = 1.0
         self.animando = True
+        self._animar_escala(1.0, callback=lambda: setattr(self, 'animando', False))
         
     def processar_evento(self, evento: pygame.event.Event) -> bool:
         if not self.ativo or not self.visivel:
@@ -671,10 +859,9 @@ class BlocoNumero(ComponenteUI):
         return False
         
     def atualizar(self, dt: float) -> None:
-        # Animação de escala
-        self.escala += (self.escala_alvo - self.escala) * dt * 10
+        # A escala é animada pelo agendador de tweens; a cor acompanha o estado
+        cor_anterior = self.cor_atual
         
-        # Animação de cor
         if self.selecionado:
             self.cor_atual = CORES['DESTAQUE']
         elif self.destacado:
@@ -682,37 +869,103 @@ class BlocoNumero(ComponenteUI):
         else:
             self.cor_atual = self.cor_base
             
-        # Parar animação quando próximo do alvo
-        if abs(self.escala - self.escala_alvo) < 0.01:
-            self.animando = False
-            
-    def renderizar(self, tela: pygame.Surface) -> None:
-        if not self.visivel or self.escala <= 0:
-            return
+        if cor_anterior != self.cor_atual:
+            self.invalidar()
             
-        # Calcular rect com escala
-        centro = self.rect.center
-        largura_escalada = int(self.rect.width * self.escala)
-        altura_escalada = int(self.rect.height * self.escala)
-        rect_escalado = pygame.Rect(0, 0, largura_escalada, altura_escalada)
-        rect_escalado.center = centro
-        
-        # Desenhar sombra
-        sombra_rect = rect_escalado.copy()
-        sombra_rect.x += VISUAL['SOMBRA_OFFSET']
-        sombra_rect.y += VISUAL['SOMBRA_OFFSET']
-        pygame.draw.rect(tela, (0, 0, 0, 100), sombra_rect, border_radius=VISUAL['RAIO_BORDA'])
-        
-        # Desenhar bloco
-        pygame.draw.rect(tela, self.cor_atual, rect_escalado, border_radius=VISUAL['RAIO_BORDA'])
+    @staticmethod
+    def _quantizar(escala: float) -> float:
+        passos = VISUAL['PASSOS_ESCALA_BLOCO']
+        return round(escala * passos) / passos
+        
+    def escala_desenhada(self) -> float:
+        """Escala do sprite usado: a mais próxima entre as pré-desenhadas"""
+        return self._quantizar(self.escala)
+        
+    def _desenhar_sprite(self, escala: float):
+        """Desenha sombra, corpo, borda e número em uma superfície, ancorada no centro"""
+        rect_escalado = pygame.Rect(0, 0, int(self.rect.width * escala), int(self.rect.height * escala))
+        rect_escalado.center = (0, 0)
+        sombra_rect = rect_escalado.move(VISUAL['SOMBRA_OFFSET'], VISUAL['SOMBRA_OFFSET'])
+        rect_texto = self.superficie_texto.get_rect(center=(0, 0))
+        
+        limites = rect_escalado.union(sombra_rect).union(rect_texto)
+        deslocamento = (-limites.x, -limites.y)
+        superficie = pygame.Surface(limites.size, pygame.SRCALPHA)
+        
+        # Sombra opaca: pygame.draw ignora o alpha de (0, 0, 0, 100) ao desenhar na tela
+        pygame.draw.rect(superficie, (0, 0, 0), sombra_rect.move(deslocamento),
+                         border_radius=VISUAL['RAIO_BORDA'])
+        pygame.draw.rect(superficie, self.cor_atual, rect_escalado.move(deslocamento),
+                         border_radius=VISUAL['RAIO_BORDA'])
         
         # Desenhar borda se selecionado
         if self.selecionado:
-            pygame.draw.rect(tela, CORES['TEXTO'], rect_escalado, 3, border_radius=VISUAL['RAIO_BORDA'])
+            pygame.draw.rect(superficie, CORES['TEXTO'], rect_escalado.move(deslocamento), 3,
+                             border_radius=VISUAL['RAIO_BORDA'])
             
-        # Desenhar número
-        rect_texto = self.superficie_texto.get_rect(center=centro)
-        tela.blit(self.superficie_texto, rect_texto)
+        superficie.blit(self.superficie_texto, rect_texto.move(deslocamento))
+        return superficie, (limites.x, limites.y)
+        
+    def _obter_sprite(self, escala: float):
+        """Sprite do cache por (cor, seleção, escala, número); a cor já reflete o destaque"""
+        chave = ('bloco', self.rect.size, tuple(self.cor_atual), self.selecionado, escala, self.numero)
+        return cache_sprites.obter(chave, lambda: self._desenhar_sprite(escala))
+        
+    def renderizar(self, tela: pygame.Surface) -> None:
+        escala = self.escala_desenhada()
+        if not self.visivel or escala <= 0:
+            return
+            
+        centro_x, centro_y = self.rect.center
+        escala_alvo = self._quantizar(self.escala_alvo)
+        if escala >= escala_alvo:
+            superficie, (dx, dy) = self._obter_sprite(escala)
+        else:
+            # Crescendo até o alvo (entrada, seleção): um redimensionamento do sprite
+            # final, que já fica no cache, em vez de um sprite por escala intermediária
+            sprite, (dx, dy) = self._obter_sprite(escala_alvo)
+            fator = escala / escala_alvo
+            x0, y0 = round(dx * fator), round(dy * fator)
+            x1 = round((dx + sprite.get_width()) * fator)
+            y1 = round((dy + sprite.get_height()) * fator)
+            if x1 <= x0 or y1 <= y0:
+                return
+            superficie = redimensionar(sprite, (x1 - x0, y1 - y0))
+            dx, dy = x0, y0
+        tela.blit(superficie, (centro_x + dx, centro_y + dy))
+
+
+class PoolBlocos:
+    """Reaproveita instâncias de BlocoNumero em vez de criar novas"""
+    
+    def __init__(self):
+        self._livres: List[BlocoNumero] = []
+        self.criados = 0
+        self.reutilizados = 0
+        
+    def obter(self, x: int, y: int, numero: int,
+              cor: Tuple[int, int, int] = CORES['PRINCIPAL']) -> BlocoNumero:
+        """Retorna um bloco configurado, reciclado do pool sempre que possível"""
+        if self._livres:
+            bloco = self._livres.pop()
+            bloco.reconfigurar(x, y, numero, cor)
+            self.reutilizados += 1
+        else:
+            bloco = BlocoNumero(x, y, numero, cor)
+            self.criados += 1
+        return bloco
+        
+    def devolver(self, blocos: List[BlocoNumero]) -> None:
+        """Devolve blocos que não estão mais em uso"""
+        self._livres.extend(blocos)
+        
+    def obter_estatisticas(self) -> dict:
+        """Retorna quantos blocos foram criados e reaproveitados"""
+        return {
+            'criados': self.criados,
+            'reutilizados': self.reutilizados,
+            'livres': len(self._livres)
+        }
 
 
 class BarraProgresso(ComponenteUI):
@@ -726,12 +979,16 @@ class BarraProgresso(ComponenteUI):
         self.valor_alvo = 0.0
         
     def definir_valor(self, valor: float) -> None:
-        """Define o valor alvo da barra"""
-        self.valor_alvo = max(0, min(valor, self.valor_max))
+        """Define o valor alvo da barra, para onde ela desliza"""
+        valor = max(0, min(valor, self.valor_max))
+        if valor == self.valor_alvo:
+            return
+        self.valor_alvo = valor
+        agendador_tweens.animar(self, 'valor_atual', ANIMACAO['DURACAO_PROGRESSO'],
+                                self.valor_atual, valor)
         
-    def atualizar(self, dt: float) -> None:
-        # Animação suave do valor
-        self.valor_atual += (self.valor_alvo - self.valor_atual) * dt * 5
+    def _largura_progresso(self) -> int:
+        return int((self.valor_atual / self.valor_max) * self.rect.width)
         
     def renderizar(self, tela: pygame.Surface) -> None:
         if not self.visivel:
@@ -742,7 +999,7 @@ class BarraProgresso(ComponenteUI):
         
         # Barra de progresso
         if self.valor_atual > 0:
-            largura_progresso = int((self.valor_atual / self.valor_max) * self.rect.width)
+            largura_progresso = self._largura_progresso()
             rect_progresso = pygame.Rect(self.rect.x, self.rect.y, largura_progresso, self.rect.height)
             pygame.draw.rect(tela, CORES['SUCESSO'], rect_progresso, border_radius=VISUAL['RAIO_BORDA'])
             
@@ -762,8 +1019,8 @@ class Texto(ComponenteUI):
         self.cor = cor
         self.centralizado = centralizado
         
-        self.fonte = pygame.font.Font(None, tamanho_fonte)
-        self.superficie = self.fonte.render(texto, True, cor)
+        self.fonte = obter_fonte(tamanho_fonte)
+        self.superficie = renderizar_texto(texto, tamanho_fonte, cor)
         
         if centralizado:
             rect = self.superficie.get_rect(center=(x, y))
@@ -773,8 +1030,12 @@ class Texto(ComponenteUI):
             
     def definir_texto(self, novo_texto: str) -> None:
         """Atualiza o texto"""
+        if novo_texto == self.texto:
+            return
+            
+        self.invalidar()  # Área do texto antigo
         self.texto = novo_texto
-        self.superficie = self.fonte.render(novo_texto, True, self.cor)
+        self.superficie = renderizar_texto(novo_texto, self.tamanho_fonte, self.cor)
         
         if self.centralizado:
             centro_atual = self.rect.center
@@ -782,6 +1043,7 @@ class Texto(ComponenteUI):
         else:
             self.rect.width = self.superficie.get_width()
             self.rect.height = self.superficie.get_height()
+        self.invalidar()
             
     def renderizar(self, tela: pygame.Surface) -> None:
         if not self.visivel:
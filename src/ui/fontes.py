@@ -0,0 +1,124 @@
+"""
+Fontes e textos renderizados compartilhados por todos os componentes de UI
+Cada tamanho de fonte é carregado uma vez; superfícies de texto ficam em um cache LRU
+"""
+import pygame
+from collections import OrderedDict
+from typing import Dict, Tuple
+from ..utils.config import VISUAL
+
+
+class RegistroFontes:
+    """Fontes padrão do pygame, carregadas uma única vez por tamanho no processo"""
+
+    def __init__(self):
+        self._fontes: Dict[int, pygame.font.Font] = {}
+
+    def obter(self, tamanho: int) -> pygame.font.Font:
+        """Retorna a fonte do tamanho pedido, carregando-a no primeiro uso"""
+        fonte = self._fontes.get(tamanho)
+        if fonte is None:
+            fonte = pygame.font.Font(None, tamanho)
+            self._fontes[tamanho] = fonte
+        return fonte
+
+    def limpar(self) -> None:
+        """Descarta as fontes carregadas (necessário após pygame.font.quit)"""
+        self._fontes.clear()
+
+    def __len__(self) -> int:
+        return len(self._fontes)
+
+
+class CacheTexto:
+    """
+    Cache LRU de superfícies de texto por (texto, tamanho, cor).
+
+    O tamanho de cada superfície em bytes (pitch x altura) é somado, e as
+    menos usadas recentemente são descartadas quando o total passa de
+    `limite_bytes`. As superfícies devolvidas são compartilhadas: quem precisar
+    alterá-las (alpha, por exemplo) deve trabalhar sobre uma cópia.
+    """
+
+    def __init__(self, registro: RegistroFontes, limite_bytes: int = VISUAL['CACHE_TEXTO_BYTES']):
+        self.registro = registro
+        self.limite_bytes = limite_bytes
+        self._superficies: "OrderedDict[tuple, Tuple[pygame.Surface, int]]" = OrderedDict()
+
+        # Estatísticas
+        self.bytes_em_uso = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+
+    def renderizar(self, texto: str, tamanho: int, cor: Tuple[int, ...]) -> pygame.Surface:
+        """Retorna a superfície do texto, renderizando-a apenas se não estiver no cache"""
+        chave = (texto, tamanho, tuple(cor))
+        entrada = self._superficies.get(chave)
+        if entrada is not None:
+            self.acertos += 1
+            self._superficies.move_to_end(chave)
+            return entrada[0]
+
+        self.falhas += 1
+        superficie = self.registro.obter(tamanho).render(texto, True, cor)
+        tamanho_bytes = superficie.get_pitch() * superficie.get_height()
+
+        # Superfícies maiores que o limite inteiro não entram no cache
+        if tamanho_bytes <= self.limite_bytes:
+            self._superficies[chave] = (superficie, tamanho_bytes)
+            self.bytes_em_uso += tamanho_bytes
+            while self.bytes_em_uso > self.limite_bytes:
+                _, (_, liberados) = self._superficies.popitem(last=False)
+                self.bytes_em_uso -= liberados
+                self.descartes += 1
+
+        return superficie
+
+    def limpar(self) -> None:
+        """Esvazia o cache (os contadores são mantidos)"""
+        self._superficies.clear()
+        self.bytes_em_uso = 0
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna acertos, falhas e uso de memória do cache"""
+        consultas = self.acertos + self.falhas
+        taxa_acerto = self.acertos / consultas * 100 if consultas > 0 else 0
+
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': round(taxa_acerto, 2),
+            'descartes': self.descartes,
+            'entradas': len(self._superficies),
+            'bytes_em_uso': self.bytes_em_uso,
+            'limite_bytes': self.limite_bytes,
+            'fontes_carregadas': len(self.registro)
+        }
+
+
+# Instâncias globais usadas pelos componentes
+fontes = RegistroFontes()
+cache_texto = CacheTexto(fontes)
+
+
+def obter_fonte(tamanho: int) -> pygame.font.Font:
+    """Atalho para fontes.obter"""
+    return fontes.obter(tamanho)
+
+
+def renderizar_texto(texto: str, tamanho: int, cor: Tuple[int, ...]) -> pygame.Surface:
+    """Atalho para cache_texto.renderizar"""
+    return cache_texto.renderizar(texto, tamanho, cor)
+
+
+def desenhar_texto(tela: pygame.Surface, texto: str, x: int, y: int, tamanho: int,
+                   cor: Tuple[int, ...], centralizado: bool = False) -> pygame.Rect:
+    """Desenha um texto do cache sem criar um componente; retorna a área ocupada"""
+    superficie = cache_texto.renderizar(texto, tamanho, cor)
+    if centralizado:
+        rect = superficie.get_rect(center=(x, y))
+    else:
+        rect = superficie.get_rect(topleft=(x, y))
+    tela.blit(superficie, rect)
+    return rect
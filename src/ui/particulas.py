@@ -0,0 +1,97 @@
+"""
+Sistema de partículas em arrays NumPy, desenhado a partir de um atlas de sprites
+Atualização vetorizada e um único Surface.blits por quadro
+"""
+from itertools import repeat
+
+import numpy as np
+import pygame
+from typing import List, Tuple
+from ..utils.distribuicoes import Semente, criar_gerador
+
+
+class SistemaParticulas:
+    """
+    Partículas circulares que caem e reaparecem no topo, piscando.
+
+    Posições, velocidades, tamanhos e fases ficam em arrays; `atualizar`
+    avança todas de uma vez. Os círculos são pré-desenhados em um atlas com
+    uma linha por tamanho e uma coluna por nível de alpha (o alpha de cada
+    partícula é quantizado em `niveis_alpha` níveis), e `renderizar` monta
+    uma única chamada a Surface.blits com recortes desse atlas.
+    """
+
+    def __init__(self, quantidade: int, largura: int, altura: int,
+                 cor: Tuple[int, int, int], semente: Semente = None,
+                 tamanhos: Tuple[int, int] = (2, 5),
+                 velocidades: Tuple[float, float] = (30.0, 120.0),
+                 niveis_alpha: int = 16):
+        self.largura = largura
+        self.altura = altura
+        self.cor = tuple(cor[:3])
+        self.tamanho_minimo, self.tamanho_maximo = tamanhos
+        self.niveis_alpha = niveis_alpha
+
+        rng = criar_gerador(semente)
+        self.x = rng.integers(0, largura + 1, size=quantidade).astype(np.float64)
+        self.y = rng.integers(0, altura + 1, size=quantidade).astype(np.float64)
+        self.y_anterior = self.y.copy()  # Do passo anterior, para interpolar
+        self.velocidade = rng.uniform(*velocidades, size=quantidade)  # pixels por segundo
+        self.tamanho = rng.integers(self.tamanho_minimo, self.tamanho_maximo + 1, size=quantidade)
+
+        # A fase do pisca-pisca depende só de x, que não muda
+        self.fase = self.x * 0.01
+        self._x_inteiro = self.x.astype(np.intp).tolist()
+
+        self._criar_atlas()
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def _criar_atlas(self) -> None:
+        """Pré-desenha um círculo por (tamanho, nível de alpha)"""
+        celula = 2 * self.tamanho_maximo
+        linhas = self.tamanho_maximo - self.tamanho_minimo + 1
+        self.atlas = pygame.Surface((celula * self.niveis_alpha, celula * linhas), pygame.SRCALPHA)
+
+        self.recortes: List[pygame.Rect] = []
+        for linha in range(linhas):
+            raio = self.tamanho_minimo + linha
+            for nivel in range(self.niveis_alpha):
+                alpha = round(255 * nivel / (self.niveis_alpha - 1))
+                recorte = pygame.Rect(nivel * celula, linha * celula, 2 * raio, 2 * raio)
+                pygame.draw.circle(self.atlas, (*self.cor, alpha), recorte.center, raio)
+                self.recortes.append(recorte)
+
+        # No formato da tela, os blits de sprites com alpha são mais rápidos
+        if pygame.display.get_surface() is not None:
+            self.atlas = self.atlas.convert_alpha()
+
+    def atualizar(self, dt: float) -> None:
+        """Avança todas as partículas; as que saem por baixo voltam ao topo"""
+        np.copyto(self.y_anterior, self.y)
+        self.y += self.velocidade * dt
+
+        saiu = self.y > self.altura
+        if saiu.any():
+            # Reaparecem no topo sem interpolar a volta
+            self.y[saiu] = -self.tamanho[saiu]
+            self.y_anterior[saiu] = self.y[saiu]
+
+    def renderizar(self, tela: pygame.Surface, tempo: float, alfa: float = 1.0) -> None:
+        """
+        Desenha as partículas com um único blits.
+
+        Args:
+            tempo: tempo de animação (controla o brilho)
+            alfa: fração entre o passo anterior e o atual, para interpolar a posição
+        """
+        y = self.y_anterior + (self.y - self.y_anterior) * alfa
+        alpha = 128 + 127 * np.sin(tempo * 2 + self.fase)
+        nivel = (alpha * (self.niveis_alpha - 1) / 255 + 0.5).astype(np.intp)
+        indices = (self.tamanho - self.tamanho_minimo) * self.niveis_alpha + nivel
+
+        # A sequência (atlas, posição, recorte) é montada por iteradores em C, sem loop Python
+        posicoes = zip(self._x_inteiro, y.astype(np.intp).tolist())
+        recortes = map(self.recortes.__getitem__, indices.tolist())
+        tela.blits(zip(repeat(self.atlas), posicoes, recortes), doreturn=False)
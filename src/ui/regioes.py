@@ -0,0 +1,103 @@
+"""
+Regiões sujas: áreas da tela que mudaram desde o último quadro
+Os componentes invalidam a área que ocupam; o GameManager redesenha só essas regiões
+"""
+import pygame
+from typing import List, Optional
+from ..utils.config import LARGURA, ALTURA, RENDERIZACAO
+
+
+class RegioesSujas:
+    """
+    Acumula os retângulos invalidados durante um quadro.
+
+    Fora do modo de regiões sujas (`ativo` falso) as invalidações são
+    ignoradas, então os componentes podem chamá-las sem custo. Em `coletar`,
+    retângulos que se tocam são unidos; se sobrarem mais que `max_regioes`,
+    vira um só retângulo envolvente, e se a área passar de `fracao_tela_cheia`
+    da tela, o quadro é redesenhado inteiro.
+    """
+
+    def __init__(self, largura: int = LARGURA, altura: int = ALTURA,
+                 max_regioes: int = RENDERIZACAO['MAX_REGIOES'],
+                 fracao_tela_cheia: float = RENDERIZACAO['FRACAO_TELA_CHEIA']):
+        self.tela = pygame.Rect(0, 0, largura, altura)
+        self.max_regioes = max_regioes
+        self.fracao_tela_cheia = fracao_tela_cheia
+        self.ativo = False
+
+        self._regioes: List[pygame.Rect] = []
+        self._tela_inteira = True
+
+        # Estatísticas
+        self.quadros = 0
+        self.quadros_tela_inteira = 0
+        self.quadros_vazios = 0
+        self.pixels_redesenhados = 0
+
+    def invalidar(self, rect: Optional[pygame.Rect] = None) -> None:
+        """Marca uma área para ser redesenhada (None = tela inteira)"""
+        if not self.ativo or self._tela_inteira:
+            return
+        if rect is None:
+            self._tela_inteira = True
+            return
+
+        rect = self.tela.clip(rect)
+        if rect.width > 0 and rect.height > 0:
+            self._regioes.append(rect)
+
+    def invalidar_tudo(self) -> None:
+        """Força o redesenho da tela inteira no próximo quadro"""
+        self._tela_inteira = True
+
+    def coletar(self) -> List[pygame.Rect]:
+        """Retorna as regiões do quadro (já unidas) e recomeça a acumulação"""
+        regioes = [] if self._tela_inteira else self._unir(self._regioes)
+        if len(regioes) > self.max_regioes:
+            regioes = [regioes[0].unionall(regioes[1:])]
+
+        area = sum(regiao.width * regiao.height for regiao in regioes)
+        if self._tela_inteira or area > self.fracao_tela_cheia * self.tela.width * self.tela.height:
+            regioes = [self.tela.copy()]
+            area = self.tela.width * self.tela.height
+            self.quadros_tela_inteira += 1
+        elif not regioes:
+            self.quadros_vazios += 1
+
+        self.quadros += 1
+        self.pixels_redesenhados += area
+        self._regioes = []
+        self._tela_inteira = False
+        return regioes
+
+    @staticmethod
+    def _unir(retangulos: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Une retângulos que se sobrepõem ou se tocam até não restar nenhum par"""
+        regioes: List[pygame.Rect] = []
+        for rect in retangulos:
+            rect = rect.copy()
+            # Uma união pode passar a tocar regiões já verificadas: repetir até estabilizar
+            indice = rect.inflate(2, 2).collidelist(regioes)
+            while indice != -1:
+                rect.union_ip(regioes.pop(indice))
+                indice = rect.inflate(2, 2).collidelist(regioes)
+            regioes.append(rect)
+        return regioes
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna quantos quadros foram parciais e a fração média da tela redesenhada"""
+        pixels_tela = self.tela.width * self.tela.height
+        fracao_media = self.pixels_redesenhados / (self.quadros * pixels_tela) * 100 if self.quadros > 0 else 0
+
+        return {
+            'ativo': self.ativo,
+            'quadros': self.quadros,
+            'quadros_tela_inteira': self.quadros_tela_inteira,
+            'quadros_vazios': self.quadros_vazios,
+            'fracao_media_redesenhada': round(fracao_media, 2)
+        }
+
+
+# Instância global usada pelos componentes e pelo GameManager
+regioes_sujas = RegioesSujas()
@@ -0,0 +1,121 @@
+"""
+Cache de sprites pré-desenhados: formas compostas por várias chamadas de
+desenho viram uma única superfície, copiada com um blit a cada quadro
+"""
+import pygame
+from collections import OrderedDict
+from typing import Callable, Hashable, Tuple
+from ..utils.config import VISUAL
+
+# Sprite e a posição do seu canto em relação ao ponto de ancoragem (o centro, nos blocos)
+Sprite = Tuple[pygame.Surface, Tuple[int, int]]
+
+# Cor reservada para os pixels transparentes dos sprites sem alpha (nenhuma cor do tema a usa)
+COLORKEY = (255, 0, 255)
+
+
+class CacheSprites:
+    """
+    Cache LRU de sprites por chave, limitado em bytes como o CacheTexto.
+
+    Quem consulta fornece a função que desenha o sprite na primeira vez;
+    a chave precisa conter tudo de que o desenho depende. As superfícies
+    são compartilhadas e não devem ser alteradas por quem as recebe.
+    """
+
+    def __init__(self, limite_bytes: int = VISUAL['CACHE_SPRITES_BYTES']):
+        self.limite_bytes = limite_bytes
+        self._sprites: "OrderedDict[Hashable, Tuple[Sprite, int]]" = OrderedDict()
+
+        # Estatísticas
+        self.bytes_em_uso = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+
+    def obter(self, chave: Hashable, desenhar: Callable[[], Sprite]) -> Sprite:
+        """Retorna o sprite da chave, desenhando-o apenas se não estiver no cache"""
+        entrada = self._sprites.get(chave)
+        if entrada is not None:
+            self.acertos += 1
+            self._sprites.move_to_end(chave)
+            return entrada[0]
+
+        self.falhas += 1
+        superficie, deslocamento = desenhar()
+        sprite = (self._otimizar(superficie), deslocamento)
+        tamanho_bytes = superficie.get_pitch() * superficie.get_height()
+
+        if tamanho_bytes <= self.limite_bytes:
+            self._sprites[chave] = (sprite, tamanho_bytes)
+            self.bytes_em_uso += tamanho_bytes
+            while self.bytes_em_uso > self.limite_bytes:
+                _, (_, liberados) = self._sprites.popitem(last=False)
+                self.bytes_em_uso -= liberados
+                self.descartes += 1
+
+        return sprite
+
+    @staticmethod
+    def _otimizar(superficie: pygame.Surface) -> pygame.Surface:
+        """
+        Converte o sprite para o formato de blit mais rápido.
+
+        Sprites só com pixels opacos ou totalmente transparentes (sem bordas
+        suavizadas) viram superfícies sem alpha com colorkey RLE, cuja cópia
+        pula os pixels transparentes em vez de misturar cada pixel; os demais
+        mantêm o alpha por pixel.
+        """
+        if pygame.display.get_surface() is None:
+            return superficie
+
+        if (pygame.mask.from_surface(superficie, 0).count()
+                == pygame.mask.from_surface(superficie, 254).count()):
+            opaca = pygame.Surface(superficie.get_size())
+            opaca.fill(COLORKEY)
+            opaca.blit(superficie, (0, 0))
+            opaca.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            return opaca.convert()
+        return superficie.convert_alpha()
+
+    def limpar(self) -> None:
+        """Esvazia o cache (os contadores são mantidos)"""
+        self._sprites.clear()
+        self.bytes_em_uso = 0
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna acertos, falhas e uso de memória do cache"""
+        consultas = self.acertos + self.falhas
+        taxa_acerto = self.acertos / consultas * 100 if consultas > 0 else 0
+
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': round(taxa_acerto, 2),
+            'descartes': self.descartes,
+            'entradas': len(self._sprites),
+            'bytes_em_uso': self.bytes_em_uso,
+            'limite_bytes': self.limite_bytes
+        }
+
+
+def redimensionar(superficie: pygame.Surface, tamanho: Tuple[int, int]) -> pygame.Surface:
+    """
+    Redimensiona um sprite do cache para quadros intermediários de animação.
+
+    Sprites com alpha usam smoothscale. Os com colorkey usam scale: a média
+    com os vizinhos tingiria as bordas com a cor reservada. Eles são
+    copiados sem RLE antes, porque escalar uma superfície RLE a decodifica
+    (e recodifica) a cada chamada.
+    """
+    colorkey = superficie.get_colorkey()
+    if colorkey is None:
+        return pygame.transform.smoothscale(superficie, tamanho)
+
+    fonte = superficie.copy()
+    fonte.set_colorkey(colorkey)
+    return pygame.transform.scale(fonte, tamanho)
+
+
+# Instância global usada pelos componentes
+cache_sprites = CacheSprites()
@@ -0,0 +1,172 @@
+"""
+Agendador central de tweens: só as interpolações ativas ficam registradas,
+em registros compactos, e todas avançam em uma única passada por passo
+"""
+from typing import Callable, Dict, Hashable, List, Optional
+from ..utils.config import ANIMACAO
+
+FUNCOES_EASING: Dict[str, Callable[[float], float]] = {
+    'linear': lambda t: t,
+    'ease_out_quad': lambda t: 1 - (1 - t) ** 2,
+    'ease_out_cubic': lambda t: 1 - (1 - t) ** 3,
+    'ease_in_out_cubic': lambda t: 4 * t ** 3 if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2,
+}
+
+
+def criar_tabela_easing(nome: str = ANIMACAO['EASING'],
+                        resolucao: int = ANIMACAO['RESOLUCAO_EASING']) -> List[float]:
+    """Amostra a função de easing em `resolucao` pontos de 0 a 1 (inclusive)"""
+    funcao = FUNCOES_EASING[nome]
+    return [funcao(indice / (resolucao - 1)) for indice in range(resolucao)]
+
+
+class Tween:
+    """Interpolação de um atributo de um objeto; `tempo` e `duracao` em milissegundos"""
+
+    __slots__ = ('alvo', 'atributo', 'inicio', 'delta', 'duracao', 'tempo', 'inteiro', 'callback')
+
+    def __init__(self, alvo, atributo: Optional[str], inicio: float, fim: float,
+                 duracao: float, inteiro: bool, callback: Optional[Callable]):
+        self.alvo = alvo
+        self.atributo = atributo
+        self.inicio = inicio
+        self.delta = fim - inicio
+        self.duracao = max(duracao, 1e-6)
+        self.tempo = 0.0
+        self.inteiro = inteiro
+        self.callback = callback
+
+
+class AgendadorTweens:
+    """
+    Conjunto dos tweens ativos, avançado uma vez por passo de lógica.
+
+    Cada (alvo, atributo) tem no máximo um tween: iniciar outro substitui o
+    anterior, partindo do valor atual. Tweens concluídos saem do conjunto
+    antes de seus callbacks serem chamados, então um callback pode iniciar
+    uma nova animação no mesmo atributo. O easing vem de uma tabela
+    pré-calculada. O alvo é invalidado (se tiver `invalidar`) antes e
+    depois de cada passo, para o modo de regiões sujas.
+    """
+
+    def __init__(self, tabela_easing: Optional[List[float]] = None):
+        self.tabela = tabela_easing if tabela_easing is not None else criar_tabela_easing()
+        self._escala_tabela = len(self.tabela) - 1
+        self._ativos: Dict[tuple, Tween] = {}
+        self._por_alvo: Dict[Hashable, int] = {}  # Quantos tweens ativos cada alvo tem
+
+        # Estatísticas
+        self.iniciados = 0
+        self.concluidos = 0
+        self.passos = 0
+
+    def animar(self, alvo, atributo: Optional[str], duracao: float, inicio: float, fim: float,
+               callback: Optional[Callable] = None, inteiro: bool = False) -> Tween:
+        """
+        Inicia (ou substitui) a interpolação de `alvo.atributo` de `inicio` a `fim`.
+
+        Args:
+            duracao: em milissegundos
+            atributo: None para só aguardar a duração e chamar o callback
+            inteiro: grava o valor truncado para int (ex.: alpha)
+        """
+        chave = (alvo, atributo)
+        if chave not in self._ativos:
+            self._por_alvo[alvo] = self._por_alvo.get(alvo, 0) + 1
+        tween = Tween(alvo, atributo, inicio, fim, duracao, inteiro, callback)
+        self._ativos[chave] = tween
+        self.iniciados += 1
+
+        self._aplicar(tween, inicio)
+        return tween
+
+    def cancelar(self, alvo, atributo: Optional[str] = None) -> None:
+        """Interrompe os tweens do alvo (ou só o do atributo) sem chamar callbacks"""
+        chaves = [(alvo, atributo)] if atributo is not None else [
+            chave for chave in self._ativos if chave[0] is alvo]
+        for chave in chaves:
+            if self._ativos.pop(chave, None) is not None:
+                self._descontar(alvo)
+
+    def esta_animando(self, alvo=None) -> bool:
+        """Se há tweens ativos (do alvo, ou de qualquer objeto)"""
+        if alvo is None:
+            return bool(self._ativos)
+        return alvo in self._por_alvo
+
+    def avancar(self, dt: float) -> None:
+        """Avança todos os tweens ativos em `dt` segundos"""
+        if not self._ativos:
+            return
+
+        decorrido = dt * 1000
+        tabela = self.tabela
+        escala_tabela = self._escala_tabela
+        concluidos = []
+
+        for chave, tween in self._ativos.items():
+            tween.tempo += decorrido
+            progresso = tween.tempo / tween.duracao
+            if progresso >= 1.0:
+                concluidos.append(chave)
+                suave = 1.0
+            else:
+                suave = tabela[int(progresso * escala_tabela)]
+            self._aplicar(tween, tween.inicio + tween.delta * suave)
+
+        self.passos += 1
+        if not concluidos:
+            return
+
+        callbacks = []
+        for chave in concluidos:
+            tween = self._ativos.pop(chave)
+            self._descontar(tween.alvo)
+            self.concluidos += 1
+            if tween.callback is not None:
+                callbacks.append(tween.callback)
+        for callback in callbacks:
+            callback()
+
+    def _aplicar(self, tween: Tween, valor: float) -> None:
+        if tween.atributo is None:
+            return
+        if tween.inteiro:
+            valor = int(valor)
+
+        invalidar = getattr(tween.alvo, 'invalidar', None)
+        if invalidar is not None:
+            invalidar()  # Área antes do passo
+        setattr(tween.alvo, tween.atributo, valor)
+        if invalidar is not None:
+            invalidar()  # Área depois do passo
+
+    def _descontar(self, alvo) -> None:
+        restantes = self._por_alvo[alvo] - 1
+        if restantes:
+            self._por_alvo[alvo] = restantes
+        else:
+            del self._por_alvo[alvo]
+
+    def limpar(self) -> None:
+        """Descarta todos os tweens ativos (os contadores são mantidos)"""
+        self._ativos.clear()
+        self._por_alvo.clear()
+
+    def __len__(self) -> int:
+        return len(self._ativos)
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna tweens ativos, iniciados, concluídos e passos executados"""
+        return {
+            'ativos': len(self._ativos),
+            'alvos': len(self._por_alvo),
+            'iniciados': self.iniciados,
+            'concluidos': self.concluidos,
+            'passos': self.passos,
+            'resolucao_easing': len(self.tabela)
+        }
+
+
+# Instância global avançada pelo GameManager a cada passo de lógica
+agendador_tweens = AgendadorTweens()
@@ -51,6 +51,33 @@ VISUAL = {
     'SOMBRA_OFFSET': 3,
     'MARGEM_LATERAL': 50,
     'MARGEM_VERTICAL': 100,
+    'CACHE_TEXTO_BYTES': 4 * 1024 * 1024,  # Limite do cache de superfícies de texto
+    'CACHE_SPRITES_BYTES': 4 * 1024 * 1024,  # Limite do cache de sprites pré-desenhados (blocos)
+    'PASSOS_ESCALA_BLOCO': 40,  # Escalas de bloco desenhadas por unidade (1/40 = 2 px em 80 px)
+    'PARTICULAS_MENU': 50,
+    'SUPERFICIES_LIVRES_LISTA': 8,  # Superfícies de linha guardadas para reuso pela ListaScrollavel
+}
+
+# Renderização por regiões sujas (opcional): só as áreas alteradas são redesenhadas
+RENDERIZACAO = {
+    'REGIOES_SUJAS': False,       # Alternável em jogo com F8
+    'MOSTRAR_REGIOES': False,     # Contorna as regiões redesenhadas (F9)
+    'MAX_REGIOES': 16,            # Acima disso, redesenha o retângulo que envolve todas
+    'FRACAO_TELA_CHEIA': 0.6,     # Acima dessa fração da tela, redesenha a tela inteira
+    'QUADROS_DEPURACAO': 20,      # Quadros em que o contorno de uma região fica visível
+}
+
+# Agendador de quadros: sem nada animando, o loop dorme até o próximo evento
+AGENDADOR = {
+    'ESPERAR_OCIOSO': True,
+    'TIMEOUT_OCIOSO_MS': 500,     # Acorda periodicamente mesmo sem eventos
+}
+
+# Simulação em passo fixo, independente da taxa de quadros da renderização
+SIMULACAO = {
+    'FREQUENCIA_HZ': 60,          # Passos de lógica por segundo
+    'MAX_PASSOS_POR_QUADRO': 5,   # Além disso, o atraso é descartado
+    'FPS_MAXIMO_RENDER': FPS,     # Limite de quadros renderizados (0 = sem limite)
 }
 
 # Configurações de áudio
@@ -103,27 +130,80 @@ ESTADOS = {
 }
 
 # Algoritmos disponíveis
+# 'motor' aponta para a classe do motor ("modulo:Classe" dentro de src/algorithms),
+# importada apenas quando o algoritmo é usado pela primeira vez
 ALGORITMOS = {
     'MERGE_SORT': {
         'nome': 'Merge Sort',
         'descricao': 'Algoritmo de ordenação por divisão e conquista',
         'dificuldade': 'Intermediário',
         'conceitos': ['Divisão e Conquista', 'Recursão', 'Fusão de Arrays'],
-        'cor_tema': CORES['PRINCIPAL']
+        'cor_tema': CORES['PRINCIPAL'],
+        'motor': 'merge_sort:MergeSortEducativo'
     },
     'QUICK_SORT': {
         'nome': 'Quick Sort',
         'descricao': 'Algoritmo de ordenação por particionamento',
         'dificuldade': 'Avançado',
         'conceitos': ['Divisão e Conquista', 'Particionamento', 'Pivot'],
-        'cor_tema': CORES['SECUNDARIA']
+        'cor_tema': CORES['SECUNDARIA'],
+        'motor': 'quick_sort:QuickSortEducativo'
     },
     'BINARY_SEARCH': {
         'nome': 'Binary Search',
         'descricao': 'Algoritmo de busca por divisão e conquista',
         'dificuldade': 'Básico',
         'conceitos': ['Divisão e Conquista', 'Busca', 'Arrays Ordenados'],
-        'cor_tema': CORES['SUCESSO']
+        'cor_tema': CORES['SUCESSO'],
+        'motor': 'binary_search:BinarySearchEducativo'
+    },
+    'QUICK_SELECT': {
+        'nome': 'Quickselect',
+        'descricao': 'Seleção do k-ésimo menor elemento por particionamento',
+        'dificuldade': 'Avançado',
+        'conceitos': ['Divisão e Conquista', 'Particionamento', 'Seleção'],
+        'cor_tema': CORES['AVISO'],
+        'motor': 'quick_select:QuickSelectEducativo'
+    },
+    'BUSCA_PARAMETRICA': {
+        'nome': 'Busca Paramétrica',
+        'descricao': 'Busca binária sobre a resposta de um predicado monótono',
+        'dificuldade': 'Intermediário',
+        'conceitos': ['Busca Binária', 'Predicado Monótono', 'Memorização'],
+        'cor_tema': CORES['SUCESSO'],
+        'motor': 'busca_parametrica:BuscaParametrica'
+    },
+    'PAR_MAIS_PROXIMO': {
+        'nome': 'Par Mais Próximo',
+        'descricao': 'Par de pontos mais próximo no plano',
+        'dificuldade': 'Avançado',
+        'conceitos': ['Divisão e Conquista', 'Geometria', 'Faixa Central'],
+        'cor_tema': CORES['PRINCIPAL'],
+        'motor': 'par_mais_proximo:ParMaisProximoEducativo'
+    },
+    'KARATSUBA': {
+        'nome': 'Karatsuba',
+        'descricao': 'Multiplicação de inteiros grandes com três produtos',
+        'dificuldade': 'Avançado',
+        'conceitos': ['Divisão e Conquista', 'Aritmética', 'Limiar de Recursão'],
+        'cor_tema': CORES['DESTAQUE'],
+        'motor': 'karatsuba:KaratsubaEducativo'
+    },
+    'STRASSEN': {
+        'nome': 'Strassen',
+        'descricao': 'Multiplicação de matrizes com sete produtos de blocos',
+        'dificuldade': 'Avançado',
+        'conceitos': ['Divisão e Conquista', 'Matrizes', 'Limiar de Recursão'],
+        'cor_tema': CORES['DESTAQUE'],
+        'motor': 'strassen:StrassenEducativo'
+    },
+    'SUBARRAY_MAXIMO': {
+        'nome': 'Subarray Máximo',
+        'descricao': 'Subarray de soma máxima por divisão e conquista ou Kadane',
+        'dificuldade': 'Intermediário',
+        'conceitos': ['Divisão e Conquista', 'Programação Dinâmica', 'Somas de Prefixos'],
+        'cor_tema': CORES['SECUNDARIA'],
+        'motor': 'subarray_maximo:SubarrayMaximoEducativo'
     }
 }
 
@@ -134,7 +214,10 @@ ANIMACAO = {
     'DURACAO_BOUNCE': 600,
     'DURACAO_COMPARACAO': 800,
     'DURACAO_TROCA': 1000,
-    'EASING': 'ease_out_cubic'
+    'DURACAO_ESCALA_BLOCO': 300,   # Seleção e entrada dos blocos
+    'DURACAO_PROGRESSO': 600,      # Barra de progresso até o novo valor
+    'EASING': 'ease_out_cubic',
+    'RESOLUCAO_EASING': 1024       # Pontos da tabela de easing pré-calculada
 }
 
 # Configurações de tutorial
@@ -0,0 +1,156 @@
+"""
+Geradores de listas de entrada para o jogo, os benchmarks e os testes sem interface
+Distribuições vetorizadas com NumPy, reproduzíveis a partir de uma semente
+"""
+
+from collections import deque
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+
+# Semente inteira, gerador já criado (que é consumido) ou None (entropia do SO)
+Semente = Union[int, np.random.Generator, None]
+
+
+def criar_gerador(semente: Semente = None) -> np.random.Generator:
+    """Retorna o gerador da semente; um Generator recebido é usado como está"""
+    if isinstance(semente, np.random.Generator):
+        return semente
+    return np.random.default_rng(semente)
+
+
+def gerar_aleatorio(n: int, semente: Semente = None, minimo: int = 0,
+                    maximo: Optional[int] = None, distintos: bool = False) -> np.ndarray:
+    """
+    Valores uniformes em [minimo, maximo); por padrão maximo = minimo + 4n.
+
+    Com `distintos`, não há repetições (o intervalo precisa ter ao menos n valores).
+    """
+    rng = criar_gerador(semente)
+    if maximo is None:
+        maximo = minimo + 4 * max(n, 1)
+
+    if distintos:
+        if maximo - minimo < n:
+            raise ValueError(f"Intervalo [{minimo}, {maximo}) tem menos de {n} valores distintos")
+        return rng.choice(maximo - minimo, size=n, replace=False).astype(np.int64) + minimo
+    return rng.integers(minimo, maximo, size=n, dtype=np.int64)
+
+
+def gerar_ordenado(n: int, semente: Semente = None, minimo: int = 0) -> np.ndarray:
+    """minimo, minimo + 1, ..., minimo + n - 1"""
+    return np.arange(minimo, minimo + n, dtype=np.int64)
+
+
+def gerar_reverso(n: int, semente: Semente = None, minimo: int = 0) -> np.ndarray:
+    """minimo + n - 1, ..., minimo + 1, minimo"""
+    return np.arange(minimo + n - 1, minimo - 1, -1, dtype=np.int64)
+
+
+def gerar_poucos_unicos(n: int, semente: Semente = None, unicos: int = 8,
+                        minimo: int = 0) -> np.ndarray:
+    """Valores uniformes entre apenas `unicos` valores distintos"""
+    return criar_gerador(semente).integers(minimo, minimo + unicos, size=n, dtype=np.int64)
+
+
+def gerar_zipf(n: int, semente: Semente = None, expoente: float = 1.5,
+               maximo: Optional[int] = None) -> np.ndarray:
+    """
+    Distribuição de Zipf (valores >= 1): poucos valores pequenos muito
+    frequentes e uma cauda longa de valores raros, cortada em `maximo`
+    (por padrão 4n).
+    """
+    if maximo is None:
+        maximo = 4 * max(n, 1)
+    valores = criar_gerador(semente).zipf(expoente, size=n)
+    return np.minimum(valores, maximo).astype(np.int64)
+
+
+def gerar_dente_de_serra(n: int, semente: Semente = None,
+                         dentes: Optional[int] = None) -> np.ndarray:
+    """Sequências crescentes repetidas: 0 1 2 ... p-1 0 1 2 ... (√n dentes por padrão)"""
+    if dentes is None:
+        dentes = max(1, int(np.sqrt(n)))
+    periodo = max(1, -(-n // dentes))
+    return np.arange(n, dtype=np.int64) % periodo
+
+
+def gerar_tubos_orgao(n: int, semente: Semente = None) -> np.ndarray:
+    """Sobe até o meio e desce de volta: 0 1 2 ... k ... 2 1 0"""
+    subida = np.arange((n + 1) // 2, dtype=np.int64)
+    return np.concatenate([subida, subida[:n // 2][::-1]])
+
+
+def gerar_quase_ordenado(n: int, semente: Semente = None,
+                         fracao: float = 0.01) -> np.ndarray:
+    """Ordenado com ~`fracao` das posições trocadas aos pares (ao menos um par)"""
+    dados = np.arange(n, dtype=np.int64)
+    if n < 2:
+        return dados
+
+    pares = min(n // 2, max(1, int(n * fracao / 2)))
+    posicoes = criar_gerador(semente).choice(n, size=2 * pares, replace=False)
+    esquerda, direita = posicoes[:pares], posicoes[pares:]
+    dados[esquerda], dados[direita] = dados[direita], dados[esquerda]
+    return dados
+
+
+def gerar_matador_quicksort(n: int, semente: Semente = None) -> np.ndarray:
+    """
+    Permutação de 0..n-1 que leva o Quick Sort com pivot no último elemento
+    (partição de Lomuto, como no QuickSortEducativo) a Θ(n²) comparações.
+
+    Simula a partição sobre as posições: em cada nível o pivot é sorteado para
+    ser o menor ou o maior valor restante, de modo que uma das partes fica
+    vazia. Sendo pivot o maior, nada se move; sendo o menor, só o primeiro
+    elemento troca de lugar com ele. Ao contrário da entrada ordenada, o
+    resultado não tem cara de ordenado. A simulação é sequencial por natureza
+    (O(n) com uma deque); apenas o sorteio é vetorizado.
+    """
+    escolhas_maximo = criar_gerador(semente).random(n) < 0.5
+    valores = np.empty(n, dtype=np.int64)
+    posicoes = deque(range(n))
+    menor, maior = 0, n - 1
+
+    for pivot_maximo in escolhas_maximo.tolist():
+        posicao_pivot = posicoes.pop()
+        if pivot_maximo:
+            valores[posicao_pivot] = maior
+            maior -= 1
+        else:
+            valores[posicao_pivot] = menor
+            menor += 1
+            # O primeiro elemento do intervalo vai para o lugar do pivot
+            if posicoes:
+                posicoes.append(posicoes.popleft())
+    return valores
+
+
+DISTRIBUICOES: Dict[str, Callable[..., np.ndarray]] = {
+    'aleatorio': gerar_aleatorio,
+    'ordenado': gerar_ordenado,
+    'reverso': gerar_reverso,
+    'poucos_unicos': gerar_poucos_unicos,
+    'zipf': gerar_zipf,
+    'dente_de_serra': gerar_dente_de_serra,
+    'tubos_orgao': gerar_tubos_orgao,
+    'quase_ordenado': gerar_quase_ordenado,
+    'matador_quicksort': gerar_matador_quicksort,
+}
+
+
+def gerar(distribuicao: str, n: int, semente: Semente = None, **parametros) -> np.ndarray:
+    """
+    Gera n valores inteiros (int64) da distribuição pedida.
+
+    Args:
+        distribuicao: chave de DISTRIBUICOES
+        n: quantidade de valores
+        semente: inteiro para reprodutibilidade, Generator ou None
+        **parametros: parâmetros específicos da distribuição (minimo, unicos, ...)
+    """
+    gerador = DISTRIBUICOES.get(distribuicao)
+    if gerador is None:
+        raise ValueError(f"Distribuição desconhecida: {distribuicao}")
+    return gerador(n, semente, **parametros)